@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark del descubrimiento de programas (DiscoveryEngine) sobre un árbol de carpetas sintético.
+
+Crea --dirs carpetas anidadas (hasta --depth niveles) con --files ficheros cada una, de los que
+la mitad son ejecutables, y mide:
+  - recorrido en frío:  sin índice; se listan todas las carpetas.
+  - con índice:         arranque siguiente sin cambios; solo un stat por carpeta, ninguna se relista.
+  - con N cambiadas:    tras crear un programa en --touch carpetas; solo se relistan esas.
+  - ventana:            MainWindow con el descubrimiento activo: primer frame, primer lote en la
+                        rejilla y coste máximo/p95 del merge de un lote en el hilo GUI.
+La caché de páginas del SO queda caliente tras crear el árbol: los tiempos son de CPU + syscalls,
+no de disco (en un recurso de red el stat por carpeta pesa más y el índice ahorra más).
+
+Uso:
+    python benchmarks/bench_discovery.py [--dirs 2000] [--files 10] [--depth 4] [--touch 20]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["PROGAIN_MONITOR"] = "0"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6 import QtCore, QtWidgets  # noqa: E402
+import lanzador_programas_PyQT6 as launcher  # noqa: E402
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def build_tree(root: str, dirs: int, files: int, depth: int, seed: int = 1):
+    """Árbol con `dirs` carpetas: cada una cuelga de una anterior de menos de `depth` niveles."""
+    rng = random.Random(seed)
+    paths = [root]
+    levels = {root: 0}
+    for i in range(dirs):
+        parent = rng.choice([p for p in paths[-64:] if levels[p] < depth] or [root])
+        d = os.path.join(parent, f"carpeta_{i}")
+        os.mkdir(d)
+        levels[d] = levels[parent] + 1
+        paths.append(d)
+        for j in range(files):
+            p = os.path.join(d, f"herramienta_{i}_{j}" + (".exe" if j % 2 == 0 else ".txt"))
+            with open(p, "w") as f:
+                f.write("x")
+    return paths[1:]
+
+
+def wait_for(signal, received: list):
+    """Bucle de eventos bloqueado hasta que llegue `signal` (sin sondear: el hilo GUI no compite por el GIL)."""
+    if received:
+        return
+    loop = QtCore.QEventLoop()
+    signal.connect(loop.quit)
+    loop.exec()
+    signal.disconnect(loop.quit)
+
+
+def run_engine(app, root: str, index_path: str):
+    """Una pasada completa de DiscoveryEngine: (stats, ms hasta el primer lote, ms totales)."""
+    engine = launcher.DiscoveryEngine([root], index_path=index_path)
+    first, done = [], []
+    t0 = time.perf_counter()
+    engine.entriesChanged.connect(lambda a, r: first or first.append(time.perf_counter()))
+    engine.scanFinished.connect(done.append)
+    engine.start()
+    wait_for(engine.scanFinished, done)
+    total = (time.perf_counter() - t0) * 1000
+    engine.stop()
+    return done[0], ((first[0] - t0) * 1000 if first else float("nan")), total
+
+
+class TimedWindow(launcher.MainWindow):
+    """MainWindow que anota su primer frame y mide cada merge de un lote del descubrimiento."""
+
+    def __init__(self, *args, **kwargs):
+        self.merges = []
+        self.first_batch = None
+        self.first_frame = None
+        super().__init__(*args, **kwargs)
+
+    def paintEvent(self, ev):
+        super().paintEvent(ev)
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter()
+            # STARTUP solo cierra su traza (y arranca el descubrimiento) en la primera ventana del proceso
+            QtCore.QTimer.singleShot(0, self.start_discovery)
+
+    def _on_discovered(self, added, removed):
+        t = time.perf_counter()
+        super()._on_discovered(added, removed)
+        if self.first_batch is None:
+            self.first_batch = t
+        self.merges.append((time.perf_counter() - t) * 1000)
+
+
+def run_window(app, root: str, index_path: str):
+    os.environ["PROGAIN_DISCOVERY"] = root
+    t0 = time.perf_counter()
+    win = TimedWindow(entries=launcher.MainWindow.default_entries())
+    win.discovery.index.path = index_path
+    done = []
+    win.discovery.scanFinished.connect(done.append)
+    win.show()
+    wait_for(win.discovery.scanFinished, done)
+    app.processEvents()
+    win.discovery.stop()
+    result = {
+        "first_frame_ms": (win.first_frame - t0) * 1000,
+        "first_batch_ms": (win.first_batch - t0) * 1000 if win.first_batch else float("nan"),
+        "batches": len(win.merges),
+        "merge_p95": percentile(win.merges, 0.95) if win.merges else 0.0,
+        "merge_max": max(win.merges, default=0.0),
+        "entries": len(win.entries),
+    }
+    win.close()
+    win.deleteLater()
+    app.processEvents()
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--dirs", type=int, default=2000)
+    ap.add_argument("--files", type=int, default=10, help="ficheros por carpeta (la mitad .exe)")
+    ap.add_argument("--depth", type=int, default=4)
+    ap.add_argument("--touch", type=int, default=20, help="carpetas que cambian entre pasadas")
+    args = ap.parse_args()
+    os.environ["PROGAIN_DISCOVERY_EXT"] = ".exe"  # el mismo criterio en cualquier plataforma
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    work = tempfile.mkdtemp(prefix="progain_discovery_")
+    try:
+        launcher.LOG_FILE = os.path.join(work, launcher.LOG_FILE)  # logs del launcher fuera del repo
+        root = os.path.join(work, "herramientas")
+        os.mkdir(root)
+        t = time.perf_counter()
+        dirs = build_tree(root, args.dirs, args.files, args.depth)
+        print(f"árbol: {args.dirs} carpetas, {args.dirs * args.files} ficheros "
+              f"({(time.perf_counter() - t):.1f} s en crearlo)")
+        index_path = os.path.join(work, "index.json")
+
+        print(f"{'pasada':<18} {'carpetas':>9} {'relistadas':>11} {'programas':>10} {'1er lote ms':>12} {'total ms':>9}")
+        rows = [("recorrido en frío", run_engine(app, root, index_path)),
+                ("con índice", run_engine(app, root, index_path))]
+        time.sleep(0.01)  # mtime de carpeta distinto aunque el sistema de ficheros tenga poca resolución
+        for d in random.Random(2).sample(dirs, min(args.touch, len(dirs))):
+            with open(os.path.join(d, "nueva.exe"), "w") as f:
+                f.write("x")
+        rows.append((f"con {args.touch} cambiadas", run_engine(app, root, index_path)))
+        for name, (stats, first, total) in rows:
+            print(f"{name:<18} {stats['dirs']:>9} {stats['relisted']:>11} {stats['programs']:>10} "
+                  f"{first:>12.1f} {total:>9.1f}")
+
+        os.remove(index_path)
+        for label in ("ventana, en frío", "ventana, índice"):
+            r = run_window(app, root, index_path)
+            print(f"{label}: primer frame {r['first_frame_ms']:.0f} ms, primer lote {r['first_batch_ms']:.0f} ms, "
+                  f"{r['batches']} lotes -> {r['entries']} entradas, merge por lote p95 {r['merge_p95']:.1f} ms "
+                  f"/ máx {r['merge_max']:.1f} ms")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
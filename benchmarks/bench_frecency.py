@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark del UsageStore: carga del log de uso y orden por frecency en el arranque.
+
+Genera un historial sintético para un catálogo de N entradas (una fracción --used de ellas lanzada
+entre 1 y 20 veces en los últimos 90 días) y mide, por repetición:
+  - carga log:        leer y agregar el log sin compactar (una línea por lanzamiento).
+  - carga compactado: lo mismo tras la compactación (una línea por entrada).
+  - orden:            ranking() + order() sobre las N entradas (lo que hace el primer layout).
+  - boost búsqueda:   SearchIndex.set_boost() con esas puntuaciones.
+  - record():         coste en el hilo GUI de anotar un lanzamiento (solo encola).
+La carga corre en el hilo del UsageStore en paralelo con la construcción de la ventana; lo que
+llega al arranque es como mucho su diferencia con esa construcción (ver bench_startup.py).
+
+Uso:
+    python benchmarks/bench_frecency.py [--entries 10000] [--used 1.0] [--runs 20] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lanzador_programas_PyQT6 as launcher  # noqa: E402
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def write_history(path: str, n: int, used: float, rnd: random.Random) -> int:
+    now = time.time()
+    events = [(now - rnd.random() * 90 * 86400, f"k{i}") for i in rnd.sample(range(n), int(n * used))
+              for _ in range(rnd.randint(1, 20))]
+    events.sort()
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(f"+{ts:.3f}\t{key}\n" for ts, key in events)
+    return len(events)
+
+
+def timed_load(path: str):
+    t = time.perf_counter()
+    store = launcher.UsageStore(path)
+    store.wait_loaded()
+    ms = (time.perf_counter() - t) * 1000
+    return store, ms
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--entries", type=int, default=10000)
+    ap.add_argument("--used", type=float, default=1.0, help="fracción de entradas con historial")
+    ap.add_argument("--runs", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rnd = random.Random(args.seed)
+    entries = [launcher.ProgramEntry(f"PROGRAMA {i}", "prog_progain", f"programa_{i}.exe", key=f"k{i}")
+               for i in range(args.entries)]
+    index = launcher.SearchIndex(entries)
+    work = tempfile.mkdtemp(prefix="progain-usage-")
+    try:
+        raw = os.path.join(work, "raw.log")
+        lines = write_history(raw, args.entries, args.used, rnd)
+        compacted = os.path.join(work, "compacted.log")
+        shutil.copy(raw, compacted)
+        store, _ = timed_load(compacted)
+        store._compact()
+        store.close()
+
+        results = {"carga log": [], "carga compactado": [], "orden": [], "boost búsqueda": [], "record()": []}
+        fresh = os.path.join(work, "fresh.log")
+        for _ in range(args.runs):
+            shutil.copy(raw, fresh)  # la carga compacta el log: cada repetición parte del original
+            store, ms = timed_load(fresh)
+            results["carga log"].append(ms)
+            store.close()
+            store, ms = timed_load(compacted)
+            results["carga compactado"].append(ms)
+            t = time.perf_counter()
+            ranking = store.ranking()
+            store.order(entries, ranking)
+            results["orden"].append((time.perf_counter() - t) * 1000)
+            t = time.perf_counter()
+            index.set_boost(ranking)
+            results["boost búsqueda"].append((time.perf_counter() - t) * 1000)
+            store.close()
+
+        store = launcher.UsageStore(os.path.join(work, "record.log"))
+        store.wait_loaded()
+        for i in range(1000):
+            t = time.perf_counter()
+            store.record(f"k{i % args.entries}")
+            results["record()"].append((time.perf_counter() - t) * 1000)
+        store.close()
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    print(f"entradas: {args.entries}  lanzamientos en el log: {lines}  usadas: {len(ranking)}")
+    print(f"{'fase':<18} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, vals in results.items():
+        print(f"{name:<18} {percentile(vals, 0.5):>9.3f} {percentile(vals, 0.95):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
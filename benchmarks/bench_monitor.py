@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark del coste propio del ResourceMonitor con muchos hijos vivos.
+
+Lanza N procesos hijo (`sleep`, o un bucle de CPU con --busy) y los registra en un ResourceMonitor
+como haría ProcessSupervisor. Durante --seconds segundos de bucle de eventos (ocioso salvo por el
+monitor) mide:
+  - ms/pasada:    CPU del hilo de muestreo por pasada (leer stat/statm de los N PIDs y agregar).
+  - % CPU hilo:   CPU del hilo de muestreo / tiempo de pared (objetivo: < 1% con 100 hijos).
+  - % CPU total:  CPU de todo el proceso en ese tiempo (incluye la entrega a la GUI).
+  - envíos/s:     actualizaciones usageChanged recibidas por el hilo GUI (como mucho 1/s).
+
+Uso:
+    python benchmarks/bench_monitor.py [--children 100] [--seconds 10] [--intervals 1000,250] [--busy]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6 import QtCore  # noqa: E402
+import lanzador_programas_PyQT6 as launcher  # noqa: E402
+
+
+def spawn_children(n: int, busy: bool):
+    code = "while True: pass" if busy else "import time; time.sleep(3600)"
+    return [subprocess.Popen([sys.executable, "-c", code]) for _ in range(n)]
+
+
+def run(app, children, seconds: float, interval_ms: int):
+    monitor = launcher.ResourceMonitor(interval_ms=interval_ms)
+    if monitor.reader is None:
+        raise SystemExit("sin lector de procesos en esta plataforma (ni /proc ni psutil)")
+    pushes = []
+    monitor.usageChanged.connect(lambda usage: pushes.append(time.monotonic()))
+    for i, proc in enumerate(children):
+        monitor.track(f"p{i % 10}", proc.pid)  # 10 entradas con varias instancias cada una
+    cpu0, wall0 = time.process_time(), time.monotonic()
+    QtCore.QTimer.singleShot(int(seconds * 1000), app.quit)
+    app.exec()
+    cpu, wall = time.process_time() - cpu0, time.monotonic() - wall0
+    stats = monitor.stats()
+    monitor.stop()
+    return stats, cpu * 100.0 / wall, len(pushes) / wall
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--children", type=int, default=100)
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--intervals", default="1000,250", help="intervalos de muestreo (ms)")
+    ap.add_argument("--busy", action="store_true", help="los hijos consumen CPU en lugar de dormir")
+    args = ap.parse_args()
+
+    app = QtCore.QCoreApplication(sys.argv[:1])
+    children = spawn_children(args.children, args.busy)
+    try:
+        time.sleep(0.5)  # que los intérpretes hijos terminen de arrancar
+        print(f"hijos: {args.children}  lector: {launcher.process_reader().name}")
+        print(f"{'intervalo ms':>12} {'pasadas':>8} {'ms/pasada':>10} {'% CPU hilo':>11} {'% CPU total':>12} {'envíos/s':>9}")
+        for interval in (int(x) for x in args.intervals.split(",")):
+            stats, total, rate = run(app, children, args.seconds, interval)
+            print(f"{interval:>12} {stats['passes']:>8} {stats['ms_per_pass']:>10.3f} {stats['cpu_pct']:>11.3f} "
+                  f"{total:>12.3f} {rate:>9.2f}")
+    finally:
+        for proc in children:
+            proc.kill()
+        for proc in children:
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark del SearchIndex: coste por pulsación de tecla sobre un catálogo sintético.
+
+Simula al usuario escribiendo consultas letra a letra (incluidas consultas con errores
+y con/sin acentos) y reporta p50/p95/max por pulsación. Objetivo: < 1 ms con 10k entradas.
+
+Uso:
+    python benchmarks/bench_search.py [--entries 10000] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lanzador_programas_PyQT6 as launcher  # noqa: E402
+
+WORDS = [
+    "facturación", "gestión", "equipos", "alquiler", "licitaciones", "proyectos", "construcción",
+    "nómina", "contabilidad", "inventario", "almacén", "compras", "ventas", "clientes", "proveedores",
+    "cotización", "presupuesto", "obra", "maquinaria", "transporte", "recursos", "humanos", "tesorería",
+    "bancos", "impuestos", "reportes", "auditoría", "calidad", "seguridad", "mantenimiento",
+]
+
+QUERIES = ["facturacion", "licitación", "alquiler equi", "mantenimento", "contabilidda", "obra 12", "zzz"]
+
+
+def make_catalog(n: int, rnd: random.Random):
+    entries = []
+    for i in range(n):
+        w = rnd.sample(WORDS, 3)
+        label = f"{w[0].upper()} {w[1].capitalize()} {i}"
+        exe = f"{fold(w[0])}_{fold(w[2])}_{i}.exe"
+        entries.append(launcher.ProgramEntry(label, "prog_progain", exe, key=f"k{i}",
+                                             tags=(w[2],), aliases=(f"{w[0][:3]}{i}",)))
+    return entries
+
+
+def fold(s: str) -> str:
+    return launcher.fold_text(s)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--entries", type=int, default=10000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rnd = random.Random(args.seed)
+    entries = make_catalog(args.entries, rnd)
+    t = time.perf_counter()
+    index = launcher.SearchIndex(entries)
+    print(f"índice: {len(index)} entradas en {(time.perf_counter() - t) * 1000:.1f} ms")
+    t = time.perf_counter()
+    index.warm()  # en el launcher corre en un hilo de fondo tras el primer frame
+    print(f"warm (trigramas + consultas de 1 letra): {(time.perf_counter() - t) * 1000:.1f} ms")
+
+    per_key = []
+    print(f"{'consulta':<16} {'teclas':>6} {'p50 ms':>8} {'max ms':>8} {'resultados':>10}")
+    for query in QUERIES:
+        times = []
+        results = []
+        for k in range(1, len(query) + 1):
+            t = time.perf_counter()
+            results = index.search(query[:k])
+            times.append((time.perf_counter() - t) * 1000)
+        # borrar de vuelta (backspace) también debe ser barato
+        for k in range(len(query) - 1, 0, -1):
+            t = time.perf_counter()
+            index.search(query[:k])
+            times.append((time.perf_counter() - t) * 1000)
+        per_key += times
+        print(f"{query:<16} {len(times):>6} {percentile(times, 0.5):>8.3f} {max(times):>8.3f} {len(results):>10}")
+
+    print(f"\ntotal {len(per_key)} pulsaciones: p50 {percentile(per_key, 0.5):.3f} ms, "
+          f"p95 {percentile(per_key, 0.95):.3f} ms, max {max(per_key):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de navegación por teclado en la rejilla de widgets (auto-repetición de flechas).
+
+Para cada tamaño de catálogo crea la ventana con tiles reales (PROGAIN_VIRTUAL_GRID=0), selecciona
+el primero y envía K pulsaciones de flecha recorriendo la rejilla en zigzag, como una tecla
+mantenida. Cada pulsación se mide de punta a punta: el manejador de la tecla y el repintado que
+provoca (processEvents). El coste por tecla no debería crecer con el número de tiles.
+
+Uso:
+    python benchmarks/bench_selection.py [--sizes 100,1000,3000] [--keys 2000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["PROGAIN_VIRTUAL_GRID"] = "0"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
+import lanzador_programas_PyQT6 as launcher  # noqa: E402
+
+Key = QtCore.Qt.Key
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def key_sequence(cols: int, rows: int, n: int):
+    """Zigzag: fila a la derecha, baja, fila a la izquierda, baja... y vuelta a subir al final."""
+    right = True
+    row = 0
+    while True:
+        for _ in range(cols - 1):
+            yield Key.Key_Right if right else Key.Key_Left
+        if row < rows - 1:
+            yield Key.Key_Down
+            row += 1
+        else:
+            for _ in range(rows - 1):
+                yield Key.Key_Up
+            row = 0
+        right = not right
+
+
+def run(app, n: int, keys: int):
+    entries = [launcher.ProgramEntry(f"PROGRAMA {i}", "prog_progain", f"programa_{i}.exe", key=f"p{i}")
+               for i in range(n)]
+    win = launcher.MainWindow(entries=entries)
+    win.resize(1280, 720)
+    win.show()
+    app.processEvents()
+    win.relayout_tiles()
+    first = win.layout_engine.visible[0]
+    win.selection.select(first)
+    cols = max(1, win.cols)
+    rows = (n + cols - 1) // cols
+    seq = key_sequence(cols, rows, n)
+    times = []
+    for _ in range(keys):
+        k = next(seq)
+        target = win.selection.current
+        t = time.perf_counter()
+        app.sendEvent(target, QtGui.QKeyEvent(QtCore.QEvent.Type.KeyPress, k, QtCore.Qt.KeyboardModifier.NoModifier))
+        app.processEvents()
+        times.append((time.perf_counter() - t) * 1000)
+    win.close()
+    win.deleteLater()
+    app.processEvents()
+    return cols, times
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="100,1000,3000")
+    ap.add_argument("--keys", type=int, default=2000)
+    args = ap.parse_args()
+    logs = tempfile.TemporaryDirectory(prefix="progain-bench-")  # logs del launcher fuera del repo
+    launcher.LOG_FILE = os.path.join(logs.name, launcher.LOG_FILE)
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    print(f"{'tiles':>6} {'cols':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'teclas/s':>9}")
+    for n in (int(x) for x in args.sizes.split(",")):
+        cols, times = run(app, n, args.keys)
+        rate = len(times) / (sum(times) / 1000)
+        print(f"{n:>6} {cols:>5} {percentile(times, 0.5):>8.3f} {percentile(times, 0.95):>8.3f} "
+              f"{max(times):>8.3f} {rate:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
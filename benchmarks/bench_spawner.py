@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: latencia click -> exec y memoria al lanzar programas, Popen directo vs progain_spawner.
+
+Cada modo corre en un proceso hijo que imita la GUI real (QApplication + MainWindow con N tiles y
+un lastre opcional de memoria) y lanza /bin/true repetidamente:
+  - call ms:  lo que bloquea al worker del launcher (Popen() o SpawnerClient.spawn()).
+  - exit ms:  desde la llamada hasta saber que el hijo terminó (incluye fork/spawn + exec).
+  - hijos MB: ru_maxrss máximo de los hijos directos (con Popen incluye la copia de la GUI
+              previa al exec; con el spawner solo el propio spawner).
+  - GUI MB:   crecimiento del pico de RSS (VmHWM) de la GUI durante los lanzamientos.
+
+Con --no-vfork se fuerza el fork() clásico en Popen (Python < 3.10, o cuando CPython no puede usar
+vfork/posix_spawn), que es donde el spawner marca la diferencia.
+
+Solo POSIX. Uso:
+    python benchmarks/bench_spawner.py [--launches 200] [--tiles 300] [--ballast-mb 200] [--no-vfork]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGET = "/bin/true"
+
+
+def vm_hwm_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def child(mode: str, launches: int, tiles: int, ballast_mb: int, no_vfork: bool):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["PROGAIN_VIRTUAL_GRID"] = "0"
+    os.environ["PROGAIN_SPAWNER"] = "1" if mode == "spawner" else "0"
+    sys.path.insert(0, ROOT)
+    from PyQt6 import QtWidgets
+    import lanzador_programas_PyQT6 as launcher
+    logs = tempfile.TemporaryDirectory(prefix="progain-bench-")  # logs del launcher fuera del repo
+    launcher.LOG_FILE = os.path.join(logs.name, launcher.LOG_FILE)
+
+    if no_vfork:
+        subprocess._USE_VFORK = False
+        subprocess._USE_POSIX_SPAWN = False
+    spawner = launcher.SpawnerClient.start_if_enabled()
+    if mode == "spawner" and spawner is None:
+        print(json.dumps({"mode": mode, "error": "spawner no disponible"}))
+        return
+    app = QtWidgets.QApplication(sys.argv[:1])
+    entries = [launcher.ProgramEntry(f"PROGRAMA {i}", "prog_progain", f"programa_{i}.exe") for i in range(tiles)]
+    win = launcher.MainWindow(entries=entries)
+    win.show()
+    app.processEvents()
+    ballast = bytearray(ballast_mb * 2**20)
+    for i in range(0, len(ballast), 4096):  # páginas realmente residentes
+        ballast[i] = 1
+
+    hwm0 = vm_hwm_mb()
+    calls, exits = [], []
+    for _ in range(launches):
+        t0 = time.perf_counter()
+        if spawner is not None:
+            proc = spawner.spawn([TARGET])
+            t1 = time.perf_counter()
+            while proc.poll() is None:
+                time.sleep(0.0002)
+        else:
+            proc = subprocess.Popen([TARGET])
+            t1 = time.perf_counter()
+            proc.wait()
+        t2 = time.perf_counter()
+        calls.append((t1 - t0) * 1000)
+        exits.append((t2 - t0) * 1000)
+    hwm1 = vm_hwm_mb()
+    if spawner is not None:
+        spawner.close()
+
+    print(json.dumps({
+        "mode": mode,
+        "call_p50": round(percentile(calls, 0.5), 3),
+        "call_p95": round(percentile(calls, 0.95), 3),
+        "exit_p50": round(percentile(exits, 0.5), 3),
+        "exit_p95": round(percentile(exits, 0.95), 3),
+        "children_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+        "gui_hwm_delta_mb": round(hwm1 - hwm0, 1),
+        "gui_rss_mb": round(hwm1, 1),
+    }))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--launches", type=int, default=200)
+    ap.add_argument("--tiles", type=int, default=300)
+    ap.add_argument("--ballast-mb", type=int, default=200,
+                    help="memoria extra residente en la GUI (simula iconos, cachés, etc.)")
+    ap.add_argument("--no-vfork", action="store_true", help="Popen con fork() clásico")
+    ap.add_argument("--child", metavar="MODE", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if not hasattr(os, "posix_spawn"):
+        sys.exit("el spawner solo existe en POSIX")
+    if args.child:
+        child(args.child, args.launches, args.tiles, args.ballast_mb, args.no_vfork)
+        return
+
+    print(f"{'modo':<8} {'call p50':>9} {'call p95':>9} {'exit p50':>9} {'exit p95':>9} "
+          f"{'hijos MB':>9} {'GUI MB':>8} {'ΔGUI MB':>8}")
+    for mode in ("popen", "spawner"):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", mode, "--launches", str(args.launches),
+             "--tiles", str(args.tiles), "--ballast-mb", str(args.ballast_mb)]
+            + (["--no-vfork"] if args.no_vfork else []),
+            capture_output=True, text=True,
+        )
+        line = [l for l in out.stdout.splitlines() if l.startswith("{")]
+        if not line:
+            print(f"{mode:<8} error: {out.stderr.strip()[-200:]}")
+            continue
+        r = json.loads(line[-1])
+        if "error" in r:
+            print(f"{mode:<8} {r['error']}")
+            continue
+        print(f"{r['mode']:<8} {r['call_p50']:>9} {r['call_p95']:>9} {r['exit_p50']:>9} {r['exit_p95']:>9} "
+              f"{r['children_mb']:>9} {r['gui_rss_mb']:>8} {r['gui_hwm_delta_mb']:>8}")
+
+
+if __name__ == "__main__":
+    main()
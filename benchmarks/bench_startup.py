@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de arranque del launcher: N arranques headless en frío y en caliente, por fase.
+
+Cada arranque es un proceso nuevo (`QT_QPA_PLATFORM=offscreen`) que termina al pintar el primer
+frame y devuelve la traza de StartupTrace. Se reporta p50/p95 del tiempo de pared (proceso
+completo, incluido el intérprete) y de cada fase.
+  - frío:     directorio de caché vacío en cada arranque (miniaturas de iconos por decodificar).
+  - caliente: misma caché reutilizada tras un arranque previo.
+La caché de páginas del sistema no se vacía: "frío" es frío para el launcher, no para el disco.
+
+Uso:
+    python benchmarks/bench_startup.py [--runs 10] [--entries 0] [--catalog ruta.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "lanzador_programas_PyQT6.py")
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def write_catalog(path: str, n: int):
+    programs = [{"key": f"p{i}", "label": f"PROGRAMA {i}", "icon": "prog_progain", "exe": f"programa_{i}.exe"}
+                for i in range(n)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"programs": programs}, f)
+
+
+def run_once(workdir: str, cache_dir: str, catalog: str):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PROGAIN_CACHE_DIR=cache_dir, PROGAIN_RESIDENT="0")
+    if catalog:
+        env["PROGAIN_CATALOG"] = catalog
+    t = time.perf_counter()
+    out = subprocess.run([sys.executable, SCRIPT, "--quit-after-first-frame"], cwd=workdir, env=env,
+                         capture_output=True, text=True, timeout=120)
+    wall = (time.perf_counter() - t) * 1000
+    line = [l for l in out.stdout.splitlines() if l.startswith("{")]
+    if not line:
+        raise RuntimeError(out.stderr.strip()[-300:])
+    record = json.loads(line[-1])
+    record["wall_ms"] = round(wall, 2)
+    return record
+
+
+def report(label: str, records):
+    walls = [r["wall_ms"] for r in records]
+    totals = [r["total_ms"] for r in records]
+    print(f"\n{label} ({len(records)} arranques)")
+    print(f"  {'fase':<16} {'p50 ms':>9} {'p95 ms':>9}")
+    print(f"  {'pared (proceso)':<16} {percentile(walls, 0.5):>9.1f} {percentile(walls, 0.95):>9.1f}")
+    print(f"  {'primer frame':<16} {percentile(totals, 0.5):>9.1f} {percentile(totals, 0.95):>9.1f}")
+    for phase in records[0]["phases"]:
+        vals = [r["phases"].get(phase, 0.0) for r in records]
+        print(f"  {phase:<16} {percentile(vals, 0.5):>9.1f} {percentile(vals, 0.95):>9.1f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--entries", type=int, default=0,
+                    help="genera un catálogo sintético de N programas (0 = catálogo integrado)")
+    ap.add_argument("--catalog", help="catálogo a usar (por defecto el integrado)")
+    ap.add_argument("--json", action="store_true", help="vuelca los registros en bruto")
+    args = ap.parse_args()
+
+    work = tempfile.mkdtemp(prefix="progain-bench-")
+    try:
+        # los iconos se resuelven relativos al cwd (resource_path)
+        if os.path.isdir(os.path.join(ROOT, "icons")):
+            os.symlink(os.path.join(ROOT, "icons"), os.path.join(work, "icons"))
+        catalog = args.catalog and os.path.abspath(args.catalog)
+        if args.entries:
+            catalog = os.path.join(work, "catalog.json")
+            write_catalog(catalog, args.entries)
+
+        cold = []
+        for i in range(args.runs):
+            cache = os.path.join(work, f"cold-cache-{i}")
+            cold.append(run_once(work, cache, catalog))
+        warm_cache = os.path.join(work, "warm-cache")
+        run_once(work, warm_cache, catalog)  # calienta la caché
+        warm = [run_once(work, warm_cache, catalog) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({"cold": cold, "warm": warm}, indent=1))
+        return
+    info = cold[0]
+    print(f"tiles: {info.get('tiles')}  rejilla virtual: {info.get('virtual_grid')}")
+    report("frío", cold)
+    report("caliente", warm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memoria por tile de la rejilla de widgets, LauncherTile frente a CompactTile.
+
+Para cada tipo de tile construye la ventana con N entradas (PROGAIN_VIRTUAL_GRID=0) en un proceso
+hijo propio y mide, restando una ventana sin entradas:
+  - RSS/tile:      crecimiento del RSS del proceso por tile (KB).
+  - QObjects/tile: objetos Qt bajo el contenedor de la rejilla por tile (el tile y sus hijos:
+                   botón, labels, layout... y el RippleOverlay de los tiles ya pulsados).
+  - construcción:  ms en crear y colocar los N tiles.
+--clicked F pulsa antes de medir una fracción F de los tiles (los LauncherTile crean entonces su
+RippleOverlay; los CompactTile comparten uno).
+
+Uso:
+    python benchmarks/bench_tile_memory.py [--tiles 1000] [--clicked 0.0]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ("LauncherTile", "CompactTile")
+
+
+def rss_bytes() -> int:
+    """RSS actual del proceso (psutil si está disponible, /proc/self/statm en Linux)."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+def child(mode: str, n: int, clicked: float):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["PROGAIN_VIRTUAL_GRID"] = "0"
+    os.environ["PROGAIN_COMPACT_TILES"] = "1" if mode == "CompactTile" else "0"
+    os.environ["PROGAIN_MONITOR"] = "0"
+    sys.path.insert(0, ROOT)
+    from PyQt6 import QtCore, QtWidgets
+    import lanzador_programas_PyQT6 as launcher
+    logs = tempfile.TemporaryDirectory(prefix="progain-bench-")  # logs del launcher fuera del repo
+    launcher.LOG_FILE = os.path.join(logs.name, launcher.LOG_FILE)
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    entries = [launcher.ProgramEntry(f"PROGRAMA {i}", "prog_progain", f"programa_{i}.exe", key=f"p{i}")
+               for i in range(n)]
+    app.processEvents()
+    rss0 = rss_bytes()
+    t0 = time.perf_counter()
+    win = launcher.MainWindow(entries=entries)
+    win.show()
+    win.relayout_tiles()
+    app.processEvents()
+    build_ms = (time.perf_counter() - t0) * 1000
+    # el ripple se dispara al soltar el botón; basta con la release para crear el overlay
+    tiles = win.page.tiles
+    for tile in tiles[:int(len(tiles) * clicked)]:
+        tile.clicked.disconnect()
+        tile.mouseReleaseEvent(launcher.QtGui.QMouseEvent(
+            QtCore.QEvent.Type.MouseButtonRelease, QtCore.QPointF(10, 10), QtCore.Qt.MouseButton.LeftButton,
+            QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.KeyboardModifier.NoModifier))
+    app.processEvents()
+    print(json.dumps({
+        "mode": mode,
+        "n": n,
+        "tile": type(tiles[0]).__name__ if tiles else None,
+        "build_ms": round(build_ms, 2),
+        "rss": rss_bytes() - rss0,
+        "qobjects": len(win.page.container.findChildren(QtCore.QObject)),
+    }))
+
+
+def measure(mode: str, n: int, clicked: float) -> dict:
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode, str(n), str(clicked)],
+                         capture_output=True, text=True, timeout=600)
+    line = [l for l in out.stdout.splitlines() if l.startswith("{")]
+    if not line:
+        raise RuntimeError(out.stderr.strip()[-300:])
+    return json.loads(line[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--tiles", type=int, default=1000)
+    ap.add_argument("--clicked", type=float, default=0.0, help="fracción de tiles pulsados antes de medir")
+    ap.add_argument("--child", nargs=3, metavar=("MODE", "N", "CLICKED"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(args.child[0], int(args.child[1]), float(args.child[2]))
+        return
+
+    n = args.tiles
+    print(f"tiles: {n}  pulsados: {args.clicked:.0%}")
+    print(f"{'tile':<14} {'RSS/tile KB':>12} {'QObjects/tile':>14} {'construcción ms':>16}")
+    for mode in MODES:
+        empty = measure(mode, 0, 0.0)
+        full = measure(mode, n, args.clicked)
+        if full["tile"] != mode:
+            raise RuntimeError(f"se esperaba {mode} y la ventana creó {full['tile']}")
+        rss = (full["rss"] - empty["rss"]) / n / 1024
+        objs = (full["qobjects"] - empty["qobjects"]) / n
+        print(f"{mode:<14} {rss:>12.1f} {objs:>14.2f} {full['build_ms']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memoria y tiempo de pintado de la rejilla de tiles, 10 -> 10.000 entradas.
+
+Compara la rejilla clásica (un LauncherTile por entrada) con la rejilla virtualizada
+(QListView + TileDelegate). Cada medida corre en un proceso hijo para que el RSS sea limpio.
+
+Uso:
+    python benchmarks/bench_virtual_grid.py [--sizes 10,100,1000,10000] [--max-widget 1000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_bytes() -> int:
+    """RSS actual del proceso (psutil si está disponible, /proc/self/statm en Linux)."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+def child(mode: str, n: int, repeats: int):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["PROGAIN_VIRTUAL_GRID"] = "1" if mode == "virtual" else "0"
+    sys.path.insert(0, ROOT)
+    from PyQt6 import QtWidgets
+    import lanzador_programas_PyQT6 as launcher
+    logs = tempfile.TemporaryDirectory(prefix="progain-bench-")  # logs del launcher fuera del repo
+    launcher.LOG_FILE = os.path.join(logs.name, launcher.LOG_FILE)
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    entries = [launcher.ProgramEntry(f"PROGRAMA {i}", "prog_progain", f"programa_{i}.exe") for i in range(n)]
+    app.processEvents()
+    rss0 = rss_bytes()
+
+    t0 = time.perf_counter()
+    win = launcher.MainWindow(entries=entries)
+    win.show()
+    app.processEvents()
+    build_ms = (time.perf_counter() - t0) * 1000
+    rss1 = rss_bytes()
+
+    # pintado completo de la ventana (lo que cuesta un frame tras un expose)
+    win.grab()
+    paints = []
+    for _ in range(repeats):
+        t = time.perf_counter()
+        win.grab()
+        paints.append((time.perf_counter() - t) * 1000)
+    paints.sort()
+    print(json.dumps({
+        "mode": mode,
+        "n": n,
+        "build_ms": round(build_ms, 2),
+        "rss_delta_mb": round((rss1 - rss0) / 2**20, 2),
+        "paint_ms_p50": round(paints[len(paints) // 2], 3),
+        "paint_ms_max": round(paints[-1], 3),
+    }))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="10,100,1000,10000")
+    ap.add_argument("--max-widget", type=int, default=1000,
+                    help="tamaño máximo a medir con la rejilla de widgets (es lenta de construir)")
+    ap.add_argument("--repeats", type=int, default=20)
+    ap.add_argument("--child", nargs=2, metavar=("MODE", "N"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        child(args.child[0], int(args.child[1]), args.repeats)
+        return
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    print(f"{'modo':<8} {'N':>6} {'build ms':>10} {'RSS MB':>8} {'paint p50':>10} {'paint max':>10}")
+    for mode in ("widgets", "virtual"):
+        for n in sizes:
+            if mode == "widgets" and n > args.max_widget:
+                continue
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", mode, str(n), "--repeats", str(args.repeats)],
+                capture_output=True, text=True,
+            )
+            line = [l for l in out.stdout.splitlines() if l.startswith("{")]
+            if not line:
+                print(f"{mode:<8} {n:>6}  error: {out.stderr.strip()[-200:]}")
+                continue
+            r = json.loads(line[-1])
+            print(f"{r['mode']:<8} {r['n']:>6} {r['build_ms']:>10} {r['rss_delta_mb']:>8} "
+                  f"{r['paint_ms_p50']:>10} {r['paint_ms_max']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,9 @@ Qué implementé en esta versión:
 - Hover animations al pasar el mouse sobre un tile:
   - Icon "pop" (suave aumento de iconSize).
   - Tile "lift" (aumento de blur del shadow + leve aumento de maximumSize para dar sensación de elevación).
-  - Label cambia de color al pasar el mouse (usando property + re-polish).
+  - Label cambia de color al pasar el mouse (TileLabel lo pinta directamente, sin re-polish).
   - Ripple effect al hacer click (ya presente).
-- Animaciones agrupadas con QParallelAnimationGroup para coherencia.
+- Animaciones conducidas por un único AnimationManager (un timer para toda la ventana).
 - Restauración suave al salir del hover.
 - Keyboard navigation y badges (como en la versión anterior).
 - Evité el bug previo (usar entero en addWidget stretch).
@@ -17,19 +17,175 @@ Qué implementé en esta versión:
 # en LauncherTask para mostrar un indicador de carga.
 
 Notas:
-- Ajusta rutas de iconos en load_icons() si tu carpeta de iconos está en otra ubicación.
+- Los programas e iconos se leen de catalog.toml / catalog.json (ver find_catalog_path y
+  catalog.example.json); sin catálogo se usan DEFAULT_PROGRAMS / DEFAULT_ICONS.
+- Las variables de entorno PROGAIN_* se documentan en la clase que las usa.
 - Requiere PyQt6 instalado.
 """
 
 import sys
 import os
+import argparse
+import getpass
+import re
+import json
+import bisect
+import codecs
+import hashlib
+import heapq
+import logging
+import logging.handlers
+import math
+import mmap
+import queue
+import tempfile
+import itertools
+import operator
 import subprocess
-from PyQt6 import QtCore, QtGui, QtWidgets # <--- ÚNICA LÍNEA DE IMPORTACIÓN PRINCIPAL
+import threading
+import collections
+import time
+import socket
+import unicodedata
+
+log = logging.getLogger("progain.launcher")
+LOG_FILE = "progain.log"
+
+# ----------------------------
+# Tiempos de arranque por fase
+# ----------------------------
+class StartupTrace:
+    """Mide cada fase del arranque, desde la importación de Qt hasta el primer frame pintado.
+
+    Las marcas se toman siempre (coste despreciable); el registro estructurado solo se escribe
+    en progain.log con PROGAIN_STARTUP_TRACE=1 o --trace-startup. Cada fase es el tiempo
+    transcurrido desde la marca anterior.
+    """
+    ENV = "PROGAIN_STARTUP_TRACE"
+
+    def __init__(self):
+        self.enabled = os.environ.get(self.ENV, "") not in ("", "0")
+        self.t0 = time.perf_counter()
+        self._last = self.t0
+        self.phases = []  # [(fase, ms)]
+        self.done = False
+
+    def mark(self, phase: str):
+        if self.done:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, round((now - self._last) * 1000.0, 2)))
+        self._last = now
+
+    def finish(self, **extra) -> dict:
+        """Cierra la traza (primer frame pintado) y la registra si está activada."""
+        if self.done:
+            return None
+        self.mark("first_frame")
+        self.done = True
+        record = {"event": "startup", "total_ms": round((self._last - self.t0) * 1000.0, 2),
+                  "phases": dict(self.phases)}
+        record.update(extra)
+        if self.enabled:
+            log.info("startup %s", json.dumps(record))
+        return record
+
+STARTUP = StartupTrace()
+
+# ----------------------------
+# Ruta rápida de las invocaciones posteriores (antes de importar Qt)
+# ----------------------------
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(prog="PROGAIN_Launcher", description="Lanzador de programas PROGAIN")
+    ap.add_argument("--launch", metavar="PROGRAMA", help="lanza el programa (key o label) y no muestra la ventana")
+    ap.add_argument("--workspace", metavar="ESPACIO",
+                    help="abre los programas del espacio de trabajo (\"workspaces\" del catálogo) y no muestra la ventana")
+    ap.add_argument("--no-tray", action="store_true",
+                    help="sin modo residente: cerrar la ventana termina el proceso (también PROGAIN_RESIDENT=0)")
+    ap.add_argument("--trace-startup", action="store_true",
+                    help=f"registra en {LOG_FILE} el tiempo de cada fase del arranque")
+    ap.add_argument("--launch-stats", action="store_true",
+                    help="muestra p50/p95 de lanzamiento por programa (progain_launches.log) y termina")
+    # benchmarks/bench_startup.py: arranque aislado que termina tras el primer frame
+    ap.add_argument("--quit-after-first-frame", action="store_true", help=argparse.SUPPRESS)
+    args, _qt_args = ap.parse_known_args(argv)
+    return args
+
+def instance_server_name() -> str:
+    """Nombre del QLocalServer de la instancia residente: uno por usuario."""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "default"
+    return "progain-launcher-" + re.sub(r"[^A-Za-z0-9_.-]", "_", user)
+
+def instance_message(args) -> dict:
+    if args.workspace:
+        return {"cmd": "workspace", "name": args.workspace}
+    return {"cmd": "launch", "name": args.launch} if args.launch else {"cmd": "show"}
+
+def send_to_running_instance(message: dict, connect_timeout: float = 0.2, reply_timeout: float = 3.0):
+    """Entrega `message` a la instancia residente y devuelve su respuesta, o None si no hay ninguna.
+
+    Habla el transporte de QLocalServer (named pipe en Windows, socket Unix en QDir::tempPath()
+    en el resto) solo con la librería estándar: así una segunda invocación no paga la
+    importación ni la inicialización de Qt.
+    """
+    name = instance_server_name()
+    data = (json.dumps(message) + "\n").encode("utf-8")
+    try:
+        if sys.platform == "win32":
+            with open("\\\\.\\pipe\\" + name, "r+b", buffering=0) as pipe:
+                pipe.write(data)
+                reply = pipe.readline()
+        else:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(connect_timeout)
+                sock.connect(os.path.join(tempfile.gettempdir(), name))
+                sock.settimeout(reply_timeout)
+                sock.sendall(data)
+                reply = b""
+                while not reply.endswith(b"\n"):
+                    chunk = sock.recv(4096)
+                    if not chunk:
+                        break
+                    reply += chunk
+    except OSError:
+        return None
+    try:
+        return json.loads(reply.decode("utf-8"))
+    except ValueError:
+        return {"ok": False, "error": "respuesta inválida de la instancia en ejecución"}
+
+def forward_to_running_instance(args):
+    """Pasa la petición a la instancia residente y devuelve el código de salida de esta invocación
+    (0 si la aceptó; 1 si no, con su error en stderr), o None si no hay instancia residente.
+    No termina el proceso: eso lo decide quien llama."""
+    reply = send_to_running_instance(instance_message(args))
+    if reply is None:
+        return None
+    if not reply.get("ok"):
+        print(reply.get("error", "error"), file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    _args = parse_args(sys.argv[1:])
+    if not (_args.quit_after_first_frame or _args.launch_stats):
+        _code = forward_to_running_instance(_args)
+        if _code is not None:
+            sys.exit(_code)
+
+from PyQt6 import QtCore, QtGui, QtNetwork, QtWidgets # <--- ÚNICA LÍNEA DE IMPORTACIÓN PRINCIPAL
+STARTUP.mark("import_qt")
 
 ICON_SIZE = 72
 TILE_W = 160
 TILE_H = 150
 SIDEBAR_WIDTH = 220
+GRID_SPACING = 22
+# a partir de este número de entradas se usa la rejilla virtualizada (QListView + delegate)
+VIRTUAL_GRID_THRESHOLD = 200
 
 STYLE = f"""
 QWidget {{
@@ -88,6 +244,786 @@ def resource_path(rel_path: str) -> str:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, rel_path)
 
+# ----------------------------
+# Entrada del catálogo
+# ----------------------------
+class ProgramEntry:
+    """Un programa lanzable del catálogo (independiente del widget que lo pinte)."""
+    __slots__ = ("key", "label", "icon_key", "exe", "badge", "tags", "aliases", "args", "cwd", "env",
+                 "categories", "single_instance", "ready", "prewarm", "badge_source", "capture")
+
+    SINGLE_INSTANCE_POLICIES = ("", "refuse", "focus")
+
+    def __init__(self, label: str, icon_key: str, exe: str, key: str = None, badge: int = 0,
+                 tags=(), aliases=(), args=(), cwd: str = None, env: dict = None, categories=(),
+                 single_instance: str = "", ready: dict = None, prewarm=(), badge_source: dict = None,
+                 capture: bool = True):
+        self.key = key or label
+        self.label = label
+        self.icon_key = icon_key
+        self.exe = exe
+        self.badge = badge
+        self.tags = tuple(tags)
+        self.aliases = tuple(aliases)
+        self.args = tuple(str(a) for a in args)
+        self.cwd = cwd
+        self.env = dict(env or {})
+        self.categories = tuple(categories)
+        # "" = sin límite; "refuse" = no lanzar otra instancia; "focus" = traer al frente la que ya corre
+        self.single_instance = single_instance or ""
+        # sonda "app lista" (ver ReadinessProbe); None = la de por defecto, {} = ninguna
+        self.ready = ready
+        # ficheros de datos que PrewarmEngine lee por adelantado junto al ejecutable
+        self.prewarm = tuple(prewarm)
+        # proveedor del contador del badge (ver BadgeProvider); None = solo el "badge" estático
+        self.badge_source = badge_source
+        # stdout/stderr a un log rotativo (ver OutputCapture); False = heredan la consola del launcher
+        self.capture = capture
+
+    def signature(self) -> tuple:
+        """Todo lo que define la entrada; sirve para detectar cambios al recargar el catálogo."""
+        return (self.label, self.icon_key, self.exe, self.badge, self.tags, self.aliases, self.args,
+                self.cwd, tuple(sorted(self.env.items())), self.categories, self.single_instance,
+                json.dumps(self.ready, sort_keys=True), self.prewarm, json.dumps(self.badge_source, sort_keys=True),
+                self.capture)
+
+    def update_from(self, other: "ProgramEntry"):
+        """Copia los campos de `other` conservando la identidad (tiles y modelos la referencian)."""
+        for name in self.__slots__:
+            if name != "key":
+                setattr(self, name, getattr(other, name))
+
+    def __repr__(self):
+        return f"ProgramEntry({self.key!r}, exe={self.exe!r})"
+
+# ----------------------------
+# Catálogo externo (JSON/TOML) con caché de parseo y recarga en caliente
+# ----------------------------
+CATALOG_ENV = "PROGAIN_CATALOG"
+CATALOG_NAMES = ("catalog.toml", "catalog.json")
+
+DEFAULT_ICONS = {
+    "prog_progain": "icons/icon_programa-01.png",
+    "prog_equipos": "icons/icon_programa-02.png",
+    "prog_facturas": "icons/icon_programa-03.png",
+    "prog_facturacion_inter": "icons/icon_programa-04.png",
+    "prog_licitaciones": "icons/icon_programa-05.png",
+}
+
+DEFAULT_PROGRAMS = [
+    {"label": "PROGAIN", "icon": "prog_progain", "exe": "progain_app.exe", "tags": ["Proyectos de Construcción"],
+     "categories": ["Proyectos"]},
+    {"label": "EQUIPOS", "icon": "prog_equipos", "exe": "alquiler_equipos.exe", "tags": ["Alquiler de Equipos"],
+     "categories": ["Equipos"]},
+    {"label": "FACTURAS", "icon": "prog_facturas", "exe": "gestion_facturas.exe", "tags": ["Gastos e Ingresos"],
+     "categories": ["Finanzas"]},
+    {"label": "FACTURAS EMP", "icon": "prog_facturacion_inter", "exe": "facturacion_gui.exe",
+     "tags": ["Facturación Interna"], "categories": ["Finanzas"]},
+    {"label": "LICITACIONES", "icon": "prog_licitaciones", "exe": "gestor_licitaciones_db.exe",
+     "tags": ["Gestión de Licitaciones"], "categories": ["Licitaciones"]},
+]
+
+# "ready": {"window": true} | {"file": ruta} | {"port": 8080} | {"log": ruta, "pattern": regex}
+#          | {"alive": s}, + "timeout" (s)
+READY_PROBE_KEYS = frozenset(("window", "file", "port", "log", "pattern", "alive", "timeout"))
+
+class CatalogError(Exception):
+    """El fichero de catálogo no se pudo leer o no tiene el formato esperado."""
+
+def app_dir() -> str:
+    """Carpeta del ejecutable (PyInstaller) o del script."""
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+def find_catalog_path():
+    """PROGAIN_CATALOG o el primer catalog.toml/catalog.json junto al ejecutable o en el cwd."""
+    env = os.environ.get(CATALOG_ENV, "").strip()
+    if env:
+        return os.path.abspath(env)
+    for d in dict.fromkeys((app_dir(), os.path.abspath("."))):
+        for name in CATALOG_NAMES:
+            p = os.path.join(d, name)
+            if os.path.isfile(p):
+                return p
+    return None
+
+def _str_list(d: dict, name: str, allow_numbers: bool = False) -> tuple:
+    """Campo lista de textos (o un texto suelto); CatalogError si tiene otro tipo."""
+    value = d.get(name) or ()
+    if isinstance(value, str):
+        value = (value,)
+    kinds = (str, int, float) if allow_numbers else str
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, kinds) and not isinstance(v, bool)
+                                                       for v in value):
+        raise CatalogError(f"{name} inválido en {d['label']!r}: {value!r} (lista de textos)")
+    return tuple(value)
+
+def _opt_str(d: dict, name: str):
+    value = d.get(name)
+    if value is not None and not isinstance(value, str):
+        raise CatalogError(f"{name} inválido en {d['label']!r}: {value!r} (texto)")
+    return value
+
+def entry_from_dict(d: dict) -> ProgramEntry:
+    """ProgramEntry de un programa del catálogo; cualquier campo con un tipo inesperado da CatalogError
+    (el fichero lo edita IT a mano mientras el launcher sigue abierto)."""
+    if not isinstance(d, dict) or not d.get("label") or not d.get("exe"):
+        raise CatalogError(f"programa inválido (faltan label/exe): {d!r}")
+    if not isinstance(d["label"], str) or not isinstance(d["exe"], str):
+        raise CatalogError(f"programa inválido (label/exe deben ser texto): {d!r}")
+    label = d["label"]
+    key, icon, cwd = _opt_str(d, "key"), _opt_str(d, "icon"), _opt_str(d, "cwd")
+    badge = d.get("badge", 0) or 0
+    if isinstance(badge, bool) or not isinstance(badge, int):
+        raise CatalogError(f"badge inválido en {label!r}: {badge!r} (entero)")
+    tags, aliases, categories = _str_list(d, "tags"), _str_list(d, "aliases"), _str_list(d, "categories")
+    args = _str_list(d, "args", allow_numbers=True)
+    env = d.get("env") or {}
+    if not isinstance(env, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in env.items()):
+        raise CatalogError(f"env inválido en {label!r}: {env!r} (objeto nombre -> texto)")
+    single = d.get("single_instance", "")
+    if single is True:
+        single = "focus"
+    elif not single:
+        single = ""
+    if single not in ProgramEntry.SINGLE_INSTANCE_POLICIES:
+        raise CatalogError(f"single_instance inválido en {d['label']!r}: {single!r} (refuse | focus)")
+    ready = d.get("ready")
+    if ready is False:
+        ready = {}
+    elif ready is not None:
+        if not isinstance(ready, dict) or set(ready) - READY_PROBE_KEYS:
+            raise CatalogError(f"ready inválido en {d['label']!r}: {ready!r} (claves: {sorted(READY_PROBE_KEYS)})")
+    prewarm = d.get("prewarm") or ()
+    if isinstance(prewarm, str):
+        prewarm = (prewarm,)
+    if not isinstance(prewarm, (list, tuple)) or not all(isinstance(p, str) for p in prewarm):
+        raise CatalogError(f"prewarm inválido en {d['label']!r}: {prewarm!r} (lista de rutas)")
+    badge_source = d.get("badge_source")
+    if badge_source is not None and (not isinstance(badge_source, dict) or not badge_source.get("type")):
+        raise CatalogError(f"badge_source inválido en {d['label']!r}: {badge_source!r} (falta \"type\")")
+    capture = d.get("capture", True)
+    if not isinstance(capture, bool):
+        raise CatalogError(f"capture inválido en {d['label']!r}: {capture!r} (true | false)")
+    return ProgramEntry(
+        label, icon or "", d["exe"], key=key, badge=badge, tags=tags, aliases=aliases, args=args, cwd=cwd,
+        env=env, categories=categories, single_instance=single, ready=ready, prewarm=prewarm,
+        badge_source=badge_source, capture=capture,
+    )
+
+class WorkspaceStep:
+    """Un programa de un espacio de trabajo; se lanza cuando todos los de `after` están listos."""
+    __slots__ = ("key", "after", "ready", "timeout")
+
+    def __init__(self, key: str, after=(), ready: dict = None, timeout: float = None):
+        self.key = key
+        self.after = tuple(after)
+        # sonda "lista" de este paso; None = la "ready" de la entrada del catálogo
+        self.ready = ready
+        # segundos para estar lista desde que se lanza; None = el timeout de la sonda
+        self.timeout = timeout
+
+class Workspace:
+    """Grupo con nombre de entradas del catálogo que se abren juntas (ver WorkspaceRun)."""
+    __slots__ = ("name", "steps")
+
+    def __init__(self, name: str, steps):
+        self.name = name
+        self.steps = tuple(steps)
+
+    def keys(self):
+        return [s.key for s in self.steps]
+
+    def dependents(self) -> dict:
+        """key -> keys de los pasos que esperan a que esa esté lista."""
+        out = {s.key: [] for s in self.steps}
+        for s in self.steps:
+            for dep in s.after:
+                out[dep].append(s.key)
+        return out
+
+def workspace_from_dict(name: str, steps, keys) -> Workspace:
+    """Valida un espacio de trabajo del catálogo: claves existentes, dependencias internas y sin ciclos.
+
+    Cada paso es una key o {"key": ..., "after": [keys], "ready": {...}, "timeout": s}.
+    """
+    if not isinstance(steps, list) or not steps:
+        raise CatalogError(f"espacio de trabajo {name!r} inválido: se esperaba una lista de programas")
+    parsed = []
+    for d in steps:
+        if isinstance(d, str):
+            d = {"key": d}
+        if not isinstance(d, dict) or not isinstance(d.get("key"), str):
+            raise CatalogError(f"paso inválido en el espacio {name!r}: {d!r} (falta \"key\")")
+        key = d["key"]
+        if key not in keys:
+            raise CatalogError(f"espacio {name!r}: no existe el programa {key!r}")
+        after = d.get("after") or ()
+        if isinstance(after, str):
+            after = (after,)
+        if not isinstance(after, (list, tuple)) or not all(isinstance(a, str) for a in after):
+            raise CatalogError(f"espacio {name!r}: after inválido en {key!r}: {after!r} (lista de keys)")
+        ready = d.get("ready")
+        if ready is False:
+            ready = {}
+        elif ready is not None and (not isinstance(ready, dict) or set(ready) - READY_PROBE_KEYS):
+            raise CatalogError(f"espacio {name!r}: ready inválido en {key!r}: {ready!r}")
+        timeout = d.get("timeout")
+        if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float))
+                                    or timeout <= 0):
+            raise CatalogError(f"espacio {name!r}: timeout inválido en {key!r}: {timeout!r} (segundos)")
+        parsed.append(WorkspaceStep(key, after, ready, timeout))
+    workspace = Workspace(name, parsed)
+    step_keys = workspace.keys()
+    if len(set(step_keys)) != len(step_keys):
+        raise CatalogError(f"espacio {name!r}: programas repetidos")
+    for s in parsed:
+        missing = [a for a in s.after if a not in step_keys]
+        if missing:
+            raise CatalogError(f"espacio {name!r}: {s.key!r} espera a {missing!r}, que no están en el espacio")
+    # Kahn: lo que queda con dependencias pendientes al final está en un ciclo
+    pending = {s.key: len(set(s.after)) for s in parsed}
+    dependents = workspace.dependents()
+    ready_keys = [k for k, n in pending.items() if n == 0]
+    while ready_keys:
+        k = ready_keys.pop()
+        del pending[k]
+        for dep in set(dependents[k]):
+            pending[dep] -= 1
+            if pending[dep] == 0:
+                ready_keys.append(dep)
+    if pending:
+        raise CatalogError(f"espacio {name!r}: dependencias en ciclo entre {sorted(pending)!r}")
+    return workspace
+
+class CatalogLoader:
+    """Lee el catálogo y cachea el resultado por (mtime, tamaño) y por hash del contenido.
+
+    Si mtime/tamaño no cambian no se toca el disco; si cambian pero el hash es el mismo
+    (p. ej. un `touch` o una copia idéntica desde IT) no se vuelve a parsear.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._stat_key = None
+        self._digest = None
+        self._result = None  # (icons, entries, workspaces)
+
+    def load(self, force: bool = False):
+        """Devuelve (icons, entries, workspaces, changed). Lanza CatalogError si el fichero es inválido."""
+        try:
+            st = os.stat(self.path)
+        except OSError as e:
+            raise CatalogError(f"No se puede leer el catálogo {self.path}: {e}") from e
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if not force and self._result is not None and stat_key == self._stat_key:
+            return self._result + (False,)
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except OSError as e:  # borrado o reemplazado entre el stat y la lectura
+            raise CatalogError(f"No se puede leer el catálogo {self.path}: {e}") from e
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        self._stat_key = stat_key
+        if not force and self._result is not None and digest == self._digest:
+            return self._result + (False,)
+        try:
+            result = self._parse(raw)
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            # un tipo inesperado que la validación no prevé no debe tumbar al launcher residente
+            raise CatalogError(f"Catálogo inválido {self.path}: {e!r}") from e
+        self._digest = digest
+        self._result = result
+        return result + (True,)
+
+    def _parse(self, raw: bytes):
+        try:
+            if self.path.lower().endswith(".toml"):
+                import tomllib  # Python 3.11+
+                data = tomllib.loads(raw.decode("utf-8"))
+            else:
+                data = json.loads(raw.decode("utf-8-sig"))
+        except (ValueError, UnicodeDecodeError, ImportError) as e:
+            raise CatalogError(f"Catálogo inválido {self.path}: {e}") from e
+        if not isinstance(data, dict):
+            raise CatalogError(f"Catálogo inválido {self.path}: se esperaba un objeto")
+        base = os.path.dirname(self.path)
+        icons = {}
+        raw_icons = data.get("icons") or {}
+        if not isinstance(raw_icons, dict) or not all(isinstance(v, str) for v in raw_icons.values()):
+            raise CatalogError(f"Catálogo inválido {self.path}: \"icons\" debe ser un objeto nombre -> ruta")
+        programs = data.get("programs") or []
+        if not isinstance(programs, list):
+            raise CatalogError(f"Catálogo inválido {self.path}: \"programs\" debe ser una lista")
+        for k, rel in raw_icons.items():
+            # rutas relativas al catálogo si existen ahí; si no, a los recursos empaquetados
+            p = rel if os.path.isabs(rel) else os.path.join(base, rel)
+            icons[k] = p if os.path.exists(p) else rel
+        entries = [entry_from_dict(d) for d in programs]
+        for e in entries:
+            # "icon" puede ser una clave de "icons" o directamente una ruta
+            if e.icon_key and e.icon_key not in icons:
+                p = e.icon_key if os.path.isabs(e.icon_key) else os.path.join(base, e.icon_key)
+                icons[e.icon_key] = p if os.path.exists(p) else e.icon_key
+        keys = [e.key for e in entries]
+        if len(set(keys)) != len(keys):
+            raise CatalogError(f"Catálogo inválido {self.path}: claves repetidas")
+        spaces = data.get("workspaces") or {}
+        if not isinstance(spaces, dict):
+            raise CatalogError(f"Catálogo inválido {self.path}: \"workspaces\" debe ser un objeto nombre -> programas")
+        workspaces = [workspace_from_dict(name, steps, keys) for name, steps in spaces.items()]
+        return icons, entries, workspaces
+
+def diff_catalog(old_entries, new_entries):
+    """(añadidas, eliminadas, modificadas) entre dos listas de entradas, por clave."""
+    old = {e.key: e for e in old_entries}
+    new = {e.key: e for e in new_entries}
+    added = [e for k, e in new.items() if k not in old]
+    removed = [e for k, e in old.items() if k not in new]
+    updated = [e for k, e in new.items() if k in old and old[k].signature() != e.signature()]
+    return added, removed, updated
+
+class CatalogWatcher(QtCore.QObject):
+    """Vigila el fichero de catálogo (y su carpeta, por los guardados atómicos) y emite los cambios."""
+    changed = QtCore.pyqtSignal(dict, list, list)  # icons, entries, workspaces
+    failed = QtCore.pyqtSignal(str)
+
+    DEBOUNCE_MS = 300
+
+    def __init__(self, loader: CatalogLoader, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._schedule)
+        self._watcher.directoryChanged.connect(self._schedule)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._reload)
+        self._rewatch()
+
+    def _rewatch(self):
+        # un editor que guarda con rename deja de notificar sobre el fichero viejo: se vuelve a añadir
+        for p in (self.loader.path, os.path.dirname(self.loader.path)):
+            if os.path.exists(p) and p not in self._watcher.files() + self._watcher.directories():
+                self._watcher.addPath(p)
+
+    def _schedule(self, *_):
+        self._timer.start()
+
+    def _reload(self):
+        self._rewatch()
+        try:
+            icons, entries, workspaces, changed = self.loader.load()
+        except CatalogError as e:
+            log.warning("%s", e)
+            self.failed.emit(str(e))
+            return
+        if changed:
+            self.changed.emit(icons, entries, workspaces)
+
+# ----------------------------
+# Iconos asíncronos con caché de miniaturas (memoria LRU + disco)
+# ----------------------------
+# tamaños que se pintan: reposo, hover (pop) y pulsado
+ICON_SCALES = (1.0, 1.12, 0.9)
+
+def cache_dir(*parts) -> str:
+    """Carpeta de caché del launcher (PROGAIN_CACHE_DIR o la de caché del usuario)."""
+    base = os.environ.get("PROGAIN_CACHE_DIR") or QtCore.QStandardPaths.writableLocation(
+        QtCore.QStandardPaths.StandardLocation.CacheLocation) or os.path.join(tempfile.gettempdir(), "progain")
+    return os.path.join(base, *parts)
+
+def load_icon_images(path: str, pixel_sizes, thumbs_dir: str):
+    """Miniaturas de `path` a cada tamaño; usa/llena la caché de disco (clave: ruta, mtime y tamaño).
+
+    Solo usa QImage, así que se puede llamar desde un hilo de trabajo.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    digest = hashlib.blake2b(f"{path}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8"), digest_size=12).hexdigest()
+    images = []
+    source = None
+    for px in pixel_sizes:
+        thumb = os.path.join(thumbs_dir, f"{digest}_{px}.png")
+        img = QtGui.QImage(thumb) if os.path.exists(thumb) else QtGui.QImage()
+        if img.isNull():
+            if source is None:
+                source = QtGui.QImage(path)
+                if source.isNull():
+                    return []
+            img = source.scaled(px, px, QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                                QtCore.Qt.TransformationMode.SmoothTransformation)
+            try:
+                os.makedirs(thumbs_dir, exist_ok=True)
+                tmp = f"{thumb}.{os.getpid()}.tmp"
+                if img.save(tmp, "PNG"):
+                    os.replace(tmp, thumb)
+            except OSError:
+                pass  # la caché de disco es opcional (p. ej. perfil de solo lectura)
+        images.append(img)
+    return images
+
+class _IconJob(QtCore.QRunnable):
+    def __init__(self, key: str, path: str, pixel_sizes, thumbs_dir: str, done):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.pixel_sizes = pixel_sizes
+        self.thumbs_dir = thumbs_dir
+        self.done = done
+
+    def run(self):
+        images = []
+        try:
+            images = load_icon_images(self.path, self.pixel_sizes, self.thumbs_dir)
+        except Exception:
+            log.exception("Error decodificando icono %s", self.path)
+        finally:
+            self.done.emit(self.key, self.path, images)
+
+class IconService(QtCore.QObject):
+    """Entrega un placeholder al instante y decodifica los iconos reales en un pool propio.
+
+    Al llegar cada icono se guarda en una LRU en memoria y se emite iconReady(key) para que
+    la rejilla sustituya el placeholder. Las miniaturas escaladas quedan en disco.
+    """
+    iconReady = QtCore.pyqtSignal(str)
+    _decoded = QtCore.pyqtSignal(str, str, list)  # key, ruta, [QImage]
+
+    MEMORY_CACHE = 512
+    MAX_THREADS = 2
+
+    def __init__(self, parent=None, thumbs_dir: str = None):
+        super().__init__(parent)
+        self._sources = {}
+        self._icons = collections.OrderedDict()
+        self._pending = set()
+        screen = QtGui.QGuiApplication.primaryScreen()
+        self._dpr = screen.devicePixelRatio() if screen else 1.0
+        self.pixel_sizes = sorted({int(round(ICON_SIZE * s * self._dpr)) for s in ICON_SCALES})
+        self.thumbs_dir = thumbs_dir or cache_dir("icons")
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(self.MAX_THREADS)
+        pix = QtGui.QPixmap(ICON_SIZE, ICON_SIZE)
+        pix.fill(QtGui.QColor(0,0,0,0))
+        self.placeholder = QtGui.QIcon(pix)
+        self._decoded.connect(self._on_decoded)
+
+    def set_sources(self, names: dict):
+        """Mapa clave -> ruta (relativa a los recursos o absoluta). Las claves cuya ruta cambió se recargan."""
+        sources = {k: rel if os.path.isabs(rel) else resource_path(rel) for k, rel in names.items()}
+        for k in set(self._sources) | set(sources):
+            if self._sources.get(k) != sources.get(k):
+                self._icons.pop(k, None)
+        self._sources = sources
+
+    def icon(self, key: str) -> QtGui.QIcon:
+        ic = self._icons.get(key)
+        if ic is not None:
+            self._icons.move_to_end(key)
+            return ic
+        path = self._sources.get(key)
+        if path and key not in self._pending:
+            self._pending.add(key)
+            self._pool.start(_IconJob(key, path, self.pixel_sizes, self.thumbs_dir, self._decoded))
+        return self.placeholder
+
+    def preload(self, keys):
+        for k in keys:
+            self.icon(k)
+
+    @QtCore.pyqtSlot(str, str, list)
+    def _on_decoded(self, key: str, path: str, images: list):
+        self._pending.discard(key)
+        if self._sources.get(key) != path:
+            return  # la ruta cambió mientras se decodificaba; ya habrá otra petición
+        if images:
+            ic = QtGui.QIcon()
+            for img in images:
+                pm = QtGui.QPixmap.fromImage(img)
+                pm.setDevicePixelRatio(self._dpr)
+                ic.addPixmap(pm)
+        else:
+            ic = self.placeholder  # no existe o no se pudo leer: no reintentar en bucle
+        self._icons[key] = ic
+        while len(self._icons) > self.MEMORY_CACHE:
+            self._icons.popitem(last=False)
+        self.iconReady.emit(key)
+
+# ----------------------------
+# Animation manager: un solo timer para todas las animaciones de la rejilla
+# ----------------------------
+class _Tween:
+    """Interpolación escalar basada en reloj; se reutiliza desde el pool del AnimationManager."""
+    __slots__ = ("start", "end", "t0", "duration", "curve")
+
+    def __init__(self, start: float = 0.0, end: float = 0.0, duration_ms: int = 0, curve: QtCore.QEasingCurve = None):
+        self.reset(start, end, duration_ms, curve)
+
+    def reset(self, start: float, end: float, duration_ms: int, curve: QtCore.QEasingCurve):
+        self.start = start
+        self.end = end
+        self.t0 = time.monotonic()
+        self.duration = duration_ms / 1000.0
+        self.curve = curve
+        return self
+
+    def value(self, now: float) -> float:
+        p = (now - self.t0) / self.duration if self.duration > 0 else 1.0
+        if p >= 1.0:
+            return self.end
+        return self.start + (self.end - self.start) * self.curve.valueForProgress(max(0.0, p))
+
+    def done(self, now: float) -> bool:
+        return now - self.t0 >= self.duration
+
+_OUT_CUBIC = QtCore.QEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
+_IN_CUBIC = QtCore.QEasingCurve(QtCore.QEasingCurve.Type.InCubic)
+_LINEAR = QtCore.QEasingCurve(QtCore.QEasingCurve.Type.Linear)
+
+class AnimationManager(QtCore.QObject):
+    """Conduce todas las animaciones (icono, lift, sombra, ripple) desde un único tick.
+
+    - animate(target, attr, ...) interpola un atributo float de cualquier objeto; una nueva
+      animación del mismo (target, attr) reemplaza a la anterior (como stop() + start()).
+    - request_frames(client) para vistas que evalúan su estado al pintar (rejilla virtual):
+      se llama a client.on_animation_frame(now) en cada tick mientras devuelva True.
+    - Los _Tween se reciclan en un pool: un tile en reposo no tiene ningún objeto de animación
+      y un click no reserva objetos nuevos una vez el pool está caliente.
+    PROGAIN_ANIM_STATS=1 registra periódicamente en progain.log las animaciones activas y el coste
+    medio/máximo por frame.
+    """
+    FRAME_MS = 16
+    STATS_LOG_SECONDS = 5.0
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "AnimationManager":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tweens = {}    # (id(target), attr) -> [target, attr, tween, on_done]
+        self._clients = {}   # id(client) -> client
+        self._pool = []
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(self.FRAME_MS)
+        self._timer.timeout.connect(self._tick)
+        self.frames = 0
+        self.frame_cost_ms = 0.0       # media móvil exponencial del coste de un tick
+        self.max_frame_cost_ms = 0.0
+        self.frame_interval_ms = float(self.FRAME_MS)  # media móvil del intervalo real entre ticks
+        self._last_tick = None
+        self._frame_listeners = []
+        self._log_stats = os.environ.get("PROGAIN_ANIM_STATS", "") not in ("", "0")
+        self._last_log = time.monotonic()
+
+    # --- pool ---
+    def acquire(self, start: float, end: float, duration_ms: int, curve=_OUT_CUBIC) -> _Tween:
+        tw = self._pool.pop() if self._pool else _Tween()
+        return tw.reset(start, end, duration_ms, curve)
+
+    def release(self, tween: _Tween):
+        if tween is not None:
+            self._pool.append(tween)
+
+    # --- API ---
+    def animate(self, target, attr: str, start: float, end: float, duration_ms: int, curve=_OUT_CUBIC,
+                on_done=None):
+        key = (id(target), attr)
+        slot = self._tweens.get(key)
+        if slot is None:
+            self._tweens[key] = [target, attr, self.acquire(start, end, duration_ms, curve), on_done]
+        else:
+            slot[2].reset(start, end, duration_ms, curve)
+            slot[3] = on_done
+        self._ensure_running()
+
+    def stop(self, target, attr: str):
+        slot = self._tweens.pop((id(target), attr), None)
+        if slot is not None:
+            self.release(slot[2])
+
+    def request_frames(self, client):
+        self._clients[id(client)] = client
+        self._ensure_running()
+
+    def add_frame_listener(self, callback):
+        """callback(interval_ms) tras cada tick con animaciones en curso (ver MotionQuality)."""
+        self._frame_listeners.append(callback)
+
+    def _ensure_running(self):
+        if not self._timer.isActive():
+            self._last_tick = None
+            self._timer.start()
+
+    def active_count(self) -> int:
+        return len(self._tweens) + len(self._clients)
+
+    def stats(self) -> dict:
+        return {
+            "active_tweens": len(self._tweens),
+            "active_clients": len(self._clients),
+            "pooled": len(self._pool),
+            "frames": self.frames,
+            "frame_ms_avg": round(self.frame_cost_ms, 3),
+            "frame_ms_max": round(self.max_frame_cost_ms, 3),
+            "frame_interval_ms": round(self.frame_interval_ms, 2),
+        }
+
+    def _tick(self):
+        t0 = time.perf_counter()
+        now = time.monotonic()
+        # el intervalo real entre ticks incluye el pintado que Qt hizo entre medias:
+        # si la máquina no llega, crece por encima de FRAME_MS
+        interval = (now - self._last_tick) * 1000.0 if self._last_tick is not None else None
+        self._last_tick = now
+        finished = []
+        for key, slot in self._tweens.items():
+            target, attr, tween = slot[0], slot[1], slot[2]
+            try:
+                setattr(target, attr, tween.value(now))
+            except RuntimeError:
+                # el widget se destruyó a mitad de animación
+                finished.append((key, False))
+                continue
+            if tween.done(now):
+                finished.append((key, True))
+        for key, completed in finished:
+            slot = self._tweens.pop(key)
+            self.release(slot[2])
+            if completed and slot[3] is not None:
+                slot[3]()
+        for cid, client in list(self._clients.items()):
+            try:
+                keep = client.on_animation_frame(now)
+            except RuntimeError:
+                keep = False
+            if not keep:
+                del self._clients[cid]
+        if not self._tweens and not self._clients:
+            self._timer.stop()
+
+        cost = (time.perf_counter() - t0) * 1000.0
+        self.frames += 1
+        self.frame_cost_ms += (cost - self.frame_cost_ms) * 0.1
+        self.max_frame_cost_ms = max(self.max_frame_cost_ms, cost)
+        if interval is not None:
+            self.frame_interval_ms += (interval - self.frame_interval_ms) * 0.1
+            for cb in self._frame_listeners:
+                cb(interval)
+        if self._log_stats and now - self._last_log >= self.STATS_LOG_SECONDS:
+            self._last_log = now
+            log.info("animaciones %s", json.dumps(self.stats()))
+
+class MotionQuality(QtCore.QObject):
+    """Nivel de calidad de las animaciones, ajustado según el intervalo de frame medido.
+
+    Niveles (de más a menos caro); cada bajada quita un efecto:
+      3 FULL       hover pop + lift + blur animado de la sombra + ripple
+      2 NO_SHADOW  la sombra salta al valor final sin animarse
+      1 NO_RIPPLE  sin ripple al hacer click
+      0 MINIMAL    sin lift (maximumSize fijo); solo el pop del icono
+
+    En modo automático se baja un nivel cuando el intervalo medio supera el presupuesto durante
+    DOWN_FRAMES frames seguidos, y se sube cuando hay margen durante UP_FRAMES (histéresis para
+    no oscilar). PROGAIN_MOTION (o la clave "motion/level" de QSettings) fija el nivel:
+    auto | full | reduced | 0..3.
+    """
+    FULL, NO_SHADOW, NO_RIPPLE, MINIMAL = 3, 2, 1, 0
+    NAMES = {3: "full", 2: "no-shadow", 1: "no-ripple", 0: "minimal"}
+    ENV = "PROGAIN_MOTION"
+
+    BUDGET_MS = AnimationManager.FRAME_MS * 1.5     # por encima: la animación ya se nota a saltos
+    HEADROOM_MS = AnimationManager.FRAME_MS * 1.15  # por debajo: hay margen para subir
+    DOWN_FRAMES = 12
+    UP_FRAMES = 180
+    SMOOTHING = 0.25
+
+    levelChanged = QtCore.pyqtSignal(int)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "MotionQuality":
+        if cls._instance is None:
+            cls._instance = cls(AnimationManager.instance())
+        return cls._instance
+
+    def __init__(self, manager: AnimationManager, parent=None):
+        super().__init__(parent)
+        self.pinned = self.configured_level()
+        self.level = self.FULL if self.pinned is None else self.pinned
+        self._avg = float(AnimationManager.FRAME_MS)
+        self._over = 0
+        self._under = 0
+        if self.pinned is None:
+            manager.add_frame_listener(self._on_frame)
+        else:
+            log.info("calidad de animación fijada en %s", self.NAMES[self.pinned])
+
+    @classmethod
+    def configured_level(cls):
+        """Nivel fijado por el administrador o None para modo automático."""
+        raw = os.environ.get(cls.ENV, "").strip().lower()
+        if not raw:
+            raw = str(QtCore.QSettings().value("motion/level", "") or "").strip().lower()
+        if raw in ("", "auto"):
+            return None
+        if raw == "full":
+            return cls.FULL
+        if raw in ("reduced", "minimal", "none"):
+            return cls.MINIMAL
+        try:
+            return max(cls.MINIMAL, min(cls.FULL, int(raw)))
+        except ValueError:
+            log.warning("%s=%r no reconocido; se usa auto", cls.ENV, raw)
+            return None
+
+    @property
+    def shadow(self) -> bool:
+        return self.level >= self.FULL
+
+    @property
+    def ripple(self) -> bool:
+        return self.level >= self.NO_SHADOW
+
+    @property
+    def lift(self) -> bool:
+        return self.level >= self.NO_RIPPLE
+
+    def _on_frame(self, interval_ms: float):
+        self._avg += (interval_ms - self._avg) * self.SMOOTHING
+        if self._avg > self.BUDGET_MS:
+            self._over += 1
+            self._under = 0
+            if self._over >= self.DOWN_FRAMES and self.level > self.MINIMAL:
+                self._set_level(self.level - 1)
+        elif self._avg < self.HEADROOM_MS:
+            self._under += 1
+            self._over = 0
+            if self._under >= self.UP_FRAMES and self.level < self.FULL:
+                self._set_level(self.level + 1)
+        else:
+            self._over = self._under = 0
+
+    def _set_level(self, level: int):
+        log.info("calidad de animación %s -> %s (frame medio %.1f ms)",
+                 self.NAMES[self.level], self.NAMES[level], self._avg)
+        self.level = level
+        self._over = self._under = 0
+        # tras cambiar de nivel se vuelve a medir desde el presupuesto nominal
+        self._avg = float(AnimationManager.FRAME_MS)
+        self.levelChanged.emit(level)
+
 # ----------------------------
 # Ripple overlay (animatable)
 # ----------------------------
@@ -96,6 +1032,8 @@ class RippleOverlay(QtWidgets.QWidget):
         super().__init__(parent)
         self._radius = 0
         self._opacity = 0.0
+        self._progress = 0.0
+        self._max_radius = 100
         self.color = color
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self.hide()
@@ -133,32 +1071,28 @@ class RippleOverlay(QtWidgets.QWidget):
         self._opacity = v
         self.update()
 
+    @property
+    def progress(self) -> float:
+        return self._progress
+
+    @progress.setter
+    def progress(self, p: float):
+        # mismas curvas que antes: radio OutCubic en el 90% de la duración, opacidad 0.7 -> 0.25 (60%) -> 0
+        self._progress = p
+        self._radius = self._max_radius * _OUT_CUBIC.valueForProgress(min(1.0, p / 0.9))
+        self._opacity = 0.7 - 0.45 * (p / 0.6) if p < 0.6 else 0.25 * (1.0 - (p - 0.6) / 0.4)
+        self.update()
+
     def start(self, max_radius=100, duration=420):
         self.show()
         self.raise_()
-        group = QtCore.QParallelAnimationGroup(self)
-        a1 = QtCore.QPropertyAnimation(self, b"radius", self)
-        a1.setStartValue(0.0)
-        a1.setEndValue(max_radius)
-        a1.setDuration(int(duration * 0.9))
-        a1.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
-
-        a2 = QtCore.QPropertyAnimation(self, b"rippleOpacity", self)
-        a2.setStartValue(0.7)
-        a2.setKeyValueAt(0.6, 0.25)
-        a2.setEndValue(0.0)
-        a2.setDuration(duration)
-
-        group.addAnimation(a1)
-        group.addAnimation(a2)
-
-        def on_finish():
-            self.hide()
-            self.radius = 0
-            self.rippleOpacity = 0.0
+        self._max_radius = max_radius
+        AnimationManager.instance().animate(self, "progress", 0.0, 1.0, duration, _LINEAR, on_done=self._on_finish)
 
-        group.finished.connect(on_finish)
-        group.start(QtCore.QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+    def _on_finish(self):
+        self.hide()
+        self.radius = 0
+        self.rippleOpacity = 0.0
 
 # ----------------------------
 # Loading Overlay (Añadido para el efecto de carga)
@@ -190,9 +1124,328 @@ class LoadingOverlay(QtWidgets.QWidget):
             self.setGeometry(self.parentWidget().rect())
         super().resizeEvent(event)
         
+# ----------------------------
+# Spawner: proceso auxiliar pequeño que hace el posix_spawn en lugar de la GUI
+# ----------------------------
+SPAWNER_ENV = "PROGAIN_SPAWNER"
+SPAWNER_SCRIPT = "progain_spawner.py"
+
+class SpawnerUnavailable(Exception):
+    """El spawner no está arrancado o murió sin recibir la petición; se lanza directamente con Popen."""
+
+class SpawnerTimeout(Exception):
+    """La petición llegó al spawner pero no respondió a tiempo. El hijo puede estar ya lanzado, así
+    que no se reintenta con Popen (se lanzaría dos veces): se informa como fallo del lanzamiento."""
+
+class SpawnedProcess:
+    """Hijo lanzado por progain_spawner. Ofrece lo que ProcessSupervisor usa de Popen (pid, poll)."""
+    __slots__ = ("pid", "returncode", "_client")
+
+    def __init__(self, pid: int, client: "SpawnerClient"):
+        self.pid = pid
+        self.returncode = None
+        self._client = client
+
+    def poll(self):
+        if self.returncode is None and not self._client.alive:
+            # sin spawner nadie nos avisará de la salida: se comprueba si el PID sigue vivo
+            try:
+                os.kill(self.pid, 0)
+            except ProcessLookupError:
+                self.returncode = -1
+            except OSError:
+                pass
+        return self.returncode
+
+class SpawnerClient:
+    """Habla con progain_spawner.py por stdin/stdout (una línea JSON por mensaje).
+
+    Se arranca una vez al inicio (PROGAIN_SPAWNER=1, solo POSIX y sin empaquetar). spawn() es
+    seguro desde varios workers del LaunchScheduler a la vez: cada petición lleva un id y un
+    hilo lector reparte las respuestas y los avisos de salida de los hijos.
+    """
+    TIMEOUT = 5.0
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """El cliente arrancado con start_if_enabled(), o None para lanzar con Popen."""
+        inst = cls._instance
+        return inst if inst is not None and inst.alive else None
+
+    @classmethod
+    def start_if_enabled(cls):
+        if os.environ.get(SPAWNER_ENV, "") in ("", "0"):
+            return None
+        script = os.path.join(app_dir(), SPAWNER_SCRIPT)
+        if not hasattr(os, "posix_spawn") or getattr(sys, "frozen", False) or not os.path.isfile(script):
+            log.info("spawner no disponible en esta plataforma/instalación; se usa Popen")
+            return None
+        try:
+            cls._instance = cls(script)
+        except OSError as e:
+            log.error("no se pudo arrancar el spawner: %s", e)
+            return None
+        return cls._instance
+
+    def __init__(self, script: str):
+        self.proc = subprocess.Popen([sys.executable, "-S", script], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     text=True, encoding="utf-8", bufsize=1)
+        self.alive = True
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending = {}   # id -> [threading.Event, respuesta]
+        self._procs = {}     # pid -> SpawnedProcess
+        self._early_exits = {}  # pid -> code (salida leída antes que la respuesta del spawn)
+        threading.Thread(target=self._read, name="spawner-reader", daemon=True).start()
+        log.info("spawner arrancado pid=%d", self.proc.pid)
+
+    def spawn(self, argv, cwd: str = None, env: dict = None, output: str = None) -> SpawnedProcess:
+        """`output`: ruta (FIFO) a la que el spawner redirige stdout y stderr del hijo."""
+        req_id = next(self._ids)
+        slot = [threading.Event(), None]
+        with self._lock:
+            if not self.alive:
+                raise SpawnerUnavailable("spawner detenido")
+            self._pending[req_id] = slot
+            try:
+                msg = {"id": req_id, "argv": list(argv), "cwd": cwd, "env": env}
+                if output:
+                    msg["output"] = output
+                self.proc.stdin.write(json.dumps(msg) + "\n")
+                self.proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                del self._pending[req_id]
+                raise SpawnerUnavailable(str(e)) from e
+        if not slot[0].wait(self.TIMEOUT):
+            with self._lock:
+                self._pending.pop(req_id, None)
+            raise SpawnerTimeout(f"el spawner no respondió en {self.TIMEOUT:g} s; puede que se haya lanzado igualmente")
+        reply = slot[1]
+        if reply is None:
+            raise SpawnerUnavailable("spawner detenido")
+        if "pid" not in reply:
+            raise OSError(reply.get("errno") or 0, reply.get("error", "error al lanzar"), argv[0])
+        return self._register(reply["pid"])
+
+    def _register(self, pid: int) -> SpawnedProcess:
+        with self._lock:
+            sp = SpawnedProcess(pid, self)
+            if pid in self._early_exits:
+                sp.returncode = self._early_exits.pop(pid)
+            else:
+                self._procs[pid] = sp
+            return sp
+
+    def _read(self):
+        for line in self.proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue
+            with self._lock:
+                if msg.get("event") == "exit":
+                    sp = self._procs.pop(msg["pid"], None)
+                    if sp is not None:
+                        sp.returncode = msg["code"]
+                    else:
+                        self._early_exits[msg["pid"]] = msg["code"]
+                    continue
+                slot = self._pending.pop(msg.get("id"), None)
+            if slot is not None:
+                slot[1] = msg
+                slot[0].set()
+        # EOF: el spawner murió; quien espere una respuesta cae a Popen
+        with self._lock:
+            self.alive = False
+            pending, self._pending = self._pending, {}
+        for slot in pending.values():
+            slot[0].set()
+        log.warning("el spawner terminó; los lanzamientos vuelven a Popen")
+
+    def close(self):
+        with self._lock:
+            self.alive = False
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+
+# ----------------------------
+# Salida (stdout/stderr) de los programas lanzados: captura a logs rotativos
+# ----------------------------
+OUTPUT_DIR = "progain_output"
+CAPTURE_ENV = "PROGAIN_CAPTURE"
+
+def output_log_path(key: str) -> str:
+    """Log de salida de una entrada (uno por key) en progain_output/, junto a progain.log."""
+    safe = re.sub(r"[^0-9A-Za-z_.-]+", "_", key).strip("._") or "_"
+    if safe != key:  # "a b" y "a_b" no comparten fichero
+        safe += "-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(os.path.dirname(os.path.abspath(LOG_FILE)), OUTPUT_DIR, safe + ".log")
+
+class OutputLog:
+    """Log de salida de una entrada con tamaño acotado: al pasar de max_bytes se rota a .1, .2
+    (como RotatingFileHandler). Todas las instancias vivas del programa escriben en el mismo
+    OutputLog; el fichero solo está abierto mientras alguna tenga la salida abierta.
+    El tamaño por defecto es PROGAIN_OUTPUT_MB (DEFAULT_MB) megas."""
+    SIZE_ENV = "PROGAIN_OUTPUT_MB"
+    DEFAULT_MB = 2
+    BACKUPS = 2
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, key: str) -> "OutputLog":
+        path = output_log_path(key)
+        with cls._registry_lock:
+            out = cls._registry.get(path)
+            if out is None:
+                out = cls._registry[path] = cls(path)
+            return out
+
+    def __init__(self, path: str, max_bytes: int = None):
+        self.path = path
+        if max_bytes is None:
+            try:
+                max_bytes = int(float(os.environ.get(self.SIZE_ENV, "") or self.DEFAULT_MB) * 2**20)
+            except ValueError:
+                log.warning("%s inválido; se usa %d", self.SIZE_ENV, self.DEFAULT_MB)
+                max_bytes = self.DEFAULT_MB * 2**20
+        self.max_bytes = max(4096, max_bytes)
+        self._lock = threading.Lock()
+        self._f = None
+        self._size = 0
+        self._writers = 0
+
+    def open(self):
+        with self._lock:
+            if self._f is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._f = open(self.path, "ab", buffering=0)  # cada bloque es un write(): el visor lo ve ya
+                self._size = os.fstat(self._f.fileno()).st_size
+            self._writers += 1
+
+    def close(self):
+        with self._lock:
+            self._writers -= 1
+            if self._writers <= 0 and self._f is not None:
+                self._f.close()
+                self._f = None
+
+    def write(self, data: bytes):
+        with self._lock:
+            if self._f is None:
+                return
+            if len(data) > self.max_bytes:
+                data = data[-self.max_bytes:]
+            if self._size and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._f.write(data)
+            self._size += len(data)
+
+    def _rotate(self):
+        self._f.close()
+        try:
+            for i in range(self.BACKUPS, 0, -1):
+                src = f"{self.path}.{i - 1}" if i > 1 else self.path
+                if os.path.exists(src):
+                    os.replace(src, f"{self.path}.{i}")
+            self._f = open(self.path, "ab", buffering=0)
+        except OSError as e:
+            # Windows: otro proceso tiene el fichero abierto; se vacía en lugar de rotarlo
+            log.warning("no se pudo rotar %s: %s", self.path, e)
+            self._f = open(self.path, "wb", buffering=0)
+        self._size = 0
+
+class OutputCapture:
+    """Hilo lector de la salida (stdout + stderr) de un hijo.
+
+    Vacía la tubería en bloques de hasta CHUNK bytes hacia el OutputLog de la entrada, así un
+    programa muy hablador nunca se bloquea con la tubería llena. Termina con el EOF (el hijo, y
+    los nietos que heredaron la salida, la cerraron).
+    PROGAIN_CAPTURE=0 (o "capture": false en la entrada) deja que el programa herede la consola
+    del launcher.
+    """
+    CHUNK = 65536
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get(CAPTURE_ENV, "1").strip() != "0"
+
+    def __init__(self, fd: int, key: str, pid: int, argv):
+        self.fd = fd
+        self.out = OutputLog.for_key(key)
+        try:
+            self.out.open()
+        except OSError as e:
+            # la tubería se sigue vaciando aunque no haya dónde guardarla
+            log.warning("no se puede escribir %s: %s; se descarta la salida", self.out.path, e)
+            self.out = None
+        else:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            self.out.write(f"\n=== {stamp} pid {pid}: {subprocess.list2cmdline(argv)} ===\n".encode("utf-8"))
+        self.thread = threading.Thread(target=self._run, name=f"progain-output-{pid}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            while True:
+                try:
+                    data = os.read(self.fd, self.CHUNK)
+                except OSError:
+                    break
+                if not data:
+                    break
+                if self.out is not None:
+                    try:
+                        self.out.write(data)
+                    except OSError as e:
+                        # disco lleno, etc.: se sigue vaciando la tubería para no bloquear al hijo
+                        log.warning("captura de salida (%s): %s; se descarta el resto", self.out.path, e)
+                        self.out.close()
+                        self.out = None
+        finally:
+            os.close(self.fd)
+            if self.out is not None:
+                self.out.close()
+
+_fifo_ids = itertools.count(1)
+
+def open_output_fifo():
+    """FIFO para la salida de un hijo lanzado por el spawner (POSIX): (ruta, fd lectura, fd escritura).
+
+    El fd de escritura propio evita que el lector vea EOF antes de que el hijo abra su extremo; se
+    cierra en cuanto el spawner contesta (el hijo ya lo abrió en posix_spawn, antes del exec).
+    """
+    path = os.path.join(tempfile.gettempdir(), f"progain-out-{os.getpid()}-{next(_fifo_ids)}")
+    os.mkfifo(path, 0o600)
+    fds = []
+    try:
+        fds.append(os.open(path, os.O_RDONLY | os.O_NONBLOCK))
+        fds.append(os.open(path, os.O_WRONLY))
+        os.set_blocking(fds[0], True)
+    except OSError:
+        for fd in fds:
+            os.close(fd)
+        os.unlink(path)
+        raise
+    return path, fds[0], fds[1]
+
 # ----------------------------
 # Subclase QRunnable (CORRECCIÓN con Señal de Finalización)
 # ----------------------------
+def resolve_entry_path(path: str, cwd: str = None) -> str:
+    """Ruta de un fichero de la entrada (exe, datos): variables expandidas y relativa a su carpeta de
+    trabajo, si la tiene, o al cwd del launcher."""
+    path = os.path.expandvars(path)
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.expandvars(cwd) if cwd else os.getcwd(), path)
+
 class LauncherTask(QtCore.QRunnable):
     """Tarea que envuelve el lanzamiento de un subproceso y maneja errores."""
 
@@ -200,27 +1453,66 @@ class LauncherTask(QtCore.QRunnable):
     class Signals(QtCore.QObject):
         finished = QtCore.pyqtSignal() # Señal emitida al finalizar la ejecución
 
-    def __init__(self, exe_name: str, parent=None):
+    def __init__(self, exe_name: str, parent=None, args=(), cwd: str = None, env: dict = None,
+                 supervisor: "ProcessSupervisor" = None, key: str = None, trace: "LaunchTrace" = None,
+                 path: str = None, resolver: "ExeResolver" = None, capture: bool = True):
         super().__init__()
         self.exe_name = exe_name
+        # ruta ya resuelta por ExeResolver: el worker no busca nada en disco antes del Popen
+        self.path = path
+        self.resolver = resolver
+        self.capture = capture and OutputCapture.enabled()
+        self.args = list(args)
+        self.cwd = os.path.expandvars(cwd) if cwd else None
+        self.env = env
         self.mainWindow = parent
+        self.supervisor = supervisor
+        self.key = key or exe_name
+        self.trace = trace
         self.signals = self.Signals() # Instancia de la clase de señales
         
     @QtCore.pyqtSlot()
     def run(self):
         """El método que se ejecuta cuando se inicia la tarea en el QThreadPool."""
         
+        if self.trace is not None:
+            self.trace.worker = time.monotonic()
         # El bloque finally garantiza que la señal 'finished' se emita siempre.
         try:
-            # Asegurar la ruta
-            if not os.path.isabs(self.exe_name):
-                path = os.path.join(os.getcwd(), self.exe_name)
-            else:
-                path = self.exe_name
-                
-            # Lanzamiento del programa
-            subprocess.Popen([path], shell=False)
-            
+            # sin ruta en caché (click antes del primer sondeo) se resuelve aquí, en el worker
+            path = self.path or resolve_exe(self.exe_name, self.cwd).path or resolve_entry_path(self.exe_name, self.cwd)
+
+            env = None
+            if self.env:
+                env = os.environ.copy()
+                env.update({k: str(v) for k, v in self.env.items()})
+
+            # Lanzamiento del programa (vía spawner si está arrancado); el supervisor se queda con
+            # el handle (PID, código de salida)
+            argv = [path] + self.args
+            proc = None
+            spawner = SpawnerClient.instance()
+            if spawner is not None:
+                try:
+                    proc = self._spawn_via(spawner, argv, env)
+                except SpawnerUnavailable as e:
+                    log.warning("spawner: %s; se lanza %s con Popen", e, self.exe_name)
+            if proc is None:
+                if self.capture:
+                    # stdout y stderr en una sola tubería que vacía un hilo lector (OutputCapture)
+                    proc = subprocess.Popen(argv, shell=False, cwd=self.cwd, env=env, stdin=subprocess.DEVNULL,
+                                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                    OutputCapture(os.dup(proc.stdout.fileno()), self.key, proc.pid, argv)
+                    proc.stdout.close()
+                else:
+                    proc = subprocess.Popen(argv, shell=False, cwd=self.cwd, env=env)
+            if self.trace is not None:
+                self.trace.spawned = time.monotonic()
+                self.trace.pid = proc.pid
+            if self.supervisor is not None:
+                self.supervisor.track(self.key, self.exe_name, proc)
+            return
+
         except FileNotFoundError:
             # Invocar show_warning en el hilo principal
             QtCore.QMetaObject.invokeMethod(
@@ -230,6 +1522,12 @@ class LauncherTask(QtCore.QRunnable):
                 QtCore.Q_ARG(str, "No encontrado"), 
                 QtCore.Q_ARG(str, f"No se encontró: {self.exe_name}") 
             )
+            if self.resolver is not None:
+                # la caché estaba desfasada: se vuelve a sondear ya (el tile pasa a no disponible)
+                QtCore.QMetaObject.invokeMethod(self.resolver, "refresh", QtCore.Qt.ConnectionType.QueuedConnection,
+                                                QtCore.Q_ARG(str, self.key))
+            if self.supervisor is not None:
+                self.supervisor.spawn_failed(self.key)
         except Exception as e:
             # Invocar show_critical en el hilo principal
             QtCore.QMetaObject.invokeMethod(
@@ -239,263 +1537,4069 @@ class LauncherTask(QtCore.QRunnable):
                 QtCore.Q_ARG(str, "Error"), 
                 QtCore.Q_ARG(str, f"Ocurrió un error al lanzar {self.exe_name}:\n{e}") 
             )
+            if self.supervisor is not None:
+                self.supervisor.spawn_failed(self.key)
         finally:
             # ¡CRÍTICO! Emitir la señal al finalizar, sin importar si hubo error o éxito
             self.signals.finished.emit() 
 
+    def _spawn_via(self, spawner: SpawnerClient, argv, env):
+        if not self.capture:
+            return spawner.spawn(argv, cwd=self.cwd, env=env)
+        fifo, rfd, wfd = open_output_fifo()
+        try:
+            proc = spawner.spawn(argv, cwd=self.cwd, env=env, output=fifo)
+        except BaseException:
+            os.close(rfd)
+            raise
+        finally:
+            os.close(wfd)
+            os.unlink(fifo)
+        OutputCapture(rfd, self.key, proc.pid, argv)
+        return proc
+
 # ----------------------------
-# Launcher Tile with improved hover animations
+# Resolución de ejecutables: caché por entrada revalidada en segundo plano
 # ----------------------------
-class LauncherTile(QtWidgets.QWidget):
-    clicked = QtCore.pyqtSignal(object)  # emits self
-    def __init__(self, icon: QtGui.QIcon, label: str, exe: str, parent=None):
-        super().__init__(parent)
-        self.setObjectName("launcherTile")
-        self.setProperty("selected", "false")
-        self.exe = exe
-        self.icon = icon
-        self.label_text = label
+def exe_candidates(exe: str, cwd: str = None):
+    """Rutas donde buscar el ejecutable de una entrada, en orden, y carpetas cuyo mtime invalida un
+    "no encontrado": relativa al cwd de la entrada (o al del launcher), a la base de resource_path
+    (carpeta del bundle) y, si es un nombre sin carpeta, cada directorio del PATH."""
+    exe = os.path.expandvars(exe)
+    if os.path.isabs(exe):
+        return [exe], [os.path.dirname(exe)]
+    paths = [resolve_entry_path(exe, cwd), resource_path(exe)]
+    if os.path.basename(exe) == exe:
+        names = [exe]
+        if sys.platform == "win32" and not os.path.splitext(exe)[1]:
+            names += [exe + ext.lower() for ext in os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").split(";") if ext]
+        for d in os.environ.get("PATH", "").split(os.pathsep):
+            if d:
+                paths.extend(os.path.join(d, n) for n in names)
+    paths = list(dict.fromkeys(os.path.normpath(p) for p in paths))
+    return paths, list(dict.fromkeys(os.path.dirname(p) for p in paths))
 
-        self._icon_size = QtCore.QSize(ICON_SIZE, ICON_SIZE)
-        self._build_ui()
-        self.setFixedSize(TILE_W, TILE_H)
+def _stat_signature(path: str):
+    """(mtime, tamaño, inodo) del fichero; None si no existe o no es un ejecutable."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path) or (os.name == "posix" and not os.access(path, os.X_OK)):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
 
-        # shadow effect
-        self.shadow = QtWidgets.QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(14)
-        self.shadow.setOffset(0, 6)
-        self.shadow.setColor(QtGui.QColor(0,0,0,180))
-        # add shadow to internal wrapper so shadow doesn't clip
-        self.setGraphicsEffect(self.shadow)
-
-        # ripple
-        self.ripple = RippleOverlay(self, QtGui.QColor(255,255,255,100))
-        self.ripple.setGeometry(0, 0, TILE_W, TILE_H)
-
-        # hover animation group (pop + lift + label color)
-        self._hover_group = QtCore.QParallelAnimationGroup(self)
-        # icon size animation
-        self._icon_anim = QtCore.QPropertyAnimation(self, b"iconSize")
-        self._icon_anim.setDuration(200)
-        self._icon_anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
-        self._hover_group.addAnimation(self._icon_anim)
-        # maximumSize animation (simulate lift without changing layout drastically)
-        self._size_anim = QtCore.QPropertyAnimation(self, b"maximumSize")
-        self._size_anim.setDuration(200)
-        self._size_anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
-        self._hover_group.addAnimation(self._size_anim)
-        # shadow blur animation
-        self._shadow_anim = QtCore.QPropertyAnimation(self.shadow, b"blurRadius")
-        self._shadow_anim.setDuration(200)
-        self._shadow_anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
-        self._hover_group.addAnimation(self._shadow_anim)
-
-        # reverse group for leaving (we'll reuse by setting start/end appropriately)
-        self._leave_group = QtCore.QParallelAnimationGroup(self)
-        self._leave_icon_anim = QtCore.QPropertyAnimation(self, b"iconSize")
-        self._leave_icon_anim.setDuration(180)
-        self._leave_icon_anim.setEasingCurve(QtCore.QEasingCurve.Type.InCubic)
-        self._leave_group.addAnimation(self._leave_icon_anim)
-        self._leave_size_anim = QtCore.QPropertyAnimation(self, b"maximumSize")
-        self._leave_size_anim.setDuration(180)
-        self._leave_size_anim.setEasingCurve(QtCore.QEasingCurve.Type.InCubic)
-        self._leave_group.addAnimation(self._leave_size_anim)
-        self._leave_shadow_anim = QtCore.QPropertyAnimation(self.shadow, b"blurRadius")
-        self._leave_shadow_anim.setDuration(180)
-        self._leave_shadow_anim.setEasingCurve(QtCore.QEasingCurve.Type.InCubic)
-        self._leave_group.addAnimation(self._leave_shadow_anim)
+def _dir_signature(dirs) -> tuple:
+    sig = []
+    for d in dirs:
+        try:
+            sig.append(os.stat(d).st_mtime_ns)
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
 
-        # focus & keyboard
-        self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
+class ExeResolution:
+    """Resultado cacheado de una entrada: ruta encontrada (o None) y firmas para revalidarla."""
+    __slots__ = ("path", "sig", "dirs", "dir_sig")
 
-    def _build_ui(self):
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(8,8,8,6)
-        layout.setSpacing(6)
-        self.toolbtn = QtWidgets.QToolButton()
-        self.toolbtn.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
-        self.toolbtn.setIcon(self.icon)
-        self.toolbtn.setIconSize(self._icon_size)
-        self.toolbtn.setText(self.label_text)
-        self.toolbtn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-        # forward clicks from toolbtn to tile clicked
-        self.toolbtn.clicked.connect(lambda: self.clicked.emit(self))
-        # label under icon (for hover color change)
-        self.lbl = QtWidgets.QLabel(self.label_text)
-        self.lbl.setObjectName("tileLabel")
-        self.lbl.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.toolbtn, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.lbl)
+    def __init__(self, path: str = None, sig=None, dirs=(), dir_sig=()):
+        self.path = path
+        self.sig = sig
+        self.dirs = tuple(dirs)
+        self.dir_sig = dir_sig
 
-        # badge
-        self.badge = QtWidgets.QLabel("", self)
-        self.badge.setObjectName("badge")
-        self.badge.setProperty("class", "badge")
-        self.badge.setVisible(False)
-        self.badge.setStyleSheet("QLabel.badge { background: #ff4d4f; color: white; border-radius: 9px; padding: 2px 6px; font-size: 10px; font-weight: 700; }")
-        self.badge.move(self.width() - 36, 8)
+    @property
+    def available(self) -> bool:
+        return self.path is not None
 
-    # property to animate icon size (for micro-interaction)
-    @QtCore.pyqtProperty(QtCore.QSize)
-    def iconSize(self):
-        return self._icon_size
+def resolve_exe(exe: str, cwd: str = None, previous: ExeResolution = None) -> ExeResolution:
+    """Resuelve (o revalida contra `previous`) el ejecutable; solo hace stat, nunca lo abre.
 
-    @iconSize.setter
-    def iconSize(self, size: QtCore.QSize):
-        self._icon_size = size
-        self.toolbtn.setIconSize(size)
+    Encontrado: basta un stat del fichero; si sigue igual no se busca de nuevo. No encontrado: se
+    vuelve a buscar solo si cambió el mtime de alguna carpeta candidata.
+    """
+    if previous is not None and previous.path is not None:
+        sig = _stat_signature(previous.path)
+        if sig is not None:
+            return previous if sig == previous.sig else ExeResolution(previous.path, sig, previous.dirs)
+    paths, dirs = exe_candidates(exe, cwd)
+    dir_sig = _dir_signature(dirs)
+    if previous is not None and previous.path is None and previous.dirs == tuple(dirs) and previous.dir_sig == dir_sig:
+        return previous
+    for p in paths:
+        sig = _stat_signature(p)
+        if sig is not None:
+            return ExeResolution(p, sig, dirs)
+    return ExeResolution(None, None, dirs, dir_sig)
 
-    def set_selected(self, state: bool):
-        self.setProperty("selected", "true" if state else "false")
-        self.style().unpolish(self); self.style().polish(self); self.update()
+class ExeProbeTask(QtCore.QRunnable):
+    """Un sondeo de una entrada en el pool de ExeResolver."""
+
+    class Signals(QtCore.QObject):
+        done = QtCore.pyqtSignal(str, int, object)  # key, generación, ExeResolution (None = error)
+
+    def __init__(self, key: str, gen: int, exe: str, cwd: str, previous: ExeResolution):
+        super().__init__()
+        self.key = key
+        self.gen = gen
+        self.exe = exe
+        self.cwd = cwd
+        self.previous = previous
+        self.signals = ExeProbeTask.Signals()
+
+    def run(self):
+        try:
+            result = resolve_exe(self.exe, self.cwd, self.previous)
+        except Exception as e:  # rutas con caracteres inválidos, etc.
+            log.warning("resolución de %s: %s", self.exe, e)
+            result = None
+        self.signals.done.emit(self.key, self.gen, result)
+
+class ExeResolver(QtCore.QObject):
+    """Caché de la ruta del ejecutable de cada entrada, revalidada en segundo plano.
+
+    - Cada entrada se resuelve una vez al cargar el catálogo (ver resolve_exe) y se revalida cada
+      REVALIDATE_S con un stat; path()/available() solo leen la caché, así que un click nunca
+      espera al disco (ni a un recurso de red).
+    - Un sondeo no se relanza mientras el anterior siga en curso; si tarda más de PROBE_TIMEOUT_S
+      (recurso de red colgado) la entrada se da por no disponible hasta que conteste.
+    - availabilityChanged(dict key -> bool) agrupa los cambios (como mucho uno por frame).
+    """
+    TICK_MS = 1000
+    FRAME_MS = 16
+    THREADS = 4
+    REVALIDATE_S = 30
+    PROBE_TIMEOUT_S = 5
+
+    availabilityChanged = QtCore.pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(self.THREADS)
+        self._specs = {}       # key -> (exe, cwd)
+        self._cache = {}       # key -> ExeResolution
+        self._due = {}         # key -> time.monotonic() del próximo sondeo
+        self._inflight = {}    # key -> (generación, inicio)
+        self._gen = itertools.count(1)
+        self._unavailable = set()
+        self._pending = {}
+        self.stats = {"probes": 0, "unchanged": 0, "timeouts": 0, "changes": 0}
+        self._tick = QtCore.QTimer(self)
+        self._tick.setInterval(self.TICK_MS)
+        self._tick.timeout.connect(self._on_tick)
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FRAME_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def set_entries(self, entries):
+        """Sincroniza con el catálogo; las entradas nuevas o con exe/cwd cambiados se sondean ya."""
+        wanted = {e.key: (e.exe, e.cwd) for e in entries}
+        for key in [k for k in self._specs if k not in wanted]:
+            for d in (self._specs, self._cache, self._due, self._inflight):
+                d.pop(key, None)
+            self._unavailable.discard(key)
+        for key, spec in wanted.items():
+            if self._specs.get(key) != spec:
+                self._specs[key] = spec
+                self._cache.pop(key, None)
+                self._inflight.pop(key, None)  # un resultado de la spec anterior se descarta
+                self._due[key] = 0.0
+        if self._specs and not self._tick.isActive():
+            self._tick.start()
+        QtCore.QTimer.singleShot(0, self._on_tick)
+
+    def path(self, key: str):
+        """Ruta resuelta (None si aún no se sabe o no existe)."""
+        r = self._cache.get(key)
+        return r.path if r is not None else None
+
+    def available(self, key: str) -> bool:
+        """False solo si se sabe que no está; una entrada aún sin sondear cuenta como disponible."""
+        return key not in self._unavailable
+
+    def unavailable(self) -> set:
+        return set(self._unavailable)
+
+    @QtCore.pyqtSlot(str)
+    def refresh(self, key: str):
+        """Sondeo inmediato de `key` (p. ej. tras un click en un tile no disponible)."""
+        if key in self._specs:
+            self._due[key] = 0.0
+            if key not in self._inflight:
+                QtCore.QTimer.singleShot(0, self._on_tick)
+
+    def _on_tick(self):
+        now = time.monotonic()
+        for key, (gen, started) in list(self._inflight.items()):
+            if gen > 0 and now - started > self.PROBE_TIMEOUT_S:
+                log.warning("%s: sin respuesta en %.1f s al buscar el ejecutable", self._specs[key][0],
+                            self.PROBE_TIMEOUT_S)
+                self.stats["timeouts"] += 1
+                self._inflight[key] = (-gen, started)  # sigue ocupado hasta que vuelva
+                self._set_available(key, False)
+        for key, due in self._due.items():
+            if due <= now and key not in self._inflight:
+                exe, cwd = self._specs[key]
+                gen = next(self._gen)
+                self._inflight[key] = (gen, now)
+                self._due[key] = float("inf")
+                task = ExeProbeTask(key, gen, exe, cwd, self._cache.get(key))
+                task.signals.done.connect(self._on_done)
+                self.stats["probes"] += 1
+                self.pool.start(task)
+
+    @QtCore.pyqtSlot(str, int, object)
+    def _on_done(self, key: str, gen: int, result):
+        current = self._inflight.get(key)
+        if current is None or abs(current[0]) != gen:
+            return  # entrada eliminada o con exe distinto
+        del self._inflight[key]
+        self._due[key] = time.monotonic() + self.REVALIDATE_S
+        if result is None:
+            return
+        if result is self._cache.get(key) and current[0] > 0:
+            self.stats["unchanged"] += 1
+            return
+        self._cache[key] = result
+        if not result.available and key not in self._unavailable:
+            log.warning("no se encontró el ejecutable de %s (%s)", key, self._specs[key][0])
+        self._set_available(key, result.available)
+
+    def _set_available(self, key: str, available: bool):
+        if available == (key not in self._unavailable):
+            return
+        if available:
+            self._unavailable.discard(key)
+        else:
+            self._unavailable.add(key)
+        self.stats["changes"] += 1
+        self._pending[key] = available
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        if pending:
+            self.availabilityChanged.emit(pending)
+
+    def stop(self):
+        self._tick.stop()
+        self.pool.clear()
+        self.pool.waitForDone(1000)
+
+# ----------------------------
+# Cola de lanzamientos: concurrencia acotada, prioridades y coalescencia de duplicados
+# ----------------------------
+class _LaunchRequest:
+    __slots__ = ("priority", "seq", "task", "coalesce_key", "enqueued", "dispatched", "cancelled")
+
+    def __init__(self, priority: int, seq: int, task: "LauncherTask", coalesce_key):
+        self.priority = priority
+        self.seq = seq
+        self.task = task
+        self.coalesce_key = coalesce_key
+        self.enqueued = time.monotonic()
+        self.dispatched = None
+        self.cancelled = False
+
+    def __lt__(self, other):
+        # mayor prioridad primero; a igual prioridad, orden de llegada
+        return (-self.priority, self.seq) < (-other.priority, other.seq)
+
+class LaunchScheduler(QtCore.QObject):
+    """Encola los LauncherTask en un QThreadPool propio con un máximo de lanzamientos simultáneos.
+
+    - Prioridades: INTERACTIVE (clicks/Enter) adelanta a NORMAL y BACKGROUND (lotes).
+    - Coalescencia: una petición con la misma clave (exe, args, cwd) mientras la anterior sigue
+      en cola o se despachó hace menos de COALESCE_MS se descarta (si trae más prioridad, la
+      que está en cola la hereda).
+    - queueChanged(en_cola, en_curso) y stats() exponen profundidad de cola y tiempos de espera.
+    - Como mucho PROGAIN_LAUNCH_CONCURRENCY (DEFAULT_CONCURRENCY) lanzamientos a la vez.
+    """
+    INTERACTIVE, NORMAL, BACKGROUND = 2, 1, 0
+    ENV = "PROGAIN_LAUNCH_CONCURRENCY"
+    DEFAULT_CONCURRENCY = 2
+    COALESCE_MS = 1500
+
+    queueChanged = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, concurrency: int = None, parent=None):
+        super().__init__(parent)
+        if concurrency is None:
+            try:
+                concurrency = int(os.environ.get(self.ENV, "") or self.DEFAULT_CONCURRENCY)
+            except ValueError:
+                log.warning("%s inválido; se usa %d", self.ENV, self.DEFAULT_CONCURRENCY)
+                concurrency = self.DEFAULT_CONCURRENCY
+        self.concurrency = max(1, concurrency)
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(self.concurrency)
+        self._heap = []
+        self._queued = 0
+        self._running = 0
+        self._seq = itertools.count()
+        self._recent = {}  # coalesce_key -> _LaunchRequest más reciente
+        self.submitted = 0
+        self.coalesced = 0
+        self.dispatched = 0
+        self.wait_ms_avg = 0.0
+        self.wait_ms_max = 0.0
+
+    def submit(self, task: "LauncherTask", priority: int = NORMAL, coalesce_key=None) -> bool:
+        """Encola `task`. Devuelve False si se fusionó con una petición idéntica reciente."""
+        now = time.monotonic()
+        if coalesce_key is not None:
+            prev = self._recent.get(coalesce_key)
+            if prev is not None and not prev.cancelled and (
+                    prev.dispatched is None or (now - prev.dispatched) * 1000.0 < self.COALESCE_MS):
+                self.coalesced += 1
+                if prev.dispatched is None and priority > prev.priority:
+                    # se re-encola con la prioridad nueva conservando el instante de llegada
+                    prev.cancelled = True
+                    bumped = _LaunchRequest(priority, prev.seq, prev.task, coalesce_key)
+                    bumped.enqueued = prev.enqueued
+                    self._recent[coalesce_key] = bumped
+                    heapq.heappush(self._heap, bumped)
+                log.info("lanzamiento duplicado de %s descartado", task.exe_name)
+                return False
+        req = _LaunchRequest(priority, next(self._seq), task, coalesce_key)
+        if coalesce_key is not None:
+            self._prune_recent(now)
+            self._recent[coalesce_key] = req
+        heapq.heappush(self._heap, req)
+        self._queued += 1
+        self.submitted += 1
+        self._dispatch()
+        return True
+
+    def _prune_recent(self, now: float):
+        if len(self._recent) < 64:
+            return
+        horizon = self.COALESCE_MS / 1000.0
+        for k, r in list(self._recent.items()):
+            if r.dispatched is not None and now - r.dispatched >= horizon:
+                del self._recent[k]
+
+    def _dispatch(self):
+        while self._running < self.concurrency and self._heap:
+            req = heapq.heappop(self._heap)
+            if req.cancelled:
+                continue
+            self._queued -= 1
+            self._running += 1
+            req.dispatched = time.monotonic()
+            wait_ms = (req.dispatched - req.enqueued) * 1000.0
+            self.dispatched += 1
+            if req.task.trace is not None:
+                req.task.trace.dispatched = req.dispatched
+            self.wait_ms_avg += (wait_ms - self.wait_ms_avg) * 0.2
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            if wait_ms >= 100:
+                log.info("%s esperó %.0f ms en la cola de lanzamiento", req.task.exe_name, wait_ms)
+            req.task.signals.finished.connect(self._on_task_finished)
+            self.pool.start(req.task)
+        self.queueChanged.emit(self._queued, self._running)
+
+    @QtCore.pyqtSlot()
+    def _on_task_finished(self):
+        self._running -= 1
+        self._dispatch()
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queued,
+            "running": self._running,
+            "concurrency": self.concurrency,
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "dispatched": self.dispatched,
+            "wait_ms_avg": round(self.wait_ms_avg, 1),
+            "wait_ms_max": round(self.wait_ms_max, 1),
+        }
+
+# ----------------------------
+# Supervisión de los procesos lanzados
+# ----------------------------
+class ManagedProcess:
+    """Un proceso hijo lanzado desde el launcher."""
+    __slots__ = ("key", "exe", "popen", "pid", "started", "ended", "returncode")
+
+    def __init__(self, key: str, exe: str, popen):
+        # popen: subprocess.Popen o SpawnedProcess (solo se usan pid y poll())
+        self.key = key
+        self.exe = exe
+        self.popen = popen
+        self.pid = popen.pid
+        self.started = time.time()
+        self.ended = None
+        self.returncode = None
+
+    @property
+    def running(self) -> bool:
+        return self.ended is None
+
+    def __repr__(self):
+        state = "running" if self.running else f"exit={self.returncode}"
+        return f"ManagedProcess({self.key!r}, pid={self.pid}, {state})"
+
+def find_process_window(pid: int):
+    """HWND de una ventana visible del proceso `pid`, o None. Solo Windows (en el resto, None)."""
+    if sys.platform != "win32":
+        return None
+    import ctypes
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32
+    found = []
+
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def _each(hwnd, _lparam):
+        owner = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+        if owner.value == pid and user32.IsWindowVisible(hwnd):
+            found.append(hwnd)
+            return False
+        return True
+
+    user32.EnumWindows(_each, 0)
+    return found[0] if found else None
+
+def focus_process_window(pid: int) -> bool:
+    """Trae al frente la ventana principal del proceso `pid`. Solo Windows; False si no se pudo."""
+    hwnd = find_process_window(pid)
+    if hwnd is None:
+        return False
+    import ctypes
+    user32 = ctypes.windll.user32
+    user32.ShowWindow(hwnd, 9)  # SW_RESTORE
+    return bool(user32.SetForegroundWindow(hwnd))
+
+class ProcessSupervisor(QtCore.QObject):
+    """Sigue cada hijo lanzado (PID, inicio, código de salida) y lo recoge sin bloquear la GUI.
+
+    LauncherTask llama a track()/spawn_failed() desde el worker; las señales internas llevan el
+    registro al hilo de la GUI. Un QTimer hace poll() (waitpid WNOHANG) solo mientras hay hijos
+    vivos, así en Linux no quedan zombis y la GUI se entera de cada salida.
+    """
+    started = QtCore.pyqtSignal(str, int)          # key, pid
+    exited = QtCore.pyqtSignal(str, int, int)      # key, pid, returncode
+    runningChanged = QtCore.pyqtSignal(str, int)   # key, nº de instancias vivas
+
+    _spawned = QtCore.pyqtSignal(str, str, object)
+    _failed = QtCore.pyqtSignal(str)
+
+    POLL_MS = 500
+    HISTORY = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._running = {}   # key -> [ManagedProcess]
+        self._pending = collections.Counter()  # lanzamientos pedidos cuyo Popen aún no ha vuelto
+        self.history = collections.deque(maxlen=self.HISTORY)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.POLL_MS)
+        self._timer.timeout.connect(self._poll)
+        self._spawned.connect(self._on_spawned)
+        self._failed.connect(self._on_failed)
+
+    # --- llamadas desde el worker (cualquier hilo) ---
+    def track(self, key: str, exe: str, popen):
+        self._spawned.emit(key, exe, popen)
+
+    def spawn_failed(self, key: str):
+        self._failed.emit(key)
+
+    # --- GUI ---
+    def reserve(self, key: str):
+        """Marca un lanzamiento en curso para que la política single-instance lo vea ya."""
+        self._pending[key] += 1
+
+    def is_running(self, key: str) -> bool:
+        return bool(self._running.get(key)) or self._pending[key] > 0
+
+    def running(self, key: str = None):
+        if key is not None:
+            return list(self._running.get(key, ()))
+        return [p for procs in self._running.values() for p in procs]
+
+    def _release(self, key: str):
+        if self._pending[key] > 0:
+            self._pending[key] -= 1
+        if not self._pending[key]:
+            del self._pending[key]
+
+    def _on_spawned(self, key: str, exe: str, popen):
+        self._release(key)
+        proc = ManagedProcess(key, exe, popen)
+        self._running.setdefault(key, []).append(proc)
+        log.info("lanzado %s pid=%d", exe, proc.pid)
+        self.started.emit(key, proc.pid)
+        self.runningChanged.emit(key, len(self._running[key]))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _on_failed(self, key: str):
+        self._release(key)
+
+    def _poll(self):
+        for key in list(self._running):
+            procs = self._running[key]
+            alive = []
+            for proc in procs:
+                code = proc.popen.poll()
+                if code is None:
+                    alive.append(proc)
+                    continue
+                proc.ended = time.time()
+                proc.returncode = code
+                proc.popen = None
+                self.history.append(proc)
+                log.info("terminó %s pid=%d código=%d (%.1f s)", proc.exe, proc.pid, code, proc.ended - proc.started)
+                self.exited.emit(key, proc.pid, code)
+            if len(alive) != len(procs):
+                if alive:
+                    self._running[key] = alive
+                else:
+                    del self._running[key]
+                self.runningChanged.emit(key, len(alive))
+        if not self._running:
+            self._timer.stop()
+
+# ----------------------------
+# Telemetría de lanzamientos: click -> cola -> worker -> spawn -> app lista
+# ----------------------------
+LAUNCH_LOG_FILE = "progain_launches.log"
+
+class LaunchTrace:
+    """Marcas de tiempo (time.monotonic) de un lanzamiento; el worker escribe worker/spawned/pid."""
+    __slots__ = ("key", "exe", "label", "probe", "click", "queued", "dispatched", "worker", "spawned",
+                 "ready", "pid", "outcome", "deadline")
+
+    def __init__(self, key: str, exe: str, label: str = None, probe: "ReadinessProbe" = None):
+        self.key = key
+        self.exe = exe
+        self.label = label or key
+        self.probe = probe
+        self.click = time.monotonic()
+        self.queued = self.dispatched = self.worker = self.spawned = self.ready = None
+        self.pid = None
+        self.outcome = None
+        self.deadline = None
+
+    def record(self) -> dict:
+        """Registro estructurado: cada fase en ms desde el click (None si no se alcanzó)."""
+        def ms(t):
+            return None if t is None else round((t - self.click) * 1000.0, 1)
+        return {
+            "ts": round(time.time(), 3), "key": self.key, "exe": self.exe, "pid": self.pid,
+            "outcome": self.outcome, "probe": self.probe.kind if self.probe else None,
+            "queued_ms": ms(self.queued), "dispatched_ms": ms(self.dispatched), "worker_ms": ms(self.worker),
+            "spawn_ms": ms(self.spawned), "ready_ms": ms(self.ready),
+        }
+
+class ReadinessProbe:
+    """Decide cuándo la app lanzada ya es usable: ventana visible del PID, fichero (o lock), puerto,
+    línea de log o, con "alive", que el proceso siga vivo tras unos segundos (no cayó al arrancar).
+
+    check(pid) se llama desde el hilo GUI cada LaunchTelemetry.POLL_MS, así que cada
+    comprobación es barata (sin bloqueos largos).
+    """
+    DEFAULT_TIMEOUT = 30.0
+
+    def __init__(self, kind: str, target=None, pattern: str = None, timeout: float = None):
+        self.kind = kind
+        self.target = target
+        self.pattern = re.compile(pattern) if pattern else None
+        self.timeout = float(timeout or self.DEFAULT_TIMEOUT)
+        self._log_pos = None
+        self._started = None
+
+    @classmethod
+    def for_entry(cls, spec: dict, cwd: str = None):
+        """Sonda de la entrada del catálogo; sin "ready", ventana visible en Windows y ninguna en el resto."""
+        if spec is None:
+            return cls("window") if sys.platform == "win32" else None
+        if not spec:
+            return None
+        timeout = spec.get("timeout")
+        def path(p):
+            p = os.path.expandvars(str(p))
+            return p if os.path.isabs(p) or not cwd else os.path.join(os.path.expandvars(cwd), p)
+        if spec.get("file"):
+            return cls("file", path(spec["file"]), timeout=timeout)
+        if spec.get("port"):
+            return cls("port", int(spec["port"]), timeout=timeout)
+        if spec.get("log"):
+            return cls("log", path(spec["log"]), pattern=spec.get("pattern"), timeout=timeout)
+        if spec.get("alive"):
+            return cls("alive", float(spec["alive"]), timeout=timeout)
+        if spec.get("window") and sys.platform == "win32":
+            return cls("window", timeout=timeout)
+        return None
+
+    def start(self):
+        self._started = time.monotonic()
+        if self.kind == "log":
+            # solo cuentan las líneas escritas después del lanzamiento
+            try:
+                self._log_pos = os.path.getsize(self.target)
+            except OSError:
+                self._log_pos = 0
+
+    def check(self, pid: int) -> bool:
+        if self.kind == "window":
+            return find_process_window(pid) is not None
+        if self.kind == "file":
+            return os.path.exists(self.target)
+        if self.kind == "port":
+            try:
+                with socket.create_connection(("127.0.0.1", self.target), timeout=0.05):
+                    return True
+            except OSError:
+                return False
+        if self.kind == "log":
+            try:
+                with open(self.target, "rb") as f:
+                    f.seek(self._log_pos)
+                    chunk = f.read()
+            except OSError:
+                return False
+            # solo líneas completas; la última a medio escribir se relee en la siguiente pasada
+            complete = chunk.rfind(b"\n") + 1
+            self._log_pos += complete
+            lines = chunk[:complete].decode("utf-8", "replace").splitlines()
+            if self.pattern is None:
+                return bool(lines)
+            return any(self.pattern.search(line) for line in lines)
+        if self.kind == "alive":
+            # si sale antes, LaunchTelemetry lo da por "exited"
+            return time.monotonic() - self._started >= self.target
+        return True
+
+def launch_log_path() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(LOG_FILE)), LAUNCH_LOG_FILE)
+
+def read_launch_records(path: str = None):
+    """Registros del log rotativo, del fichero más antiguo al más reciente."""
+    path = path or launch_log_path()
+    for i in range(LaunchTelemetry.BACKUPS, -1, -1):
+        name = f"{path}.{i}" if i else path
+        try:
+            with open(name, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+
+def summarize_launches(records) -> dict:
+    """p50/p95 de spawn y de "lista" por programa: {key: {"n", "spawn_p50", ..., "ready_p95", "failed"}}."""
+    spawn = collections.defaultdict(list)
+    ready = collections.defaultdict(list)
+    counts = collections.Counter()
+    failed = collections.Counter()
+    for r in records:
+        key = r.get("key")
+        counts[key] += 1
+        if r.get("spawn_ms") is not None:
+            spawn[key].append(r["spawn_ms"])
+        if r.get("ready_ms") is not None:
+            ready[key].append(r["ready_ms"])
+        if r.get("outcome") in ("error", "exited", "timeout"):
+            failed[key] += 1
+
+    def pct(values, p):
+        if not values:
+            return None
+        values = sorted(values)
+        return values[min(len(values) - 1, int(len(values) * p))]
+
+    return {key: {"n": n, "spawn_p50": pct(spawn[key], 0.5), "spawn_p95": pct(spawn[key], 0.95),
+                  "ready_p50": pct(ready[key], 0.5), "ready_p95": pct(ready[key], 0.95), "failed": failed[key]}
+            for key, n in counts.items()}
+
+def print_launch_stats(path: str = None):
+    stats = summarize_launches(read_launch_records(path))
+    if not stats:
+        print(f"sin lanzamientos registrados en {path or launch_log_path()}")
+        return
+    def fmt(v):
+        return "-" if v is None else f"{v:.0f}"
+    print(f"{'programa':<24} {'n':>5} {'spawn p50':>10} {'spawn p95':>10} {'lista p50':>10} {'lista p95':>10} {'fallos':>7}")
+    for key, st in sorted(stats.items(), key=lambda kv: -kv[1]["n"]):
+        print(f"{str(key)[:24]:<24} {st['n']:>5} {fmt(st['spawn_p50']):>10} {fmt(st['spawn_p95']):>10} "
+              f"{fmt(st['ready_p50']):>10} {fmt(st['ready_p95']):>10} {st['failed']:>7}")
+
+class LaunchTelemetry(QtCore.QObject):
+    """Traza cada lanzamiento hasta que la app está lista y lo escribe en un log rotativo (JSON por línea).
+
+    Mientras haya lanzamientos esperando su sonda de "lista" la capa de carga sigue visible
+    (waitingChanged); se da por terminado al cumplirse la sonda, al salir el proceso o al
+    agotarse el timeout de la sonda.
+    """
+    POLL_MS = 100
+    MAX_BYTES = 1 << 20
+    BACKUPS = 3
+
+    waitingChanged = QtCore.pyqtSignal(int)
+    launchFinished = QtCore.pyqtSignal(dict)
+
+    def __init__(self, supervisor: "ProcessSupervisor" = None, parent=None):
+        super().__init__(parent)
+        self._waiting = {}  # pid -> LaunchTrace
+        self._logger = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.POLL_MS)
+        self._timer.timeout.connect(self._poll)
+        if supervisor is not None:
+            supervisor.exited.connect(self._on_exited)
+
+    def begin(self, entry_key: str, exe: str, label: str = None, ready: dict = None, cwd: str = None) -> LaunchTrace:
+        return LaunchTrace(entry_key, exe, label, ReadinessProbe.for_entry(ready, cwd))
+
+    def waiting(self):
+        return list(self._waiting.values())
+
+    def task_finished(self, trace: LaunchTrace):
+        """El worker terminó: o falló el spawn, o empieza la espera de la sonda."""
+        if trace.pid is None:
+            self._finish(trace, "error")
+            return
+        if trace.probe is None:
+            self._finish(trace, "spawned")
+            return
+        trace.probe.start()
+        trace.deadline = time.monotonic() + trace.probe.timeout
+        self._waiting[trace.pid] = trace
+        self.waitingChanged.emit(len(self._waiting))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _poll(self):
+        now = time.monotonic()
+        for pid, trace in list(self._waiting.items()):
+            if trace.probe.check(pid):
+                trace.ready = time.monotonic()
+                self._finish(trace, "ready")
+            elif now >= trace.deadline:
+                self._finish(trace, "timeout")
+
+    def _on_exited(self, key: str, pid: int, code: int):
+        trace = self._waiting.get(pid)
+        if trace is not None:
+            self._finish(trace, "exited")
+
+    def _finish(self, trace: LaunchTrace, outcome: str):
+        trace.outcome = outcome
+        if self._waiting.pop(trace.pid, None) is not None:
+            self.waitingChanged.emit(len(self._waiting))
+        if not self._waiting:
+            self._timer.stop()
+        record = trace.record()
+        self._write(record)
+        self.launchFinished.emit(record)
+
+    def _write(self, record: dict):
+        if self._logger is None:
+            self._logger = logging.getLogger("progain.launches")
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+            try:
+                handler = logging.handlers.RotatingFileHandler(launch_log_path(), maxBytes=self.MAX_BYTES,
+                                                               backupCount=self.BACKUPS, encoding="utf-8")
+            except OSError as e:
+                log.warning("no se pudo abrir %s: %s", launch_log_path(), e)
+                handler = logging.NullHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger.addHandler(handler)
+        self._logger.info(json.dumps(record))
+
+    def summary(self) -> dict:
+        return summarize_launches(read_launch_records())
+
+# ----------------------------
+# Uso por programa (frecency): log de solo-añadir escrito por un hilo propio
+# ----------------------------
+USAGE_FILE = "progain_usage.log"
+
+def usage_log_path() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(LOG_FILE)), USAGE_FILE)
+
+class UsageStore:
+    """Lanzamientos por entrada y su puntuación frecency, en un log de solo-añadir.
+
+    Líneas del fichero (la key va al final; puede contener tabuladores):
+        +<ts>\\t<key>                      un lanzamiento
+        =<ts>\\t<score>\\t<count>\\t<key>    estado compactado de una entrada
+        @<h0>,...,<h23>\\t<key>            lanzamientos por hora del día (compactado)
+    La puntuación decae exponencialmente (vida media HALF_LIFE_DAYS) y cada lanzamiento suma 1, así
+    que por entrada basta guardar (puntuación, instante). Como el decaimiento escala todas las
+    puntuaciones por igual, el orden no depende de "ahora": ranking() da log(puntuación) + λ·instante,
+    comparable entre entradas y válido hasta el siguiente lanzamiento.
+    Un hilo propio carga el fichero (y precalcula el ranking) mientras se construye la ventana y
+    luego vacía la cola de escrituras, compactando cuando el log crece; record() solo encola, nunca
+    toca el disco en el hilo GUI.
+    """
+    HALF_LIFE_DAYS = 14.0
+    COMPACT_MIN_LINES = 512   # se compacta al superar max(COMPACT_MIN_LINES, COMPACT_FACTOR * entradas)
+    COMPACT_FACTOR = 4
+
+    def __init__(self, path: str = None):
+        self.path = path or usage_log_path()
+        self._decay = math.log(2) / (self.HALF_LIFE_DAYS * 86400.0)
+        self._state = {}           # key -> [score, ts, count] (score referido a ts)
+        self._hours = {}           # key -> lanzamientos por hora local del día (24 contadores)
+        self._ranking = None       # caché de ranking(); se invalida en record()
+        self._lock = threading.Lock()
+        self._lines = 0
+        self._torn = False         # el fichero acaba sin salto de línea (escritura cortada)
+        self._loaded = threading.Event()
+        self._queue = queue.SimpleQueue()  # se llena con _lock tomado: lo encolado ya está en _state
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="progain-usage", daemon=True)
+        self._thread.start()
+
+    # -- hilo de escritura --
+    def _run(self):
+        try:
+            self._load()
+            if self._lines > self._compact_limit():
+                self._compact()
+            self.ranking(wait=False)
+        finally:
+            self._loaded.set()
+        while not self._closing:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while True:  # agrupa las ráfagas en una sola escritura
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._append(batch)
+                    return
+                batch.append(item)
+            self._append(batch)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            log.warning("no se pudo leer %s: %s", self.path, e)
+            return
+        state, hours = {}, {}
+        lines = data.splitlines()
+        for line in lines:
+            try:
+                if line[0] == "+":
+                    ts, key = line[1:].split("\t", 1)
+                    self._bump(state, hours, key, float(ts), 1.0, 1)
+                elif line[0] == "=":
+                    ts, score, count, key = line[1:].split("\t", 3)
+                    state[key] = [float(score), float(ts), int(count)]
+                elif line[0] == "@":
+                    counts, key = line[1:].split("\t", 1)
+                    counts = [int(c) for c in counts.split(",")]
+                    if len(counts) == 24:
+                        hours[key] = counts
+            except (IndexError, ValueError):
+                continue  # línea truncada (corte de luz a mitad de escritura): se ignora
+        with self._lock:
+            # lo registrado mientras se cargaba ya está aplicado en memoria: se suma encima
+            for key, (score, ts, count) in self._state.items():
+                self._bump(state, None, key, ts, score, count)
+            for key, counts in self._hours.items():
+                hours[key] = list(map(operator.add, hours.get(key, [0] * 24), counts))
+            self._state = state
+            self._hours = hours
+            self._ranking = None
+        self._lines = len(lines)
+        self._torn = bool(data) and not data.endswith("\n")
+
+    def _bump(self, state: dict, hours, key: str, ts: float, score: float, count: int):
+        """Suma `count` lanzamientos (con puntuación `score` en `ts`) al estado de `key`."""
+        cur = state.get(key)
+        if cur is None:
+            state[key] = [score, ts, count]
+        elif ts >= cur[1]:
+            cur[0] = cur[0] * math.exp(-self._decay * (ts - cur[1])) + score
+            cur[1] = ts
+            cur[2] += count
+        else:  # evento anterior al estado (p. ej. registrado mientras se cargaba el fichero)
+            cur[0] += score * math.exp(-self._decay * (cur[1] - ts))
+            cur[2] += count
+        if hours is not None:
+            h = hours.get(key)
+            if h is None:
+                h = hours[key] = [0] * 24
+            h[time.localtime(ts).tm_hour] += count
+
+    def _compact_limit(self) -> int:
+        return max(self.COMPACT_MIN_LINES, self.COMPACT_FACTOR * len(self._state))
+
+    def _append(self, batch, compact: bool = True):
+        text = "".join(f"+{ts:.3f}\t{key}\n" for key, ts in batch)
+        if self._torn:
+            text = "\n" + text  # la línea rota queda sola y se ignora al cargar
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            log.warning("no se pudo escribir %s: %s", self.path, e)
+            return
+        self._torn = False
+        self._lines += len(batch)
+        if compact and self._lines > self._compact_limit():
+            self._compact()
+
+    def _drain(self) -> list:
+        """Saca de la cola los lanzamientos pendientes (con _lock tomado); anota si se pidió cerrar."""
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is None:
+                self._closing = True
+            else:
+                items.append(item)
+
+    def _compact(self):
+        # la instantánea incluye lo que aún está en cola: se saca de la cola a la vez para que no
+        # se vuelva a añadir como "+" y cuente dos veces al recargar
+        with self._lock:
+            absorbed = self._drain()
+            rows = [f"={ts:.3f}\t{score!r}\t{count}\t{key}\n" for key, (score, ts, count) in self._state.items()]
+            rows += [f"@{','.join(map(str, h))}\t{key}\n" for key, h in self._hours.items()]
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(rows)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.warning("no se pudo compactar %s: %s", self.path, e)
+            if absorbed:
+                self._append(absorbed, compact=False)
+            return
+        self._lines = len(rows)
+        self._torn = False
+
+    # -- API (hilo GUI) --
+    def record(self, key: str, ts: float = None):
+        """Anota un lanzamiento de `key`; en memoria al momento, en disco desde el hilo de escritura."""
+        if not key or "\n" in key:
+            return
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            self._bump(self._state, self._hours, key, ts, 1.0, 1)
+            self._ranking = None
+            self._queue.put((key, ts))
+
+    def wait_loaded(self, timeout: float = None) -> bool:
+        return self._loaded.wait(timeout)
+
+    def ranking(self, wait: bool = True) -> dict:
+        """key -> rango frecency (> 0; mayor = más usado ahora) de las entradas con algún lanzamiento."""
+        if wait:
+            self.wait_loaded()
+        with self._lock:
+            if self._ranking is None:
+                decay, log_ = self._decay, math.log
+                self._ranking = {key: log_(score) + decay * ts for key, (score, ts, _) in self._state.items()}
+            return self._ranking
+
+    def score(self, key: str, now: float = None) -> float:
+        """Puntuación frecency de `key` en `now` (lanzamientos equivalentes; 0 si nunca se lanzó)."""
+        self.wait_loaded()
+        with self._lock:
+            # _bump actualiza la lista en su sitio: se copia score y ts juntos
+            cur = self._state.get(key)
+            if cur is None:
+                return 0.0
+            score, ts = cur[0], cur[1]
+        now = time.time() if now is None else now
+        return score * math.exp(-self._decay * max(0.0, now - ts))
+
+    def count(self, key: str) -> int:
+        self.wait_loaded()
+        with self._lock:
+            cur = self._state.get(key)
+            return cur[2] if cur else 0
+
+    def hour_profile(self, key: str) -> list:
+        """Lanzamientos de `key` por hora local del día (24 contadores; ceros si no hay historial)."""
+        self.wait_loaded()
+        with self._lock:
+            return list(self._hours.get(key) or [0] * 24)
+
+    def order(self, entries, ranking: dict = None) -> list:
+        """`entries` de más a menos frecency; las nunca lanzadas conservan el orden del catálogo."""
+        ranking = self.ranking() if ranking is None else ranking
+        entries = list(entries)
+        if not ranking:
+            return entries
+        # todo con map/compress/sort en C; solo se ordenan las entradas usadas (rango > 0)
+        ranks = list(map(ranking.get, map(operator.attrgetter("key"), entries), itertools.repeat(0.0)))
+        used = list(itertools.compress(range(len(entries)), ranks))
+        used.sort(key=ranks.__getitem__, reverse=True)  # reverse=True sigue siendo estable
+        return list(map(entries.__getitem__, used)) + list(itertools.compress(entries, map(operator.not_, ranks)))
+
+    def close(self, timeout: float = 2.0):
+        """Vacía la cola pendiente y termina el hilo de escritura."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+# ----------------------------
+# Pre-calentado: lectura anticipada de los programas que probablemente se van a abrir
+# ----------------------------
+PREWARM_ENV = "PROGAIN_PREWARM"
+
+class CpuLoad:
+    """Carga de CPU del sistema (0 = ociosa, 1 = todos los núcleos ocupados)."""
+
+    def __init__(self):
+        self._last = None
+
+    def sample(self) -> float:
+        if hasattr(os, "getloadavg"):
+            try:
+                return os.getloadavg()[0] / (os.cpu_count() or 1)
+            except OSError:
+                return 0.0
+        if sys.platform == "win32":
+            # fracción ocupada desde la muestra anterior (el tiempo de kernel incluye el ocioso)
+            import ctypes
+            idle, kernel, user = (ctypes.c_ulonglong(), ctypes.c_ulonglong(), ctypes.c_ulonglong())
+            if not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                return 0.0
+            now = (idle.value, kernel.value + user.value)
+            last, self._last = self._last, now
+            if last is None or now[1] == last[1]:
+                return 0.0
+            return 1.0 - (now[0] - last[0]) / (now[1] - last[1])
+        return 0.0
+
+def lower_thread_priority():
+    """Baja la prioridad de CPU y de E/S del hilo actual (best effort)."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 0x00010000)  # THREAD_MODE_BACKGROUND_BEGIN
+        elif sys.platform.startswith("linux"):
+            # en Linux nice es por hilo, y la prioridad de E/S por defecto deriva de él
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (OSError, AttributeError):
+        pass
+
+class PrewarmEngine(QtCore.QObject):
+    """Lee por adelantado (a la caché de páginas del SO) los programas que probablemente se abran pronto.
+
+    - Candidatos: los `top_n` con más frecency ahora, ponderada por su patrón horario
+      (UsageStore.hour_profile): lo que se abre cada mañana sube a primera hora.
+    - Ficheros: el ejecutable y los "prewarm" del catálogo (ficheros, o carpetas: sus ficheros de
+      primer nivel; relativos al cwd de la entrada o, si no tiene, a la carpeta del ejecutable).
+    - La E/S la hace un hilo propio de baja prioridad, por bloques de CHUNK a RATE_MB_S como mucho:
+      posix_fadvise(WILLNEED) donde existe y si no lectura. Cada ciclo gasta como mucho `budget_mb`.
+    - Solo corre con el launcher ocioso (set_idle) y la CPU por debajo de BUSY_LOAD; si no, el
+      siguiente ciclo se aplaza el doble (hasta MAX_BACKOFF ciclos).
+    - warm_now(entry) (hover sobre un tile) pasa por delante del ciclo en curso.
+    Un fichero ya leído no se repite en REWARM_S mientras no cambie (mtime, tamaño).
+    PROGAIN_PREWARM=1 lo activa; PROGAIN_PREWARM_MB y PROGAIN_PREWARM_TOP ajustan presupuesto y N.
+    """
+    CYCLE_MS = 60_000
+    FIRST_CYCLE_MS = 10_000   # el primer ciclo espera a que el arranque se asiente
+    DEFAULT_TOP_N = 5
+    DEFAULT_BUDGET_MB = 256
+    RATE_MB_S = 64
+    CHUNK = 1 << 20
+    REWARM_S = 900
+    BUSY_LOAD = 0.75
+    MAX_BACKOFF = 8
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get(PREWARM_ENV, "").strip() not in ("", "0")
+
+    @staticmethod
+    def _env_int(name: str, default: int) -> int:
+        try:
+            return max(0, int(os.environ.get(name, "") or default))
+        except ValueError:
+            log.warning("%s inválido; se usa %d", name, default)
+            return default
+
+    def __init__(self, usage: UsageStore, parent=None, budget_mb: int = None, top_n: int = None):
+        super().__init__(parent)
+        self.usage = usage
+        self.budget = (self._env_int("PROGAIN_PREWARM_MB", self.DEFAULT_BUDGET_MB) if budget_mb is None
+                       else budget_mb) << 20
+        self.top_n = self._env_int("PROGAIN_PREWARM_TOP", self.DEFAULT_TOP_N) if top_n is None else top_n
+        self._entries = {}
+        self._idle = True
+        self._backoff = 1
+        self._busy_hit = False     # el hilo abortó un ciclo por carga de CPU
+        self._cpu = CpuLoad()
+        self._warmed = {}          # ruta -> ((mtime_ns, tamaño), instante)
+        self._hovered = {}         # key -> instante del último pre-calentado por hover
+        self._jobs = collections.deque()
+        self._cond = threading.Condition()
+        self._stopping = False
+        self.stats = {"cycles": 0, "backoffs": 0, "hover": 0, "files": 0, "bytes": 0, "skipped": 0}
+        self._thread = threading.Thread(target=self._run, name="progain-prewarm", daemon=True)
+        self._thread.start()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._cycle)
+        self._timer.start(self.FIRST_CYCLE_MS)
+
+    # -- hilo GUI --
+    def set_entries(self, entries):
+        self._entries = {e.key: e for e in entries}
+
+    def set_idle(self, idle: bool):
+        """False mientras haya lanzamientos en curso: el hilo deja de leer hasta que vuelva a True."""
+        self._idle = idle
+
+    def candidates(self, now: float = None) -> list:
+        """Entradas a pre-calentar ahora, de más a menos probables."""
+        if not self.top_n:
+            return []
+        now = time.time() if now is None else now
+        hour = time.localtime(now).tm_hour
+        ranking = self.usage.ranking()
+        # la frecency preselecciona; el patrón horario reordena solo a esos
+        pool = heapq.nlargest(self.top_n * 4, (k for k in ranking if k in self._entries), key=ranking.get)
+        scored = []
+        for key in pool:
+            h = self.usage.hour_profile(key)
+            around = h[hour - 1] + 2 * h[hour] + h[(hour + 1) % 24]
+            # 1 = sin patrón horario; > 1 = se suele abrir a esta hora
+            tod = (around + 1.0) / (4.0 * sum(h) / 24.0 + 1.0)
+            scored.append((self.usage.score(key, now) * tod, key))
+        scored.sort(reverse=True)
+        return [self._entries[key] for _, key in scored[:self.top_n]]
+
+    def warm_now(self, entry: ProgramEntry):
+        """Pre-calienta `entry` ya (hover): se encola delante del ciclo en curso."""
+        now = time.monotonic()
+        if now - self._hovered.get(entry.key, -self.REWARM_S) < self.REWARM_S:
+            return
+        self._hovered[entry.key] = now
+        self.stats["hover"] += 1
+        self._submit([self._job(entry, [self.budget], hover=True)], front=True)
+
+    def _cycle(self):
+        busy = not self._idle or self._busy_hit or self._cpu.sample() > self.BUSY_LOAD
+        self._busy_hit = False
+        if busy:
+            self._backoff = min(self.MAX_BACKOFF, self._backoff * 2)
+            self.stats["backoffs"] += 1
+        else:
+            self._backoff = 1
+            self.stats["cycles"] += 1
+            budget = [self.budget]  # compartido por las entradas del ciclo
+            self._submit([self._job(e, budget) for e in self.candidates()])
+        self._timer.start(self.CYCLE_MS * self._backoff)
+
+    @staticmethod
+    def _job(entry: ProgramEntry, budget: list, hover: bool = False) -> tuple:
+        return (entry.key, entry.exe, entry.cwd, entry.prewarm, budget, hover)
+
+    def _submit(self, jobs, front: bool = False):
+        with self._cond:
+            if front:
+                self._jobs.extendleft(reversed(jobs))
+            else:
+                self._jobs.extend(jobs)
+            self._cond.notify()
+
+    def stop(self, timeout: float = 2.0):
+        self._timer.stop()
+        with self._cond:
+            self._stopping = True
+            self._jobs.clear()
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    # -- hilo de pre-calentado --
+    def _run(self):
+        lower_thread_priority()
+        while True:
+            with self._cond:
+                while not self._jobs and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                job = self._jobs.popleft()
+            try:
+                self._warm_entry(*job)
+            except Exception:
+                log.exception("prewarm: error con %s", job[0])
+
+    def _may_run(self, hover: bool) -> bool:
+        if self._stopping or not (hover or self._idle):
+            return False
+        if self._cpu.sample() > self.BUSY_LOAD:
+            self._busy_hit = True
+            return False
+        return True
+
+    def _pace(self, seconds: float):
+        """Espera `seconds` para no pasar de RATE_MB_S; stop() la corta al momento."""
+        deadline = time.monotonic() + seconds
+        with self._cond:
+            while not self._stopping:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return
+                self._cond.wait(left)
+
+    def _warm_entry(self, key, exe, cwd, prewarm, budget, hover):
+        exe_path = resolve_entry_path(exe, cwd)
+        base = os.path.expandvars(cwd) if cwd else os.path.dirname(exe_path)
+        paths = [exe_path]
+        for p in prewarm:
+            p = os.path.expandvars(p)
+            p = p if os.path.isabs(p) else os.path.join(base, p)
+            if os.path.isdir(p):
+                try:
+                    with os.scandir(p) as it:
+                        paths += sorted(d.path for d in it if d.is_file())
+                except OSError:
+                    continue
+            else:
+                paths.append(p)
+        for path in paths:
+            if budget[0] <= 0 or not self._may_run(hover):
+                return
+            budget[0] -= self._warm_file(path, budget[0], hover)
+
+    def _warm_file(self, path: str, limit: int, hover: bool) -> int:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return 0
+        sig = (st.st_mtime_ns, st.st_size)
+        prev = self._warmed.get(path)
+        now = time.monotonic()
+        if prev is not None and prev[0] == sig and now - prev[1] < self.REWARM_S:
+            self.stats["skipped"] += 1
+            return 0
+        size = min(st.st_size, limit)
+        done = 0
+        fadvise = hasattr(os, "posix_fadvise")
+        buf = None if fadvise else bytearray(self.CHUNK)
+        try:
+            with open(path, "rb", buffering=0) as f:
+                # por bloques de CHUNK: entre uno y otro se cede a los lanzamientos y a stop()
+                while done < size and self._may_run(hover):
+                    t = time.monotonic()
+                    if fadvise:
+                        # el kernel lee por su cuenta; aquí solo se marca el ritmo para no saturar el disco
+                        n = min(self.CHUNK, size - done)
+                        os.posix_fadvise(f.fileno(), done, n, os.POSIX_FADV_WILLNEED)
+                    else:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                    done += n
+                    self._pace(n / (self.RATE_MB_S << 20) - (time.monotonic() - t))
+        except OSError as e:
+            log.debug("prewarm: no se pudo leer %s: %s", path, e)
+            return done
+        if done >= size:
+            self._warmed[path] = (sig, now)
+        self.stats["files"] += 1
+        self.stats["bytes"] += done
+        return done
+
+# ----------------------------
+# Descubrimiento de programas en carpetas compartidas (hilo propio, índice persistente)
+# ----------------------------
+DISCOVERY_ENV = "PROGAIN_DISCOVERY"
+DISCOVERY_CATEGORY = "Herramientas"
+DISCOVERY_KEY_PREFIX = "fs:"
+DISCOVERY_EXTENSIONS = (".exe", ".bat", ".cmd", ".com")
+
+def discovery_dirs() -> list:
+    """Carpetas de PROGAIN_DISCOVERY (separadas por os.pathsep), absolutas y sin repetir."""
+    raw = os.environ.get(DISCOVERY_ENV, "")
+    dirs = [os.path.normpath(os.path.abspath(os.path.expanduser(os.path.expandvars(d.strip()))))
+            for d in raw.split(os.pathsep) if d.strip()]
+    return list(dict.fromkeys(dirs))
+
+def discovery_extensions():
+    """PROGAIN_DISCOVERY_EXT (".exe,.py") o, por defecto, DISCOVERY_EXTENSIONS en Windows y el bit
+    de ejecución en el resto (None)."""
+    raw = os.environ.get("PROGAIN_DISCOVERY_EXT", "").strip()
+    if raw:
+        return tuple("." + e.strip().lower().lstrip(".") for e in raw.split(",") if e.strip())
+    return DISCOVERY_EXTENSIONS if sys.platform == "win32" else None
+
+def is_program(name: str, st, extensions) -> bool:
+    if extensions is not None:
+        return os.path.splitext(name)[1].lower() in extensions
+    return bool(st.st_mode & 0o111)
+
+def discovery_tags(folder: str, root: str) -> tuple:
+    """Tags (buscables) de lo descubierto en `folder`: la raíz y las carpetas que hay hasta él."""
+    rel = os.path.relpath(folder, root)
+    return (os.path.basename(root),) + (() if rel == "." else tuple(rel.split(os.sep)))
+
+def discovered_entry(folder: str, name: str, tags) -> ProgramEntry:
+    """Entrada de un ejecutable descubierto: label = nombre sin extensión, cwd = su carpeta."""
+    path = os.path.join(folder, name)
+    return ProgramEntry(os.path.splitext(name)[0], "", path, key=DISCOVERY_KEY_PREFIX + path, tags=tags,
+                        cwd=folder, categories=(DISCOVERY_CATEGORY,))
+
+class DiscoveryIndex:
+    """Índice persistente del último recorrido: carpeta -> [mtime_ns, {programa: [mtime_ns, tamaño]},
+    [subcarpetas]]. Una carpeta cuyo mtime no cambió no se vuelve a listar (crear, borrar o renombrar
+    algo dentro cambia el mtime de la carpeta; modificar un fichero en su sitio no, y eso no cambia
+    qué programas hay)."""
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        self.dirs = {}
+        self.dirty = False
+
+    def load(self, roots):
+        """Lee el índice quedándose solo con las carpetas bajo `roots`."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning("índice de descubrimiento ilegible (%s): %s; se recorre de cero", self.path, e)
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        prefixes = tuple(r.rstrip(os.sep) + os.sep for r in roots)
+        dirs = data.get("dirs") or {}
+        self.dirs = {d: rec for d, rec in dirs.items() if d in roots or d.startswith(prefixes)}
+        self.dirty = len(self.dirs) != len(dirs)
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # dumps usa el codificador en C; dump(f) iría por el de Python, varias veces más lento
+            data = json.dumps({"version": self.VERSION, "dirs": self.dirs}, separators=(",", ":"))
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)  # un corte a mitad deja el índice anterior, no uno truncado
+            self.dirty = False
+        except OSError as e:
+            log.warning("no se pudo guardar el índice de descubrimiento %s: %s", self.path, e)
+
+class DiscoveryEngine(QtCore.QObject):
+    """Ejecutables de las carpetas de PROGAIN_DISCOVERY, descubiertos en un hilo propio.
+
+    - El hilo recorre las carpetas con os.scandir apoyado en DiscoveryIndex: al arrancar publica lo
+      que ya estaba en el índice y luego solo relista las carpetas cuyo mtime cambió (las demás
+      cuestan un stat).
+    - Los cambios salen hacia la GUI agrupados: entriesChanged(añadidas, keys eliminadas) como mucho
+      cada BATCH_MS, así que miles de programas llegan en unas pocas pasadas de merge.
+    - Un QFileSystemWatcher (inotify en Linux) vigila las WATCH_LIMIT carpetas menos profundas; un
+      cambio relista solo esa carpeta (y las subcarpetas nuevas). Cada RESCAN_MS se repasa todo, por
+      lo que no se vigila y por los recursos de red que no notifican.
+    start() se llama tras el primer frame: la ventana se pinta sin esperar al descubrimiento.
+    """
+    BATCH_MS = 250
+    DEBOUNCE_MS = 300
+    RESCAN_MS = 300_000
+    WATCH_LIMIT = 1024
+
+    entriesChanged = QtCore.pyqtSignal(list, list)  # ProgramEntry nuevas, keys que desaparecieron
+    scanFinished = QtCore.pyqtSignal(dict)          # estadísticas de cada pasada (completa o por cambios)
+    _watchDirs = QtCore.pyqtSignal(list)            # hilo -> GUI: carpetas a vigilar
+
+    @staticmethod
+    def enabled() -> bool:
+        return bool(discovery_dirs())
+
+    def __init__(self, roots=None, parent=None, index_path: str = None):
+        super().__init__(parent)
+        self.roots = list(roots) if roots is not None else discovery_dirs()
+        self.extensions = discovery_extensions()
+        self.index = DiscoveryIndex(index_path or cache_dir("discovery_index.json"))
+        self._shown = {}     # carpeta -> nombres publicados hacia la GUI (solo el hilo)
+        self._added = {}     # ruta -> ProgramEntry pendiente de publicar
+        self._removed = set()
+        self._last_emit = 0.0
+        self._queue = queue.SimpleQueue()
+        self._stopping = False
+        self._thread = None
+        self.stats = {"scans": 0, "dirs": 0, "listed": 0, "programs": 0, "batches": 0}
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_dir_changed)
+        self._watchDirs.connect(self._set_watched)
+        self._dirty_dirs = set()
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._rescan_dirty)
+        self._rescan = QtCore.QTimer(self)
+        self._rescan.setInterval(self.RESCAN_MS)
+        self._rescan.timeout.connect(self.scan)
+
+    # -- hilo GUI --
+    def start(self):
+        if self._thread is not None or not self.roots:
+            return
+        self._thread = threading.Thread(target=self._run, name="progain-discovery", daemon=True)
+        self._thread.start()
+        self._rescan.start()
+
+    def scan(self):
+        """Repaso completo (incremental: solo se relistan las carpetas cambiadas)."""
+        self._queue.put(("scan", None))
+
+    def _on_dir_changed(self, path: str):
+        self._dirty_dirs.add(path)
+        self._debounce.start()
+
+    def _rescan_dirty(self):
+        dirs, self._dirty_dirs = self._dirty_dirs, set()
+        self._queue.put(("dirs", sorted(dirs)))
+
+    @QtCore.pyqtSlot(list)
+    def _set_watched(self, dirs: list):
+        current = set(self._watcher.directories())
+        wanted = set(dirs)
+        if current - wanted:
+            self._watcher.removePaths(sorted(current - wanted))
+        if wanted - current:
+            self._watcher.addPaths(sorted(wanted - current))
+
+    def stop(self, timeout: float = 2.0):
+        self._rescan.stop()
+        self._debounce.stop()
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    # -- hilo de descubrimiento --
+    def _run(self):
+        # sin bajar la prioridad: con el GIL de por medio, un hilo a nice 19 que lo tenga cogido y se
+        # quede sin CPU frena también al hilo GUI
+        self.index.load(self.roots)
+        self._publish_index()
+        pending = [("scan", None)]
+        while not self._stopping:
+            if not pending:
+                pending.append(self._queue.get())
+            while True:  # las peticiones acumuladas se resuelven en una sola pasada
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in pending:
+                return
+            full = any(kind == "scan" for kind, _ in pending)
+            dirs = {d for kind, ds in pending if kind == "dirs" for d in ds}
+            pending = []
+            try:
+                self._pass(full, dirs)
+            except Exception:
+                log.exception("descubrimiento de programas")
+
+    def _pass(self, full: bool, dirs):
+        t0 = time.perf_counter()
+        before = len(self.index.dirs)
+        listed = self.stats["listed"]
+        if full:
+            self.stats["scans"] += 1
+            for root in self.roots:
+                if os.path.isdir(root):
+                    self._walk(root, deep=True)
+                else:
+                    # raíz inaccesible (recurso de red caído): se conserva lo conocido hasta que vuelva
+                    log.warning("descubrimiento: no se puede leer %s", root)
+        else:
+            for d in dirs:
+                if d in self.index.dirs:
+                    self._walk(d, deep=False)
+        self.index.save()
+        if self._stopping:
+            return
+        self._flush(force=True)
+        if full or len(self.index.dirs) != before:
+            by_depth = sorted(self.index.dirs, key=lambda d: (d.count(os.sep), d))
+            self._watchDirs.emit(by_depth[:self.WATCH_LIMIT])
+        self.stats["dirs"] = len(self.index.dirs)
+        self.stats["programs"] = sum(len(names) for names in self._shown.values())
+        record = dict(self.stats, full=full, ms=round((time.perf_counter() - t0) * 1000.0, 1),
+                      relisted=self.stats["listed"] - listed)
+        log.log(logging.INFO if full else logging.DEBUG,
+                "descubrimiento: %d programas en %d carpetas (%d relistadas) en %.0f ms",
+                record["programs"], record["dirs"], record["relisted"], record["ms"])
+        self.scanFinished.emit(record)
+
+    def _root_of(self, path: str) -> str:
+        for root in self.roots:
+            if path == root or path.startswith(root.rstrip(os.sep) + os.sep):
+                return root
+        return os.path.dirname(path)
+
+    def _publish_index(self):
+        """Lo conocido del arranque anterior sale ya, antes de tocar las carpetas (p. ej. de red)."""
+        for d, rec in self.index.dirs.items():
+            self._show(d, rec[1])
+        self._flush(force=True)
+
+    def _walk(self, top: str, deep: bool):
+        stack = [top]
+        while stack and not self._stopping:
+            d = stack.pop()
+            rec = self.index.dirs.get(d)
+            try:
+                mtime = os.stat(d).st_mtime_ns
+            except OSError:
+                self._drop(d)
+                continue
+            if rec is not None and rec[0] == mtime:
+                if deep:
+                    stack.extend(os.path.join(d, s) for s in rec[2])
+                self._show(d, rec[1])
+                continue
+            old = rec[1] if rec is not None else {}
+            files, subdirs = {}, []
+            try:
+                with os.scandir(d) as it:
+                    for de in it:
+                        if de.name.startswith("."):
+                            continue
+                        try:
+                            if de.is_dir(follow_symlinks=False):
+                                subdirs.append(de.name)
+                            elif de.is_file():
+                                st = de.stat()
+                                if is_program(de.name, st, self.extensions):
+                                    files[de.name] = [st.st_mtime_ns, st.st_size]
+                        except OSError:
+                            continue
+            except OSError as e:
+                log.debug("descubrimiento: no se puede listar %s: %s", d, e)
+                continue
+            self.stats["listed"] += 1
+            known = set(rec[2]) if rec is not None else set()
+            for gone in known.difference(subdirs):
+                self._drop(os.path.join(d, gone))
+            self.index.dirs[d] = [mtime, files, sorted(subdirs)]
+            self.index.dirty = True
+            # las subcarpetas nuevas se recorren enteras; las conocidas solo en un repaso completo
+            stack.extend(os.path.join(d, s) for s in subdirs if deep or s not in known)
+            if files != old:
+                self._show(d, files)
+
+    def _drop(self, d: str):
+        """Olvida una carpeta que desapareció, con todo lo que colgaba de ella."""
+        prefix = d.rstrip(os.sep) + os.sep
+        for sub in [k for k in self.index.dirs if k == d or k.startswith(prefix)]:
+            del self.index.dirs[sub]
+            self.index.dirty = True
+        for sub in [k for k in self._shown if k == d or k.startswith(prefix)]:
+            self._show(sub, ())
+            del self._shown[sub]
+
+    def _show(self, d: str, names):
+        """Publica la lista de programas actual de la carpeta `d` (solo lo que cambió)."""
+        shown = self._shown.get(d, set())
+        names = set(names)
+        if names == shown:
+            return
+        added = names - shown
+        if added:
+            tags = discovery_tags(d, self._root_of(d))
+        for name in added:
+            path = os.path.join(d, name)
+            self._removed.discard(DISCOVERY_KEY_PREFIX + path)
+            self._added[path] = discovered_entry(d, name, tags)
+        for name in shown - names:
+            path = os.path.join(d, name)
+            if self._added.pop(path, None) is None:
+                self._removed.add(DISCOVERY_KEY_PREFIX + path)
+        self._shown[d] = names
+        self._flush()
+
+    def _flush(self, force: bool = False):
+        if not (self._added or self._removed):
+            return
+        now = time.monotonic()
+        if not force and now - self._last_emit < self.BATCH_MS / 1000.0:
+            return
+        added, self._added = list(self._added.values()), {}
+        removed, self._removed = sorted(self._removed), set()
+        self._last_emit = now
+        self.stats["batches"] += 1
+        self.entriesChanged.emit(added, removed)
+
+# ----------------------------
+# Monitor de recursos: CPU y memoria de los programas lanzados, en un solo hilo
+# ----------------------------
+MONITOR_ENV = "PROGAIN_MONITOR"
+
+class ProcStatReader:
+    """Tiempo de CPU (s) y RSS (bytes) de un PID leyendo /proc/<pid>/stat y statm (Linux).
+
+    Los dos ficheros se quedan abiertos y se releen con pread desde el offset 0 (el kernel los
+    regenera en cada lectura): una pasada cuesta dos syscalls por proceso en lugar de seis. Un fd
+    abierto sigue apuntando a su proceso aunque el PID se reutilice; al morir, la lectura falla.
+    """
+    name = "proc"
+
+    def __init__(self):
+        self._tick = os.sysconf("SC_CLK_TCK")
+        self._page = os.sysconf("SC_PAGE_SIZE")
+        self._fds = {}  # pid -> (fd de stat, fd de statm)
+
+    @staticmethod
+    def available() -> bool:
+        return sys.platform.startswith("linux") and os.path.exists(f"/proc/{os.getpid()}/statm")
+
+    def read(self, pid: int):
+        """(cpu_s, rss) o None si el proceso ya no existe (o es un zombi)."""
+        try:
+            fds = self._fds.get(pid)
+            if fds is None:
+                fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+                try:
+                    fds = self._fds[pid] = (fd, os.open(f"/proc/{pid}/statm", os.O_RDONLY))
+                except OSError:
+                    os.close(fd)
+                    raise
+            stat = os.pread(fds[0], 1024, 0)
+            statm = os.pread(fds[1], 256, 0)
+        except OSError:
+            self.forget(pid)
+            return None
+        # el nombre (campo 2) va entre paréntesis y puede tener espacios: se parte tras el último ")"
+        fields = stat[stat.rfind(b")") + 2:].split()
+        if not fields or fields[0] == b"Z":
+            return None  # ya terminó; ProcessSupervisor aún no lo ha recogido
+        utime, stime = int(fields[11]), int(fields[12])
+        return (utime + stime) / self._tick, int(statm.split()[1]) * self._page
+
+    def forget(self, pid: int):
+        for fd in self._fds.pop(pid, ()):
+            os.close(fd)
+
+class PsutilReader:
+    """Lo mismo con psutil (Windows/macOS), si está instalado."""
+    name = "psutil"
+
+    def __init__(self):
+        import psutil
+        self._psutil = psutil
+        self._procs = {}  # pid -> psutil.Process (conserva la identidad frente a reutilización del PID)
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import psutil  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def read(self, pid: int):
+        proc = self._procs.get(pid)
+        try:
+            if proc is None:
+                proc = self._procs[pid] = self._psutil.Process(pid)
+            with proc.oneshot():
+                cpu = proc.cpu_times()
+                rss = proc.memory_info().rss
+        except self._psutil.Error:
+            self._procs.pop(pid, None)
+            return None
+        return cpu.user + cpu.system, rss
+
+    def forget(self, pid: int):
+        self._procs.pop(pid, None)
+
+def process_reader():
+    """Lector de CPU/RSS para esta plataforma, o None si no hay ninguno (sin /proc ni psutil)."""
+    for cls in (ProcStatReader, PsutilReader):
+        if cls.available():
+            return cls()
+    return None
+
+def format_usage(cpu: int, rss: int) -> str:
+    """"12% · 240 MB" para el tile (RSS en GB a partir de 1 GB)."""
+    mem = f"{rss / (1 << 30):.1f} GB" if rss >= 1 << 30 else f"{rss >> 20} MB"
+    return f"{cpu}% · {mem}"
+
+class ResourceMonitor(QtCore.QObject):
+    """CPU y RSS de cada proceso bajo ProcessSupervisor, muestreados por un único hilo.
+
+    Cada INTERVAL_MS (PROGAIN_MONITOR_MS) el hilo lee todos los PIDs vivos de una pasada y guarda
+    (instante, % CPU, RSS) en un ring buffer de HISTORY muestras por proceso. Hacia la GUI sale como
+    mucho una actualización por PUSH_MS, ya agregada por entrada del catálogo (suma de sus
+    instancias). El hilo mide su propio coste (thread_time) en stats(); benchmarks/bench_monitor.py
+    lo comprueba con 100 hijos. Sin procesos vivos el hilo duerme. PROGAIN_MONITOR=0 lo desactiva.
+    """
+    DEFAULT_INTERVAL_MS = 1000
+    MIN_INTERVAL_MS = 100
+    PUSH_MS = 1000
+    HISTORY = 60
+
+    usageChanged = QtCore.pyqtSignal(dict)  # key -> (% CPU, RSS en bytes) de las entradas en ejecución
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get(MONITOR_ENV, "1").strip() != "0"
+
+    @classmethod
+    def interval_ms(cls) -> int:
+        raw = os.environ.get("PROGAIN_MONITOR_MS", "")
+        try:
+            return max(cls.MIN_INTERVAL_MS, int(raw or cls.DEFAULT_INTERVAL_MS))
+        except ValueError:
+            log.warning("PROGAIN_MONITOR_MS inválido: %r; se usa %d", raw, cls.DEFAULT_INTERVAL_MS)
+            return cls.DEFAULT_INTERVAL_MS
+
+    def __init__(self, supervisor: ProcessSupervisor = None, parent=None, interval_ms: int = None, reader=None):
+        super().__init__(parent)
+        self.interval = (self.interval_ms() if interval_ms is None else interval_ms) / 1000.0
+        self.reader = reader or process_reader()
+        self._pids = {}      # pid -> key de los procesos a muestrear
+        self._history = {}   # pid -> deque de (time.monotonic(), % CPU, RSS)
+        self._last_cpu = {}  # pid -> (instante, segundos de CPU) de la muestra anterior
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._stats = {"passes": 0, "samples": 0, "busy_s": 0.0, "since": None}
+        self._thread = None
+        if self.reader is None:
+            log.info("monitor de recursos sin lector en esta plataforma (ni /proc ni psutil)")
+            return
+        if supervisor is not None:
+            supervisor.started.connect(self.track)
+            supervisor.exited.connect(lambda key, pid, code: self.untrack(pid))
+        self._thread = threading.Thread(target=self._run, name="progain-monitor", daemon=True)
+        self._thread.start()
+
+    # -- hilo GUI --
+    def track(self, key: str, pid: int):
+        with self._cond:
+            self._pids[pid] = key
+            self._cond.notify()
+
+    def untrack(self, pid: int):
+        with self._cond:
+            self._pids.pop(pid, None)
+
+    def history(self, key: str) -> dict:
+        """pid -> muestras (instante, % CPU, RSS) de cada instancia de `key`, de la más antigua a la última."""
+        with self._cond:
+            return {pid: list(self._history.get(pid, ())) for pid, k in self._pids.items() if k == key}
+
+    def stats(self) -> dict:
+        """Coste propio del muestreo: pasadas, ms de CPU por pasada y % de una CPU desde el arranque."""
+        with self._cond:
+            st = dict(self._stats)
+        elapsed = time.monotonic() - st["since"] if st["since"] else 0.0
+        return {"reader": self.reader.name if self.reader else None, "passes": st["passes"],
+                "samples": st["samples"],
+                "ms_per_pass": st["busy_s"] * 1000.0 / st["passes"] if st["passes"] else 0.0,
+                "cpu_pct": st["busy_s"] * 100.0 / elapsed if elapsed else 0.0}
+
+    def stop(self, timeout: float = 2.0):
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join(timeout)
+        st = self.stats()
+        if st["passes"]:
+            log.info("monitor de recursos (%s): %d pasadas, %.3f ms/pasada, %.3f%% CPU", st["reader"],
+                     st["passes"], st["ms_per_pass"], st["cpu_pct"])
+
+    # -- hilo del monitor --
+    def _run(self):
+        # sin bajar la prioridad: con un programa desbocado ocupando la CPU es cuando más hace falta
+        last_push = 0.0
+        pushed = {}
+        while True:
+            with self._cond:
+                if not self._pids and not self._stopping and not pushed:
+                    self._cond.wait_for(lambda: self._pids or self._stopping)
+                if self._stopping:
+                    return
+                pids = dict(self._pids)
+            t0 = time.thread_time()
+            now = time.monotonic()
+            usage = self._sample(pids, now)
+            busy = time.thread_time() - t0
+            with self._cond:
+                if self._stats["since"] is None:
+                    self._stats["since"] = now
+                self._stats["passes"] += 1
+                self._stats["samples"] += len(pids)
+                self._stats["busy_s"] += busy
+            # a la GUI solo lo que se ve (% entero y MB), y como mucho una vez por PUSH_MS
+            shown = {k: (cpu, rss >> 20) for k, (cpu, rss) in usage.items()}
+            if shown != pushed and now - last_push >= self.PUSH_MS / 1000.0:
+                last_push = now
+                pushed = shown
+                self.usageChanged.emit(usage)
+            with self._cond:
+                if not self._stopping:
+                    self._cond.wait(self.interval)
+
+    def _sample(self, pids: dict, now: float) -> dict:
+        samples = [(pid, key, self.reader.read(pid)) for pid, key in pids.items()]
+        totals = {}
+        with self._cond:
+            for pid, key, sample in samples:
+                if sample is None:
+                    continue
+                cpu_s, rss = sample
+                prev = self._last_cpu.get(pid)
+                self._last_cpu[pid] = (now, cpu_s)
+                cpu = 0.0 if prev is None or now <= prev[0] else max(0.0, (cpu_s - prev[1]) / (now - prev[0]) * 100.0)
+                hist = self._history.get(pid)
+                if hist is None:
+                    hist = self._history[pid] = collections.deque(maxlen=self.HISTORY)
+                hist.append((now, cpu, rss))
+                total = totals.get(key, (0.0, 0))
+                totals[key] = (total[0] + cpu, total[1] + rss)
+            # los procesos que ya no se siguen se olvidan aquí, en el único hilo que escribe estas tablas
+            for pid in [p for p in self._last_cpu if p not in self._pids]:
+                del self._last_cpu[pid]
+                self._history.pop(pid, None)
+                self.reader.forget(pid)
+        return {key: (round(cpu), rss) for key, (cpu, rss) in totals.items()}
+
+# ----------------------------
+# Badges: contadores reales (facturas pendientes, licitaciones abiertas...) fuera del hilo GUI
+# ----------------------------
+class BadgeProvider:
+    """Fuente del contador de un badge; version() y count() corren en un hilo de trabajo.
+
+    version() debe ser barata (mtime, row-version...): si devuelve lo mismo que la vez anterior no se
+    llama a count(). None = sin detección de cambios (se cuenta siempre). count() recibe el instante
+    (time.monotonic) a partir del cual BadgeService ya ha descartado el resultado, y debería abortar.
+    Las subclases se registran con register_badge_provider() y se usan desde el catálogo con
+    "badge_source": {"type": ..., "interval": s, "timeout": s, ...}.
+    """
+    interval = 30.0
+    timeout = 5.0
+    last_version = None    # lo mantiene BadgeService (versión del último contador aceptado)
+    last_error = None
+
+    def __init__(self, spec: dict = None, cwd: str = None):
+        spec = spec or {}
+        self.spec = spec
+        self.cwd = cwd
+        self.interval = max(1.0, float(spec.get("interval", self.interval)))
+        self.timeout = max(0.1, float(spec.get("timeout", self.timeout)))
+
+    def path(self, p: str) -> str:
+        return resolve_entry_path(p, self.cwd)
+
+    def version(self):
+        return None
+
+    def count(self, deadline: float) -> int:
+        raise NotImplementedError
+
+    def close(self):
+        """Libera recursos (conexiones); se llama al quitar el proveedor."""
+
+    @staticmethod
+    def file_version(*paths):
+        """(mtime_ns, tamaño) de cada fichero (None si no existe): detecta cambios sin abrirlos."""
+        out = []
+        for p in paths:
+            try:
+                st = os.stat(p)
+                out.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                out.append(None)
+        return tuple(out)
+
+class FileBadgeProvider(BadgeProvider):
+    """{"type": "file", "path": ...}: número en un fichero de texto, campo "field" de un JSON, o
+    con "lines": true el número de líneas no vacías (p. ej. una cola exportada por otra aplicación)."""
+
+    def __init__(self, spec: dict = None, cwd: str = None):
+        super().__init__(spec, cwd)
+        if not self.spec.get("path"):
+            raise CatalogError(f"badge_source file sin path: {self.spec!r}")
+        self.file = self.path(self.spec["path"])
+
+    def version(self):
+        return self.file_version(self.file)
+
+    def count(self, deadline: float) -> int:
+        try:
+            with open(self.file, encoding="utf-8-sig") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return 0
+        if self.spec.get("lines"):
+            return sum(1 for line in text.splitlines() if line.strip())
+        field = self.spec.get("field")
+        value = json.loads(text).get(field) if field else text.strip() or 0
+        return int(value or 0)
+
+class SqliteBadgeProvider(BadgeProvider):
+    """{"type": "sqlite", "path": ..., "query": "SELECT COUNT(*) ..."}: primera columna de la consulta.
+
+    Cambios: mtime/tamaño del fichero y de su -wal, o "version_query" (p. ej. MAX(row_version))
+    si la base se modifica sin tocar esos ficheros. La conexión es de solo lectura y se reutiliza;
+    la consulta se interrumpe (progress handler) al pasar el deadline.
+    """
+
+    def __init__(self, spec: dict = None, cwd: str = None):
+        super().__init__(spec, cwd)
+        if not self.spec.get("path") or not self.spec.get("query"):
+            raise CatalogError(f"badge_source sqlite necesita path y query: {self.spec!r}")
+        self.db = self.path(self.spec["path"])
+        self._conn = None
+        self._deadline = None
+
+    def _connection(self):
+        if self._conn is None:
+            import sqlite3
+            import urllib.request
+            uri = "file:" + urllib.request.pathname2url(self.db) + "?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, timeout=self.timeout, check_same_thread=False)
+            self._conn.set_progress_handler(self._interrupt, 10_000)
+        return self._conn
+
+    def _interrupt(self) -> int:
+        return int(self._deadline is not None and time.monotonic() > self._deadline)
+
+    def _scalar(self, sql: str, deadline: float):
+        self._deadline = deadline
+        try:
+            row = self._connection().execute(sql).fetchone()
+        except Exception:
+            self.close()  # conexión rota o base reemplazada: se reabre la próxima vez
+            raise
+        finally:
+            self._deadline = None
+        return row[0] if row else None
+
+    def version(self):
+        if not os.path.exists(self.db):
+            return None
+        vq = self.spec.get("version_query")
+        if vq:
+            return self._scalar(vq, time.monotonic() + self.timeout)
+        return self.file_version(self.db, self.db + "-wal")
+
+    def count(self, deadline: float) -> int:
+        if not os.path.exists(self.db):
+            return 0
+        return int(self._scalar(self.spec["query"], deadline) or 0)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+BADGE_PROVIDERS = {"file": FileBadgeProvider, "sqlite": SqliteBadgeProvider}
+
+def register_badge_provider(kind: str, cls):
+    """Registra un tipo de "badge_source" (subclase de BadgeProvider)."""
+    BADGE_PROVIDERS[kind] = cls
+
+def badge_provider_for(spec: dict, cwd: str = None) -> BadgeProvider:
+    cls = BADGE_PROVIDERS.get(spec.get("type"))
+    if cls is None:
+        raise CatalogError(f"badge_source de tipo desconocido: {spec.get('type')!r} ({sorted(BADGE_PROVIDERS)})")
+    return cls(spec, cwd)
+
+class BadgeTask(QtCore.QRunnable):
+    """Una pasada de un proveedor: version() y, si cambió, count().
+
+    No toca provider.last_version: la versión viaja con el resultado y BadgeService solo la guarda
+    si lo acepta (una pasada que llega tarde se vuelve a contar en la siguiente).
+    """
+
+    class Signals(QtCore.QObject):
+        # key, generación, contador (None = sin cambios/error), versión con la que se contó
+        done = QtCore.pyqtSignal(str, int, object, object)
+
+    def __init__(self, key: str, gen: int, provider: BadgeProvider, last_version):
+        super().__init__()
+        self.key = key
+        self.gen = gen
+        self.provider = provider
+        self.last_version = last_version
+        self.signals = BadgeTask.Signals()
+
+    def run(self):
+        value = None
+        version = self.last_version
+        try:
+            version = self.provider.version()
+            if version is None or version != self.last_version:
+                value = self.provider.count(time.monotonic() + self.provider.timeout)
+            self.provider.last_error = None
+        except Exception as e:
+            if str(e) != self.provider.last_error:  # el mismo error no se repite en cada intervalo
+                log.warning("badge %s: %s", self.key, e)
+                self.provider.last_error = str(e)
+            version = self.last_version  # se reintenta en el siguiente intervalo
+        self.signals.done.emit(self.key, self.gen, value, version)
+
+class BadgeService(QtCore.QObject):
+    """Refresca los badges con proveedores (BadgeProvider) en un pool propio y agrupa los cambios.
+
+    - Cada proveedor corre cada `interval` s; un proveedor no se relanza mientras su pasada anterior
+      siga en curso, así que uno lento no acumula hilos.
+    - Si una pasada supera su `timeout` se descarta su resultado (la rejilla nunca espera) y el
+      siguiente intervalo se alarga al doble, hasta MAX_BACKOFF.
+    - badgesChanged(dict key -> contador) se emite como mucho una vez por frame (FRAME_MS).
+    """
+    TICK_MS = 500
+    FRAME_MS = 16
+    THREADS = 2
+    MAX_BACKOFF = 8
+
+    badgesChanged = QtCore.pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(self.THREADS)
+        self._providers = {}   # key -> BadgeProvider
+        self._specs = {}       # key -> spec del catálogo (para conservar el proveedor si no cambia)
+        self._due = {}         # key -> time.monotonic() de la próxima pasada
+        self._backoff = {}     # key -> multiplicador del intervalo tras timeouts
+        self._inflight = {}    # key -> (generación, inicio, timeout)
+        self._retired = {}     # generación -> proveedor eliminado con su pasada en curso (se cierra al volver)
+        self._gen = itertools.count(1)
+        self._values = {}      # último contador aplicado por key
+        self._pending = {}
+        self.stats = {"runs": 0, "unchanged": 0, "timeouts": 0, "flushes": 0}
+        self._tick = QtCore.QTimer(self)
+        self._tick.setInterval(self.TICK_MS)
+        self._tick.timeout.connect(self._on_tick)
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FRAME_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def add(self, key: str, provider: BadgeProvider):
+        """Proveedor para la entrada `key` (reemplaza al anterior); la primera pasada es inmediata."""
+        self.remove(key)
+        self._providers[key] = provider
+        self._due[key] = 0.0
+        if not self._tick.isActive():
+            self._tick.start()
+            QtCore.QTimer.singleShot(0, self._on_tick)
+
+    def remove(self, key: str):
+        old = self._providers.pop(key, None)
+        inflight = self._inflight.pop(key, None)
+        if old is not None:
+            if inflight is None:
+                old.close()
+            else:  # su hilo aún lo usa: se cierra cuando llegue el resultado (ya descartado)
+                self._retired[abs(inflight[0])] = old
+        self._specs.pop(key, None)
+        self._due.pop(key, None)
+        self._backoff.pop(key, None)
+        if not self._providers:
+            self._tick.stop()
+
+    def set_entries(self, entries):
+        """Sincroniza los proveedores con los "badge_source" del catálogo."""
+        wanted = {e.key: e for e in entries if e.badge_source}
+        for key in [k for k in self._specs if k not in wanted]:
+            self.remove(key)
+            self._values.pop(key, None)
+        for key, e in wanted.items():
+            spec = (e.badge_source, e.cwd)
+            if self._specs.get(key) == spec:
+                continue
+            try:
+                provider = badge_provider_for(e.badge_source, e.cwd)
+            except (CatalogError, ValueError, TypeError) as err:
+                log.error("badge de %s: %s", key, err)
+                continue
+            self.add(key, provider)
+            self._specs[key] = spec
+
+    def values(self) -> dict:
+        return dict(self._values)
+
+    def _on_tick(self):
+        now = time.monotonic()
+        for key, (gen, started, timeout) in list(self._inflight.items()):
+            if now - started > timeout and gen > 0:
+                log.warning("badge %s: sin respuesta en %.1f s; se descarta", key, timeout)
+                self.stats["timeouts"] += 1
+                self._inflight[key] = (-gen, started, timeout)  # sigue ocupado hasta que vuelva
+                self._backoff[key] = min(self.MAX_BACKOFF, self._backoff.get(key, 1) * 2)
+        for key, due in self._due.items():
+            if due <= now and key not in self._inflight:
+                provider = self._providers[key]
+                gen = next(self._gen)
+                self._inflight[key] = (gen, now, provider.timeout)
+                self._due[key] = float("inf")
+                task = BadgeTask(key, gen, provider, provider.last_version)
+                task.signals.done.connect(self._on_done)
+                self.stats["runs"] += 1
+                self.pool.start(task)
+
+    @QtCore.pyqtSlot(str, int, object, object)
+    def _on_done(self, key: str, gen: int, value, version):
+        retired = self._retired.pop(gen, None)
+        if retired is not None:
+            retired.close()
+            return
+        current = self._inflight.get(key)
+        if current is None or abs(current[0]) != gen:
+            return  # proveedor eliminado o reemplazado
+        del self._inflight[key]
+        provider = self._providers[key]
+        if current[0] > 0:
+            self._backoff.pop(key, None)
+        self._due[key] = time.monotonic() + provider.interval * self._backoff.get(key, 1)
+        if current[0] < 0:
+            return  # llegó tarde: ya se dio por perdido (sin guardar su versión, se recuenta)
+        provider.last_version = version
+        if value is None or value == self._values.get(key):
+            self.stats["unchanged"] += 1
+            return
+        self._values[key] = value
+        self._pending[key] = value
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        if pending:
+            self.stats["flushes"] += 1
+            self.badgesChanged.emit(pending)
+
+    def stop(self):
+        self._tick.stop()
+        self.pool.clear()
+        self.pool.waitForDone(1000)
+        for p in self._providers.values():
+            p.close()
+
+# ----------------------------
+# Sombras pre-renderizadas (compartidas por todos los tiles)
+# ----------------------------
+class ShadowCache:
+    """Sombra del tile (TILE_W x TILE_H) pre-renderizada a radios de blur discretos.
+
+    Sustituye al QGraphicsDropShadowEffect por tile: en vez de renderizar el tile fuera de
+    pantalla y desenfocarlo en cada frame del hover, se pinta un pixmap ya desenfocado,
+    mezclando los dos frames vecinos para los radios intermedios.
+    Reproduce aquel efecto: misma silueta (SHAPES), color, desplazamiento y radios de blur.
+    """
+    REST_BLUR = 14.0
+    HOVER_BLUR = 26.0
+    FRAMES = 7
+    OFFSET = QtCore.QPointF(0, 6)
+    COLOR = QtGui.QColor(0, 0, 0, 180)
+    # lo que proyectaba sombra con el efecto sobre LauncherTile: el QToolButton del icono y el
+    # label, que pintan el fondo opaco de STYLE (márgenes 8,8,8,6 y separación 6 del layout).
+    # El botón se ensancha con labels largos; se toma el ancho del icono (ICON_SIZE + 8).
+    SHAPES = (QtCore.QRectF((TILE_W - ICON_SIZE - 8) / 2, 8, ICON_SIZE + 8, 97),
+              QtCore.QRectF(8, 111, TILE_W - 16, TILE_H - 117))
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "ShadowCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, size: QtCore.QSize = QtCore.QSize(TILE_W, TILE_H)):
+        step = (self.HOVER_BLUR - self.REST_BLUR) / (self.FRAMES - 1)
+        self.radii = [self.REST_BLUR + step * i for i in range(self.FRAMES)]
+        self.size = size
+        self.pad = int(self.HOVER_BLUR) + 4
+        screen = QtGui.QGuiApplication.primaryScreen()
+        self._dpr = screen.devicePixelRatio() if screen else 1.0
+        self.frames = [self._render(r) for r in self.radii]
+        self._scratch = None  # buffer de _blend()
+
+    def margin(self) -> int:
+        """Cuánto sobresale la sombra del rect del tile (para invalidar la zona correcta)."""
+        return self.pad + int(abs(self.OFFSET.y())) + 2
+
+    def _render(self, radius: float) -> QtGui.QPixmap:
+        w = self.size.width() + 2 * self.pad
+        h = self.size.height() + 2 * self.pad
+        scene = QtWidgets.QGraphicsScene(0, 0, w, h)
+        sx = self.size.width() / TILE_W
+        sy = self.size.height() / TILE_H
+        path = QtGui.QPainterPath()
+        for r in self.SHAPES:
+            path.addRect(QtCore.QRectF(self.pad + r.x() * sx, self.pad + r.y() * sy, r.width() * sx, r.height() * sy))
+        item = scene.addPath(path, QtGui.QPen(QtCore.Qt.PenStyle.NoPen), QtGui.QBrush(self.COLOR))
+        blur = QtWidgets.QGraphicsBlurEffect()
+        blur.setBlurRadius(radius)
+        blur.setBlurHints(QtWidgets.QGraphicsBlurEffect.BlurHint.QualityHint)
+        item.setGraphicsEffect(blur)
+        img = QtGui.QImage(int(w * self._dpr), int(h * self._dpr), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        img.setDevicePixelRatio(self._dpr)
+        img.fill(QtCore.Qt.GlobalColor.transparent)
+        p = QtGui.QPainter(img)
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        scene.render(p, QtCore.QRectF(0, 0, w, h), QtCore.QRectF(0, 0, w, h))
+        p.end()
+        return QtGui.QPixmap.fromImage(img)
+
+    def paint(self, painter: QtGui.QPainter, tile_rect: QtCore.QRectF, blur: float):
+        """Pinta la sombra para `tile_rect` con el radio `blur` (crossfade entre frames cacheados)."""
+        radii = self.radii
+        blur = min(max(blur, radii[0]), radii[-1])
+        i = min(int((blur - radii[0]) / (radii[1] - radii[0])), len(radii) - 2)
+        f = (blur - radii[i]) / (radii[i + 1] - radii[i])
+        sx = tile_rect.width() / self.size.width()
+        sy = tile_rect.height() / self.size.height()
+        target = tile_rect.adjusted(-self.pad * sx, -self.pad * sy, self.pad * sx, self.pad * sy)
+        target.translate(self.OFFSET)
+        if f < 0.001:
+            painter.drawPixmap(target, self.frames[i], QtCore.QRectF(self.frames[i].rect()))
+        else:
+            img = self._blend(i, f)
+            painter.drawImage(target, img, QtCore.QRectF(img.rect()))
+
+    def _blend(self, i: int, f: float) -> QtGui.QImage:
+        """Frames i e i+1 mezclados linealmente, (1-f)·i + f·(i+1), en un buffer reutilizado.
+
+        Pintarlos uno sobre otro con SourceOver (con opacidades 1-f y f, o el i opaco y el i+1 a f)
+        no es lineal: la sombra se aclara u oscurece a mitad de transición y salta al cambiar de
+        frame. Con Plus sobre un buffer transparente la suma premultiplicada es exacta.
+        """
+        img = self._scratch
+        if img is None:
+            pm = self.frames[0]
+            img = self._scratch = QtGui.QImage(pm.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+            img.setDevicePixelRatio(pm.devicePixelRatio())
+        img.fill(QtCore.Qt.GlobalColor.transparent)
+        p = QtGui.QPainter(img)
+        p.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_Plus)
+        p.setOpacity(1.0 - f)
+        p.drawPixmap(0, 0, self.frames[i])
+        p.setOpacity(f)
+        p.drawPixmap(0, 0, self.frames[i + 1])
+        p.end()
+        return img
+
+class TileGridContainer(QtWidgets.QWidget):
+    """Contenedor de la rejilla de widgets: pinta bajo cada tile su sombra cacheada."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tiles = []
+
+    def paintEvent(self, event):
+        p = QtGui.QPainter(self)
+        opt = QtWidgets.QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_Widget, opt, p, self)
+        shadows = ShadowCache.instance()
+        m = shadows.margin()
+        exposed = event.rect()
+        for t in self.tiles:
+            g = t.geometry()
+            if t.isVisible() and exposed.intersects(g.adjusted(-m, -m, m, m)):
+                shadows.paint(p, QtCore.QRectF(g), t.shadowBlur)
+        p.end()
+
+# ----------------------------
+# Launcher Tile with improved hover animations
+# ----------------------------
+class TileLabel(QtWidgets.QLabel):
+    """Label del tile: el color de hover se pinta directamente (mismos colores que TileDelegate)
+    en lugar de cambiar una propiedad y recalcular el stylesheet en cada enter/leave."""
+
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(text, parent)
+        self._hover = False
+
+    def set_hover(self, hover: bool):
+        if hover != self._hover:
+            self._hover = hover
+            self.update()
+
+    def paintEvent(self, ev):
+        p = QtGui.QPainter(self)
+        if not self.isEnabled():
+            p.setPen(TileDelegate.UNAVAILABLE_COLOR)
+        else:
+            p.setPen(TileDelegate.LABEL_HOVER_COLOR if self._hover else TileDelegate.LABEL_COLOR)
+        p.drawText(self.contentsRect(), self.alignment(), self.text())
+        p.end()
+
+class TileBase(QtWidgets.QWidget):
+    """Lo común a LauncherTile y CompactTile: señales, selección, radio de sombra animado y la
+    interacción (hover, pulsación, menú contextual y teclado). Cada subclase pinta a su manera y
+    aporta _set_hover() (color del label) y _start_ripple()."""
+    clicked = QtCore.pyqtSignal(object)  # emits self
+    hovered = QtCore.pyqtSignal(object)  # emits self al entrar el ratón
+    menuRequested = QtCore.pyqtSignal(object, QtCore.QPoint)  # self, posición global (click derecho)
+
+    def __init__(self, parent=None, entry: ProgramEntry = None):
+        super().__init__(parent)
+        self.entry = entry
+        self._selected = False
+        # shadow: la pinta el contenedor (TileGridContainer) con pixmaps de ShadowCache;
+        # aquí solo se guarda el radio actual para animarlo
+        self._shadow_blur = ShadowCache.REST_BLUR
+        # animaciones: se animan bajo demanda desde AnimationManager
+        self._icon_scale = 1.0
+        self._lift = 1.0
+        # focus & keyboard
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
+
+    @QtCore.pyqtProperty(float)
+    def shadowBlur(self):
+        return self._shadow_blur
+
+    @shadowBlur.setter
+    def shadowBlur(self, value: float):
+        self._shadow_blur = value
+        parent = self.parentWidget()
+        if parent is not None:
+            m = ShadowCache.instance().margin()
+            parent.update(self.geometry().adjusted(-m, -m, m, m))
+
+    def set_selected(self, state: bool):
+        # fondo de selección pintado en paintEvent: solo repinta este tile, sin re-polish
+        if state != self._selected:
+            self._selected = state
+            self.update()
         if state:
             self.setFocus(QtCore.Qt.FocusReason.OtherFocusReason)
 
-    def set_badge(self, value: int):
-        if value and value > 0:
-            txt = str(value) if value < 100 else "99+"
-            self.badge.setText(txt)
-            self.badge.adjustSize()
-            self.badge.move(self.width() - self.badge.width() - 12, 8)
-            self.badge.setVisible(True)
+    def is_selected(self) -> bool:
+        return self._selected
+
+    def _set_hover(self, hover: bool):
+        raise NotImplementedError
+
+    def _start_ripple(self):
+        raise NotImplementedError
+
+    # Hover enter/leave animations
+    def _tween(self, attr: str, end: float, duration: int, curve, enabled: bool = True):
+        # con la calidad reducida (MotionQuality) el efecto salta al valor final sin animarse
+        anims = AnimationManager.instance()
+        if enabled:
+            anims.animate(self, attr, getattr(self, attr), end, duration, curve)
+        else:
+            anims.stop(self, attr)
+            setattr(self, attr, end)
+
+    def enterEvent(self, ev):
+        motion = MotionQuality.instance()
+        # icon: grow ~12%
+        self._tween("iconScale", 1.12, 200, _OUT_CUBIC)
+        # size: allow small increase so it appears to lift (doesn't break layout much)
+        self._tween("lift", 1.04 if motion.lift else 1.0, 200, _OUT_CUBIC, motion.lift)
+        # shadow blur increase (lift)
+        self._tween("shadowBlur", ShadowCache.HOVER_BLUR, 200, _OUT_CUBIC, motion.shadow)
+
+        # label color change
+        self._set_hover(True)
+        self.hovered.emit(self)
+        return super().enterEvent(ev)
+
+    def leaveEvent(self, ev):
+        # reverse animations back to normal
+        motion = MotionQuality.instance()
+        self._tween("iconScale", 1.0, 180, _IN_CUBIC)
+        self._tween("lift", 1.0, 180, _IN_CUBIC, motion.lift)
+        self._tween("shadowBlur", ShadowCache.REST_BLUR, 180, _IN_CUBIC, motion.shadow)
+
+        # reset label color
+        self._set_hover(False)
+        return super().leaveEvent(ev)
+
+    # click micro-interaction + ripple
+    def mousePressEvent(self, ev):
+        if ev.button() == QtCore.Qt.MouseButton.LeftButton:
+            # small press shrink (quick)
+            self._tween("iconScale", 0.9, 100, _OUT_CUBIC)
+        return super().mousePressEvent(ev)
+
+    def mouseReleaseEvent(self, ev):
+        if ev.button() == QtCore.Qt.MouseButton.LeftButton:
+            # restore icon
+            self._tween("iconScale", 1.0, 160, _OUT_CUBIC)
+            if MotionQuality.instance().ripple:
+                self._start_ripple()
+            # emit clicked
+            self.clicked.emit(self)
+        return super().mouseReleaseEvent(ev)
+
+    def contextMenuEvent(self, ev):
+        self.menuRequested.emit(self, ev.globalPos())
+        ev.accept()
+
+    # keyboard activation + arrow delegation (same approach as before)
+    def keyPressEvent(self, ev: QtGui.QKeyEvent):
+        if ev.key() in (QtCore.Qt.Key.Key_Return, QtCore.Qt.Key.Key_Enter, QtCore.Qt.Key.Key_Space):
+            # simulate click with small delay
+            self.mousePressEvent(QtGui.QMouseEvent(QtCore.QEvent.Type.MouseButtonPress, QtCore.QPointF(self.width()/2,self.height()/2), QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.KeyboardModifier.NoModifier))
+            QtCore.QTimer.singleShot(90, lambda: self.mouseReleaseEvent(QtGui.QMouseEvent(QtCore.QEvent.Type.MouseButtonRelease, QtCore.QPointF(self.width()/2,self.height()/2), QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.KeyboardModifier.NoModifier)))
+            ev.accept()
+            return
+        if ev.key() in (QtCore.Qt.Key.Key_Left, QtCore.Qt.Key.Key_Right, QtCore.Qt.Key.Key_Up, QtCore.Qt.Key.Key_Down):
+            w = self.window()
+            if hasattr(w, "move_focus_from_tile"):
+                w.move_focus_from_tile(self, ev.key())
+                ev.accept()
+                return
+        return super().keyPressEvent(ev)
+
+class LauncherTile(TileBase):
+    def __init__(self, icon: QtGui.QIcon, label: str, exe: str, parent=None, entry: ProgramEntry = None):
+        super().__init__(parent, entry)
+        self.setObjectName("launcherTile")
+        self.exe = exe
+        self.icon = icon
+        self.label_text = label
+
+        self._icon_size = QtCore.QSize(ICON_SIZE, ICON_SIZE)
+        self._build_ui()
+        self.setFixedSize(TILE_W, TILE_H)
+
+        # ripple: el overlay se crea en el primer click
+        self.ripple = None
+
+    def _build_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(8,8,8,6)
+        layout.setSpacing(6)
+        self.toolbtn = QtWidgets.QToolButton()
+        self.toolbtn.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
+        self.toolbtn.setIcon(self.icon)
+        self.toolbtn.setIconSize(self._icon_size)
+        self.toolbtn.setText(self.label_text)
+        self.toolbtn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        # forward clicks from toolbtn to tile clicked
+        self.toolbtn.clicked.connect(lambda: self.clicked.emit(self))
+        # label under icon (for hover color change)
+        self.lbl = TileLabel(self.label_text)
+        self.lbl.setObjectName("tileLabel")
+        self.lbl.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.toolbtn, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.lbl)
+
+        # badge
+        self.badge = QtWidgets.QLabel("", self)
+        self.badge.setObjectName("badge")
+        self.badge.setProperty("class", "badge")
+        self.badge.setVisible(False)
+        self.badge.setStyleSheet("QLabel.badge { background: #ff4d4f; color: white; border-radius: 9px; padding: 2px 6px; font-size: 10px; font-weight: 700; }")
+        self.badge.move(self.width() - 36, 8)
+
+        # indicador "en ejecución" (lo actualiza ProcessSupervisor vía MainWindow)
+        self.running_dot = QtWidgets.QLabel(self)
+        self.running_dot.setFixedSize(8, 8)
+        self.running_dot.setStyleSheet("background: #52c41a; border-radius: 4px;")
+        self.running_dot.move(12, 12)
+        self.running_dot.setVisible(False)
+        self._usage = None  # texto de ResourceMonitor junto al punto (None = sin datos)
+
+    # property to animate icon size (for micro-interaction)
+    @QtCore.pyqtProperty(QtCore.QSize)
+    def iconSize(self):
+        return self._icon_size
+
+    @iconSize.setter
+    def iconSize(self, size: QtCore.QSize):
+        self._icon_size = size
+        self.toolbtn.setIconSize(size)
+
+    @property
+    def iconScale(self) -> float:
+        return self._icon_scale
+
+    @iconScale.setter
+    def iconScale(self, scale: float):
+        self._icon_scale = scale
+        side = int(ICON_SIZE * scale)
+        self.iconSize = QtCore.QSize(side, side)
+
+    @property
+    def lift(self) -> float:
+        return self._lift
+
+    @lift.setter
+    def lift(self, factor: float):
+        # maximumSize algo mayor para simular elevación sin romper el layout
+        self._lift = factor
+        self.setMaximumSize(int(TILE_W * factor), int(TILE_H * factor))
+
+    def set_icon(self, icon: QtGui.QIcon):
+        self.icon = icon
+        self.toolbtn.setIcon(icon)
+
+    def set_entry(self, entry: ProgramEntry, icon: QtGui.QIcon):
+        """Refresca el tile tras una recarga del catálogo sin recrearlo."""
+        self.entry = entry
+        self.exe = entry.exe
+        self.label_text = entry.label
+        self.set_icon(icon)
+        self.toolbtn.setText(entry.label)
+        self.lbl.setText(entry.label)
+        self.set_badge(entry.badge)
+
+    def paintEvent(self, ev):
+        if not (self._selected or self._usage):
+            return
+        p = QtGui.QPainter(self)
+        if self._selected:
+            p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            p.setBrush(TileDelegate.SELECTED_BG)
+            p.setPen(QtGui.QPen(TileDelegate.SELECTED_BORDER, 1))
+            p.drawRoundedRect(QtCore.QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+        if self._usage:
+            p.setFont(TileDelegate.usage_font())
+            p.setPen(TileDelegate.USAGE_COLOR)
+            p.drawText(TileDelegate.usage_rect(QtCore.QRectF(self.rect())), TileDelegate.USAGE_ALIGN, self._usage)
+        p.end()
+
+    def set_badge(self, value: int):
+        if value and value > 0:
+            txt = str(value) if value < 100 else "99+"
+            self.badge.setText(txt)
+            self.badge.adjustSize()
+            self.badge.move(self.width() - self.badge.width() - 12, 8)
+            self.badge.setVisible(True)
+        else:
+            self.badge.setVisible(False)
+
+    def set_running(self, count: int):
+        self.running_dot.setVisible(count > 0)
+        self.running_dot.setToolTip(f"En ejecución ({count})" if count > 1 else "En ejecución")
+        if not count:
+            self.set_usage(None)
+
+    def set_usage(self, text: str):
+        """CPU y memoria del programa en ejecución (ResourceMonitor); solo repinta la franja del texto."""
+        if text != self._usage:
+            self._usage = text
+            self.update(TileDelegate.usage_rect(QtCore.QRectF(self.rect())).toAlignedRect())
+
+    def set_available(self, available: bool):
+        """Ejecutable no encontrado (ExeResolver): icono y label en gris. El tile sigue en la
+        navegación con teclado y un click avisa sin lanzar nada."""
+        self.toolbtn.setEnabled(available)
+        self.lbl.setEnabled(available)
+        self.setToolTip("" if available else f"No encontrado: {self.exe}")
+
+    def _set_hover(self, hover: bool):
+        self.lbl.set_hover(hover)
+
+    def _start_ripple(self):
+        if self.ripple is None:
+            self.ripple = RippleOverlay(self, QtGui.QColor(255,255,255,100))
+            self.ripple.setGeometry(0, 0, TILE_W, TILE_H)
+        max_r = max(self.width(), self.height()) * 0.9
+        self.ripple.start(max_radius=max_r, duration=420)
+
+# ----------------------------
+# Tile compacto: un solo widget sin hijos que se pinta entero en su paintEvent
+# ----------------------------
+COMPACT_TILES_ENV = "PROGAIN_COMPACT_TILES"
+
+class SharedRipple:
+    """Ripple de los CompactTile: uno para toda la rejilla (se ve el del último click).
+
+    El progreso vive aquí, animado por AnimationManager, y el tile destino lo pinta en su propio
+    paintEvent: ningún tile necesita su propio RippleOverlay.
+    """
+    DURATION_MS = 420
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "SharedRipple":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.tile = None
+        self._progress = None
+
+    @property
+    def progress(self):
+        return self._progress
+
+    @progress.setter
+    def progress(self, value: float):
+        self._progress = value
+        if self.tile is not None:
+            self.tile.update()  # RuntimeError si el tile se destruyó: AnimationManager corta la animación
+
+    def progress_for(self, tile):
+        """Progreso 0..1 del ripple si `tile` es el destino; None si no."""
+        return self._progress if tile is self.tile else None
+
+    def start(self, tile):
+        previous, self.tile = self.tile, tile
+        if previous is not None and previous is not tile:
+            try:
+                previous.update()  # borra su ripple a medias
+            except RuntimeError:
+                pass
+        AnimationManager.instance().animate(self, "progress", 0.0, 1.0, self.DURATION_MS, _LINEAR,
+                                            on_done=self._on_finish)
+
+    def _on_finish(self):
+        tile, self.tile, self._progress = self.tile, None, None
+        if tile is not None:
+            tile.update()
+
+class CompactTile(TileBase):
+    """Tile de la rejilla de widgets sin widgets hijos: icono, label, badge, punto "en ejecución",
+    uso de CPU/memoria y ripple se pintan en un solo paintEvent con las fuentes y colores de
+    TileDelegate, y el ripple es el de SharedRipple. Misma interfaz que LauncherTile (señales,
+    set_*, propiedades animadas; lo común está en TileBase), así que la rejilla, la selección y el
+    layout no distinguen.
+    PROGAIN_COMPACT_TILES=1 lo usa en lugar de LauncherTile; benchmarks/bench_tile_memory.py
+    compara los dos.
+    """
+    DOT_CENTER = QtCore.QPointF(16, 16)
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get(COMPACT_TILES_ENV, "").strip() not in ("", "0")
+
+    def __init__(self, icon: QtGui.QIcon, label: str, exe: str, parent=None, entry: ProgramEntry = None):
+        super().__init__(parent, entry)
+        self.exe = exe
+        self.icon = icon
+        self.label_text = label
+        self._hover = False
+        self._badge = ""
+        self._running = 0
+        self._usage = None
+        self._available = True
+        self.setFixedSize(TILE_W, TILE_H)
+        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+
+    # --- propiedades animadas (mismas que LauncherTile) ---
+    @property
+    def iconScale(self) -> float:
+        return self._icon_scale
+
+    @iconScale.setter
+    def iconScale(self, scale: float):
+        self._icon_scale = scale
+        self.update()
+
+    @property
+    def lift(self) -> float:
+        return self._lift
+
+    @lift.setter
+    def lift(self, factor: float):
+        # el contenido crece dentro del tile: sin tocar el tamaño ni el layout
+        self._lift = factor
+        self.update()
+
+    # --- estado ---
+    def set_icon(self, icon: QtGui.QIcon):
+        self.icon = icon
+        self.update()
+
+    def set_entry(self, entry: ProgramEntry, icon: QtGui.QIcon):
+        self.entry = entry
+        self.exe = entry.exe
+        self.label_text = entry.label
+        self.icon = icon
+        self.set_badge(entry.badge)
+        self.update()
+
+    def set_badge(self, value: int):
+        text = "" if not value or value <= 0 else (str(value) if value < 100 else "99+")
+        if text != self._badge:
+            self._badge = text
+            self.update()
+
+    def set_running(self, count: int):
+        if count != self._running:
+            self._running = count
+            if not count:
+                self._usage = None
+            self.update()
+
+    def set_usage(self, text: str):
+        if text != self._usage:
+            self._usage = text
+            self.update(TileDelegate.usage_rect(QtCore.QRectF(self.rect())).toAlignedRect())
+
+    def set_available(self, available: bool):
+        if available != self._available:
+            self._available = available
+            self.setToolTip("" if available else f"No encontrado: {self.exe}")
+            self.update()
+
+    # --- pintado ---
+    def paintEvent(self, ev):
+        p = QtGui.QPainter(self)
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        rect = QtCore.QRectF(self.rect())
+        if self._selected:
+            p.setBrush(TileDelegate.SELECTED_BG)
+            p.setPen(QtGui.QPen(TileDelegate.SELECTED_BORDER, 1))
+            p.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        # mismo encuadre que TileDelegate; el lift escala el contenido desde el centro
+        if self._lift != 1.0:
+            c = rect.center()
+            p.translate(c)
+            p.scale(self._lift, self._lift)
+            p.translate(-c)
+        if self.icon is not None and not self.icon.isNull():
+            side = ICON_SIZE * self._icon_scale
+            icon_rect = QtCore.QRectF(0, 0, side, side)
+            icon_rect.moveCenter(QtCore.QPointF(rect.center().x(), rect.top() + 14 + ICON_SIZE * 0.56))
+            mode = QtGui.QIcon.Mode.Normal if self._available else QtGui.QIcon.Mode.Disabled
+            self.icon.paint(p, icon_rect.toRect(), QtCore.Qt.AlignmentFlag.AlignCenter, mode)
+        p.setFont(TileDelegate.fonts()[0])
+        if not self._available:
+            p.setPen(TileDelegate.UNAVAILABLE_COLOR)
+        else:
+            p.setPen(TileDelegate.LABEL_HOVER_COLOR if self._hover else TileDelegate.LABEL_COLOR)
+        p.drawText(QtCore.QRectF(rect.left() + 8, rect.bottom() - 40, rect.width() - 16, 30),
+                   QtCore.Qt.AlignmentFlag.AlignCenter, self.label_text)
+        p.resetTransform()
+
+        if self._badge:
+            TileDelegate.paint_badge(p, rect, self._badge)
+        if self._running:
+            p.setPen(QtCore.Qt.PenStyle.NoPen)
+            p.setBrush(TileDelegate.RUNNING_COLOR)
+            p.drawEllipse(self.DOT_CENTER, 4, 4)
+            if self._usage:
+                p.setFont(TileDelegate.usage_font())
+                p.setPen(TileDelegate.USAGE_COLOR)
+                p.drawText(TileDelegate.usage_rect(rect), TileDelegate.USAGE_ALIGN, self._usage)
+        ripple = SharedRipple.instance().progress_for(self)
+        if ripple is not None:
+            TileDelegate.paint_ripple(p, rect, ripple)
+        p.end()
+
+    def event(self, ev):
+        # el punto "en ejecución" no es un widget: su tooltip se resuelve aquí
+        if ev.type() == QtCore.QEvent.Type.ToolTip and self._running:
+            if QtCore.QLineF(QtCore.QPointF(ev.pos()), self.DOT_CENTER).length() <= 6:
+                count = self._running
+                QtWidgets.QToolTip.showText(ev.globalPos(), f"En ejecución ({count})" if count > 1 else "En ejecución", self)
+                return True
+        return super().event(ev)
+
+    # --- interacción (animaciones en TileBase) ---
+    def _set_hover(self, hover: bool):
+        if hover != self._hover:
+            self._hover = hover
+            self.update()
+
+    def _start_ripple(self):
+        SharedRipple.instance().start(self)
+
+# ----------------------------
+# Rejilla virtualizada (model/delegate): solo pinta los tiles visibles
+# ----------------------------
+ENTRY_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
+BADGE_ROLE = QtCore.Qt.ItemDataRole.UserRole + 2
+RUNNING_ROLE = QtCore.Qt.ItemDataRole.UserRole + 3
+AVAILABLE_ROLE = QtCore.Qt.ItemDataRole.UserRole + 4
+USAGE_ROLE = QtCore.Qt.ItemDataRole.UserRole + 5
+
+class TileListModel(QtCore.QAbstractListModel):
+    """Modelo plano sobre las entradas visibles; no crea ningún widget por entrada."""
+
+    def __init__(self, icon_for, parent=None):
+        super().__init__(parent)
+        self._icon_for = icon_for
+        self._rows = []
+        self._row_of = {}
+        self._running = {}  # key -> nº de instancias vivas (ProcessSupervisor)
+        self._unavailable = set()  # keys sin ejecutable (ExeResolver)
+        self._usage = {}  # key -> texto de CPU/memoria (ResourceMonitor)
+
+    def set_visible(self, entries):
+        self.beginResetModel()
+        self._rows = list(entries)
+        self._row_of = {e.key: i for i, e in enumerate(self._rows)}
+        self.endResetModel()
+
+    def entries(self):
+        return self._rows
+
+    def row_of(self, key) -> int:
+        return self._row_of.get(key, -1)
+
+    def refresh_entry(self, entry):
+        row = self.row_of(entry.key)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx)
+
+    def set_running(self, key: str, count: int):
+        if count > 0:
+            self._running[key] = count
+        else:
+            self._running.pop(key, None)
+        row = self.row_of(key)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [RUNNING_ROLE])
+
+    def set_usage(self, key: str, text: str):
+        if text:
+            self._usage[key] = text
+        else:
+            self._usage.pop(key, None)
+        row = self.row_of(key)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [USAGE_ROLE])
+
+    def set_available(self, key: str, available: bool):
+        if available:
+            self._unavailable.discard(key)
+        else:
+            self._unavailable.add(key)
+        row = self.row_of(key)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [AVAILABLE_ROLE, QtCore.Qt.ItemDataRole.ToolTipRole])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        e = self._rows[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return e.label
+        if role == QtCore.Qt.ItemDataRole.DecorationRole:
+            return self._icon_for(e)
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return f"No encontrado: {e.exe}" if e.key in self._unavailable else e.exe
+        if role == ENTRY_ROLE:
+            return e
+        if role == BADGE_ROLE:
+            return e.badge
+        if role == RUNNING_ROLE:
+            return self._running.get(e.key, 0)
+        if role == AVAILABLE_ROLE:
+            return e.key not in self._unavailable
+        if role == USAGE_ROLE:
+            return self._usage.get(e.key)
+        return None
+
+class _TileAnimState:
+    """Estado de animación de un tile virtual; solo existe mientras el tile está animado o con hover."""
+    __slots__ = ("hover", "icon_scale", "ripple")
+
+    def __init__(self):
+        self.hover = None       # _Tween 0..1 (lift + color de label)
+        self.icon_scale = None  # _Tween del factor de escala del icono
+        self.ripple = None      # _Tween 0..1 del progreso del ripple
+
+    def values(self, now: float):
+        hover = self.hover.value(now) if self.hover else 0.0
+        scale = self.icon_scale.value(now) if self.icon_scale else 1.0
+        ripple = self.ripple.value(now) if self.ripple else None
+        return hover, scale, ripple
+
+    def active(self, now: float) -> bool:
+        return any(t is not None and not t.done(now) for t in (self.hover, self.icon_scale, self.ripple))
+
+    def at_rest(self, now: float) -> bool:
+        hover, scale, _ = self.values(now)
+        return not self.active(now) and hover == 0.0 and scale == 1.0
+
+class TileDelegate(QtWidgets.QStyledItemDelegate):
+    """Pinta un tile completo (fondo, sombra, icono, label, badge y ripple) sin widgets hijos."""
+
+    LABEL_COLOR = QtGui.QColor("#9AA5B1")
+    LABEL_HOVER_COLOR = QtGui.QColor("#ffffff")
+    BADGE_COLOR = QtGui.QColor("#ff4d4f")
+    RUNNING_COLOR = QtGui.QColor("#52c41a")
+    UNAVAILABLE_COLOR = QtGui.QColor("#5C6670")
+    USAGE_COLOR = QtGui.QColor("#7F8B96")
+    USAGE_ALIGN = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+    SELECTED_BG = QtGui.QColor(46, 168, 255, 15)
+    SELECTED_BORDER = QtGui.QColor(46, 168, 255, 31)
+    LIFT = 0.04  # crecimiento del tile con el hover
+
+    _fonts = None  # (label, badge, uso, métricas del badge)
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._label_font = self.fonts()[0]
+
+    @classmethod
+    def fonts(cls):
+        """Fuentes de los tiles, creadas una sola vez y compartidas con LauncherTile y CompactTile."""
+        if cls._fonts is None:
+            label = QtGui.QFont()
+            label.setPixelSize(11)
+            label.setWeight(QtGui.QFont.Weight.DemiBold)
+            badge = QtGui.QFont()
+            badge.setPixelSize(10)
+            badge.setWeight(QtGui.QFont.Weight.Bold)
+            usage = QtGui.QFont()
+            usage.setPixelSize(9)
+            cls._fonts = (label, badge, usage, QtGui.QFontMetrics(badge))
+        return cls._fonts
+
+    @classmethod
+    def usage_font(cls) -> QtGui.QFont:
+        return cls.fonts()[2]
+
+    @staticmethod
+    def usage_rect(tile: QtCore.QRectF) -> QtCore.QRectF:
+        """Franja del texto de CPU/memoria: a la derecha del punto "en ejecución", antes del badge."""
+        return QtCore.QRectF(tile.left() + 24, tile.top() + 9, tile.width() - 80, 14)
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(TILE_W, TILE_H)
+
+    @classmethod
+    def tile_rect(cls, rect: QtCore.QRectF, hover: float) -> QtCore.QRectF:
+        """Rect del tile con el lift: crece hasta LIFT desde el centro (sin lift con menos calidad)."""
+        lift = 1.0 + cls.LIFT * hover if MotionQuality.instance().lift else 1.0
+        tile = QtCore.QRectF(0, 0, rect.width() * lift, rect.height() * lift)
+        tile.moveCenter(rect.center())
+        return tile
+
+    @classmethod
+    def paint_shadow(cls, painter: QtGui.QPainter, rect: QtCore.QRectF, hover: float):
+        """Sombra del tile en `rect`; con menos calidad (MotionQuality) salta al estado final."""
+        shadow = hover if MotionQuality.instance().shadow else float(hover >= 0.5)
+        ShadowCache.instance().paint(painter, cls.tile_rect(rect, hover),
+                                     ShadowCache.REST_BLUR + (ShadowCache.HOVER_BLUR - ShadowCache.REST_BLUR) * shadow)
+
+    def paint(self, painter: QtGui.QPainter, option, index):
+        entry = index.data(ENTRY_ROLE)
+        hover, scale, ripple = self._view.anim_values(entry)
+        rect = QtCore.QRectF(option.rect)
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+        # la sombra no se pinta aquí: VirtualTileGrid las pinta todas antes, bajo los tiles
+        tile = self.tile_rect(rect, hover)
+
+        if option.state & QtWidgets.QStyle.StateFlag.State_Selected:
+            painter.setBrush(self.SELECTED_BG)
+            painter.setPen(QtGui.QPen(self.SELECTED_BORDER, 1))
+            painter.drawRoundedRect(tile.adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        # icono (pop al hover, shrink al pulsar); en gris si el ejecutable no está (ExeResolver)
+        available = index.data(AVAILABLE_ROLE)
+        icon = index.data(QtCore.Qt.ItemDataRole.DecorationRole)
+        if icon is not None and not icon.isNull():
+            side = ICON_SIZE * scale
+            icon_rect = QtCore.QRectF(0, 0, side, side)
+            icon_rect.moveCenter(QtCore.QPointF(tile.center().x(), tile.top() + 14 + ICON_SIZE * 0.56))
+            mode = QtGui.QIcon.Mode.Normal if available else QtGui.QIcon.Mode.Disabled
+            icon.paint(painter, icon_rect.toRect(), QtCore.Qt.AlignmentFlag.AlignCenter, mode)
+
+        # label
+        painter.setFont(self._label_font)
+        if not available:
+            color = self.UNAVAILABLE_COLOR
+        else:
+            color = self.LABEL_HOVER_COLOR if hover >= 0.5 else self.LABEL_COLOR
+        painter.setPen(color)
+        text_rect = QtCore.QRectF(tile.left() + 8, tile.bottom() - 40, tile.width() - 16, 30)
+        painter.drawText(text_rect, QtCore.Qt.AlignmentFlag.AlignCenter, index.data(QtCore.Qt.ItemDataRole.DisplayRole) or "")
+
+        badge = index.data(BADGE_ROLE)
+        if badge and badge > 0:
+            self.paint_badge(painter, tile, str(badge) if badge < 100 else "99+")
+
+        if index.data(RUNNING_ROLE):
+            painter.setPen(QtCore.Qt.PenStyle.NoPen)
+            painter.setBrush(self.RUNNING_COLOR)
+            painter.drawEllipse(QtCore.QPointF(tile.left() + 16, tile.top() + 16), 4, 4)
+            usage = index.data(USAGE_ROLE)
+            if usage:
+                painter.setFont(self.usage_font())
+                painter.setPen(self.USAGE_COLOR)
+                painter.drawText(self.usage_rect(tile), self.USAGE_ALIGN, usage)
+
+        if ripple is not None:
+            self.paint_ripple(painter, tile, ripple)
+        painter.restore()
+
+    @classmethod
+    def paint_badge(cls, painter, tile: QtCore.QRectF, text: str):
+        _, font, _, metrics = cls.fonts()
+        w = max(18, metrics.horizontalAdvance(text) + 12)
+        h = metrics.height() + 4
+        r = QtCore.QRectF(tile.right() - w - 12, tile.top() + 8, w, h)
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(cls.BADGE_COLOR)
+        painter.drawRoundedRect(r, h / 2, h / 2)
+        painter.setFont(font)
+        painter.setPen(QtGui.QColor("white"))
+        painter.drawText(r, QtCore.Qt.AlignmentFlag.AlignCenter, text)
+
+    @staticmethod
+    def paint_ripple(painter, tile: QtCore.QRectF, progress: float):
+        # mismos tiempos que RippleOverlay.start: radio en el 90% de la duración, opacidad 0.7 -> 0.25 (60%) -> 0
+        max_r = max(tile.width(), tile.height()) * 0.9
+        radius = max_r * _OUT_CUBIC.valueForProgress(min(1.0, progress / 0.9))
+        if progress < 0.6:
+            opacity = 0.7 - 0.45 * (progress / 0.6)
+        else:
+            opacity = 0.25 * (1.0 - (progress - 0.6) / 0.4)
+        if radius <= 0 or opacity <= 0:
+            return
+        c = QtGui.QColor(255, 255, 255, 100)
+        c.setAlphaF(opacity)
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(c)
+        painter.save()
+        path = QtGui.QPainterPath()
+        path.addRoundedRect(tile, 10, 10)
+        painter.setClipPath(path)
+        painter.drawEllipse(tile.center(), radius, radius)
+        painter.restore()
+
+class VirtualTileGrid(QtWidgets.QListView):
+    """Rejilla de tiles sobre QListView en modo icono: memoria y coste de pintado constantes por tile visible."""
+    entryClicked = QtCore.pyqtSignal(object)  # emite la ProgramEntry
+    entryHovered = QtCore.pyqtSignal(object)  # emite la ProgramEntry al entrar el ratón en su tile
+    entryMenuRequested = QtCore.pyqtSignal(object, QtCore.QPoint)  # ProgramEntry, posición global
+
+    def __init__(self, model: TileListModel, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(TileDelegate(self))
+        self.setViewMode(QtWidgets.QListView.ViewMode.IconMode)
+        self.setMovement(QtWidgets.QListView.Movement.Static)
+        self.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.setBatchSize(256)
+        self.setUniformItemSizes(True)
+        self.setWrapping(True)
+        self.setGridSize(QtCore.QSize(TILE_W + GRID_SPACING, TILE_H + GRID_SPACING))
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+
+        self._anims = {}  # entry.key -> _TileAnimState (solo tiles animados o con hover)
+        self._hover_key = None
+        self._pressed_key = None
+
+    # --- estado de animación ---
+    def anim_values(self, entry):
+        st = self._anims.get(entry.key) if entry is not None else None
+        if st is None:
+            return 0.0, 1.0, None
+        return st.values(time.monotonic())
+
+    def _state(self, key) -> _TileAnimState:
+        st = self._anims.get(key)
+        if st is None:
+            st = self._anims[key] = _TileAnimState()
+        return st
+
+    def _animate(self, key, attr: str, end: float, duration: int, curve):
+        st = self._state(key)
+        now = time.monotonic()
+        current = getattr(st, attr)
+        start = current.value(now) if current else (0.0 if attr == "hover" else 1.0)
+        anims = AnimationManager.instance()
+        anims.release(current)
+        setattr(st, attr, anims.acquire(start, end, duration, curve))
+        self._update_key(key)
+        anims.request_frames(self)
+
+    @staticmethod
+    def paint_margin() -> int:
+        """Cuánto pinta un tile fuera de su visualRect: la sombra y el crecimiento del lift."""
+        return ShadowCache.instance().margin() + math.ceil(max(TILE_W, TILE_H) * TileDelegate.LIFT / 2)
+
+    def _update_key(self, key):
+        row = self.model().row_of(key)
+        if row >= 0:
+            r = self.visualRect(self.model().index(row))
+            if r.isValid():
+                m = self.paint_margin()
+                self.viewport().update(r.adjusted(-m, -m, m, m))
+
+    def _indexes_near(self, rect: QtCore.QRect):
+        """Índices cuyo tile, con su sombra, toca `rect` del viewport (uno por celda de la rejilla)."""
+        model = self.model()
+        if model.rowCount() == 0:
+            return
+        m = self.paint_margin()
+        area = rect.adjusted(-m, -m, m, m)
+        grid = self.gridSize()
+        # las celdas son uniformes: se prueba el centro de cada una a partir de la primera
+        origin = self.visualRect(model.index(0, 0)).center()
+        col0 = math.floor((area.left() - origin.x()) / grid.width())
+        row0 = math.floor((area.top() - origin.y()) / grid.height())
+        col1 = math.ceil((area.right() - origin.x()) / grid.width())
+        row1 = math.ceil((area.bottom() - origin.y()) / grid.height())
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                idx = self.indexAt(QtCore.QPoint(origin.x() + col * grid.width(), origin.y() + row * grid.height()))
+                if idx.isValid():
+                    yield idx
+
+    def paintEvent(self, ev):
+        # primero todas las sombras y después los tiles (QListView): pintada por el delegate, la
+        # sombra de un tile tapaba a los vecinos ya pintados
+        p = QtGui.QPainter(self.viewport())
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        for idx in self._indexes_near(ev.rect()):
+            hover = self.anim_values(idx.data(ENTRY_ROLE))[0]
+            TileDelegate.paint_shadow(p, QtCore.QRectF(self.visualRect(idx)), hover)
+        p.end()
+        super().paintEvent(ev)
+
+    def on_animation_frame(self, now: float) -> bool:
+        """Tick de AnimationManager: repinta los tiles animados; False cuando ya no queda nada en curso."""
+        anims = AnimationManager.instance()
+        for key in list(self._anims):
+            st = self._anims[key]
+            self._update_key(key)
+            if st.ripple is not None and st.ripple.done(now):
+                anims.release(st.ripple)
+                st.ripple = None
+            if st.at_rest(now) and key != self._hover_key:
+                anims.release(st.hover)
+                anims.release(st.icon_scale)
+                del self._anims[key]
+        return any(st.active(now) for st in self._anims.values())
+
+    def _set_hover(self, key):
+        if key == self._hover_key:
+            return
+        if self._hover_key is not None:
+            self._animate(self._hover_key, "hover", 0.0, 180, _IN_CUBIC)
+            self._animate(self._hover_key, "icon_scale", 1.0, 180, _IN_CUBIC)
+        self._hover_key = key
+        if key is not None:
+            self._animate(key, "hover", 1.0, 200, _OUT_CUBIC)
+            self._animate(key, "icon_scale", 1.12, 200, _OUT_CUBIC)
+
+    def _press(self, key):
+        self._pressed_key = key
+        self._animate(key, "icon_scale", 0.9, 100, _OUT_CUBIC)
+
+    def _release(self, key):
+        self._pressed_key = None
+        self._animate(key, "icon_scale", 1.0, 160, _OUT_CUBIC)
+        if not MotionQuality.instance().ripple:
+            return
+        st = self._state(key)
+        anims = AnimationManager.instance()
+        anims.release(st.ripple)
+        st.ripple = anims.acquire(0.0, 1.0, 420, _LINEAR)
+
+    def _entry_at(self, pos):
+        idx = self.indexAt(pos)
+        return idx.data(ENTRY_ROLE) if idx.isValid() else None
+
+    # --- eventos ---
+    def mouseMoveEvent(self, ev):
+        e = self._entry_at(ev.position().toPoint())
+        key = e.key if e is not None else None
+        if key != self._hover_key and e is not None:
+            self.entryHovered.emit(e)
+        self._set_hover(key)
+        super().mouseMoveEvent(ev)
+
+    def leaveEvent(self, ev):
+        self._set_hover(None)
+        super().leaveEvent(ev)
+
+    def contextMenuEvent(self, ev):
+        e = self._entry_at(ev.pos())
+        if e is not None:
+            self.entryMenuRequested.emit(e, ev.globalPos())
+            ev.accept()
+
+    def mousePressEvent(self, ev):
+        super().mousePressEvent(ev)
+        if ev.button() == QtCore.Qt.MouseButton.LeftButton:
+            e = self._entry_at(ev.position().toPoint())
+            if e is not None:
+                self._press(e.key)
+
+    def mouseReleaseEvent(self, ev):
+        super().mouseReleaseEvent(ev)
+        if ev.button() == QtCore.Qt.MouseButton.LeftButton and self._pressed_key is not None:
+            key = self._pressed_key
+            self._release(key)
+            e = self._entry_at(ev.position().toPoint())
+            if e is not None and e.key == key:
+                self.entryClicked.emit(e)
+
+    def keyPressEvent(self, ev: QtGui.QKeyEvent):
+        if ev.key() in (QtCore.Qt.Key.Key_Return, QtCore.Qt.Key.Key_Enter, QtCore.Qt.Key.Key_Space):
+            idx = self.currentIndex()
+            if idx.isValid():
+                e = idx.data(ENTRY_ROLE)
+                # mismo "click simulado" que LauncherTile: press y release a los 90 ms
+                self._press(e.key)
+                def release():
+                    self._release(e.key)
+                    self.entryClicked.emit(e)
+                QtCore.QTimer.singleShot(90, release)
+            ev.accept()
+            return
+        super().keyPressEvent(ev)
+
+# ----------------------------
+# Motor de layout incremental (coalesce resize/búsqueda en un frame)
+# ----------------------------
+class GridLayoutEngine(QtCore.QObject):
+    """Agrupa las peticiones de relayout de un frame y solo mueve los tiles cuya celda cambió.
+
+    `compute()` devuelve (cols, items visibles en orden). Con `layout` los items son widgets
+    y se recolocan en el QGridLayout; sin él se llama a `apply(cols, items)` (rejilla virtual).
+    """
+    FRAME_MS = 16
+
+    laidOut = QtCore.pyqtSignal(int, object)  # cols, items visibles (tupla) tras cada pasada con cambios
+
+    def __init__(self, compute, layout: QtWidgets.QGridLayout = None, apply=None, parent=None):
+        super().__init__(parent)
+        self._compute = compute
+        self._layout = layout
+        self._apply = apply
+        self._cols = None
+        self._visible = ()
+        self._pos = {}  # widget -> (row, col)
+        self.stats = {"requests": 0, "runs": 0, "skipped": 0, "moved": 0}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.FRAME_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def schedule(self):
+        """Pide un relayout; varias peticiones dentro del mismo frame se resuelven en una sola pasada."""
+        self.stats["requests"] += 1
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Aplica el layout pendiente ya. Devuelve False si no había nada que cambiar."""
+        self._timer.stop()
+        cols, visible = self._compute()
+        visible = tuple(visible)
+        if cols == self._cols and visible == self._visible:
+            self.stats["skipped"] += 1
+            return False
+        self.stats["runs"] += 1
+        if self._layout is not None:
+            self._place(cols, visible)
+        elif self._apply is not None and visible != self._visible:
+            self._apply(cols, visible)
+        self._cols = cols
+        self._visible = visible
+        self.laidOut.emit(cols, visible)
+        return True
+
+    @property
+    def visible(self) -> tuple:
+        """Items colocados en la última pasada, en orden de celda."""
+        return self._visible
+
+    def forget(self, widget):
+        """Saca del layout un widget que va a destruirse (p. ej. entrada eliminada del catálogo)."""
+        if self._pos.pop(widget, None) is not None and self._layout is not None:
+            self._layout.removeWidget(widget)
+
+    def _place(self, cols: int, visible: tuple):
+        align = QtCore.Qt.AlignmentFlag.AlignCenter
+        new_pos = {w: divmod(i, cols) for i, w in enumerate(visible)}
+        old_pos = self._pos
+        for w, pos in old_pos.items():
+            new = new_pos.get(w)
+            if new != pos:
+                self._layout.removeWidget(w)
+                if new is None:
+                    w.hide()
+        moved = 0
+        for w, pos in new_pos.items():
+            old = old_pos.get(w)
+            if old != pos:
+                self._layout.addWidget(w, pos[0], pos[1], alignment=align)
+                moved += 1
+                if old is None:
+                    w.show()
+        self._pos = new_pos
+        self.stats["moved"] += moved
+
+class TileSelection:
+    """Selección y navegación con flechas de la rejilla de widgets en tiempo constante.
+
+    El índice tile -> posición se reconstruye solo en cada relayout (GridLayoutEngine.laidOut);
+    una tecla es aritmética sobre ese índice y select() solo restila el tile que pierde la
+    selección y el que la gana.
+    """
+
+    def __init__(self):
+        self.current = None
+        self._order = ()
+        self._pos = {}
+        self._cols = 1
+
+    def set_layout(self, cols: int, visible):
+        self._cols = max(1, cols)
+        self._order = tuple(visible)
+        self._pos = {t: i for i, t in enumerate(self._order)}
+        if self.current is not None and self.current not in self._pos:
+            # oculto por la búsqueda o eliminado del catálogo (deleteLater: aún existe)
+            self.current.set_selected(False)
+            self.current = None
+
+    def neighbor(self, tile, key):
+        """Tile al que lleva la flecha `key` desde `tile` (el mismo en los bordes; None si no está colocado)."""
+        idx = self._pos.get(tile)
+        if idx is None:
+            return None
+        cols, n = self._cols, len(self._order)
+        r, c = divmod(idx, cols)
+        if key == QtCore.Qt.Key.Key_Left:
+            new_idx = idx - 1 if c > 0 else idx
+        elif key == QtCore.Qt.Key.Key_Right:
+            new_idx = idx + 1 if (c < cols - 1 and idx + 1 < n) else idx
+        elif key == QtCore.Qt.Key.Key_Up:
+            new_idx = idx - cols if r > 0 else idx
+        elif key == QtCore.Qt.Key.Key_Down:
+            new_idx = idx + cols if idx + cols < n else idx
         else:
-            self.badge.setVisible(False)
+            new_idx = idx
+        return self._order[new_idx]
 
-    # Hover enter/leave animations
-    def enterEvent(self, ev):
-        # populate hover animation start/end
-        # icon: grow ~12%
-        start_icon = self.toolbtn.iconSize()
-        end_icon = QtCore.QSize(int(ICON_SIZE * 1.12), int(ICON_SIZE * 1.12))
-        self._icon_anim.stop()
-        self._icon_anim.setStartValue(start_icon)
-        self._icon_anim.setEndValue(end_icon)
-        # size: allow small increase so it appears to lift (doesn't break layout much)
-        start_size = self.maximumSize()
-        if start_size.width() == 16777215:  # default max
-            start_size = QtCore.QSize(TILE_W, TILE_H)
-        end_size = QtCore.QSize(int(TILE_W * 1.04), int(TILE_H * 1.04))
-        self._size_anim.stop()
-        self._size_anim.setStartValue(start_size)
-        self._size_anim.setEndValue(end_size)
-        # shadow blur increase (lift)
-        self._shadow_anim.stop()
-        self._shadow_anim.setStartValue(self.shadow.blurRadius())
-        self._shadow_anim.setEndValue(26)
+    def select(self, tile):
+        old, self.current = self.current, tile
+        if old is not None and old is not tile:
+            old.set_selected(False)
+        if tile is not None:
+            tile.set_selected(True)
 
-        # label color change property
-        self.lbl.setProperty("hover", "true")
-        self.lbl.style().unpolish(self.lbl); self.lbl.style().polish(self.lbl)
+# ----------------------------
+# Páginas por categoría del sidebar (se construyen en la primera visita, caché LRU)
+# ----------------------------
+ALL_CATEGORY = ""  # página "Todos"
 
-        self._hover_group.start()
-        return super().enterEvent(ev)
+class CategoryPage(QtWidgets.QWidget):
+    """Rejilla de una categoría del sidebar (ALL_CATEGORY = todo el catálogo).
 
-    def leaveEvent(self, ev):
-        # reverse animations back to normal
-        start_icon = self.toolbtn.iconSize()
-        end_icon = QtCore.QSize(ICON_SIZE, ICON_SIZE)
-        self._leave_icon_anim.stop()
-        self._leave_icon_anim.setStartValue(start_icon)
-        self._leave_icon_anim.setEndValue(end_icon)
-
-        start_size = self.maximumSize()
-        end_size = QtCore.QSize(TILE_W, TILE_H)
-        self._leave_size_anim.stop()
-        self._leave_size_anim.setStartValue(start_size)
-        self._leave_size_anim.setEndValue(end_size)
-
-        self._leave_shadow_anim.stop()
-        self._leave_shadow_anim.setStartValue(self.shadow.blurRadius())
-        self._leave_shadow_anim.setEndValue(14)
-
-        # reset label color property
-        self.lbl.setProperty("hover", "false")
-        self.lbl.style().unpolish(self.lbl); self.lbl.style().polish(self.lbl)
-
-        self._leave_group.start()
-        return super().leaveEvent(ev)
+    Solo tiene tiles de sus entradas (o un modelo propio, en la rejilla virtual). MainWindow la
+    construye la primera vez que se abre la categoría y la guarda en una caché LRU de
+    PROGAIN_CATEGORY_PAGES páginas (4): volver a una categoría reutiliza sus widgets, su layout y
+    su selección; las menos recientes se destruyen con sus tiles.
+    """
+    LIMIT_ENV = "PROGAIN_CATEGORY_PAGES"
+    DEFAULT_LIMIT = 4
 
-    # click micro-interaction + ripple
-    def mousePressEvent(self, ev):
-        if ev.button() == QtCore.Qt.MouseButton.LeftButton:
-            # small press shrink (quick)
-            target = QtCore.QSize(int(ICON_SIZE * 0.9), int(ICON_SIZE * 0.9))
-            anim = QtCore.QPropertyAnimation(self, b"iconSize", self)
-            anim.setStartValue(self.toolbtn.iconSize())
-            anim.setEndValue(target)
-            anim.setDuration(100)
-            anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
-            anim.start(QtCore.QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
-            self._press_anim = anim
-        return super().mousePressEvent(ev)
+    @classmethod
+    def cache_limit(cls) -> int:
+        try:
+            limit = int(os.environ.get(cls.LIMIT_ENV, "") or cls.DEFAULT_LIMIT)
+        except ValueError:
+            log.warning("%s inválido; se usa %d", cls.LIMIT_ENV, cls.DEFAULT_LIMIT)
+            limit = cls.DEFAULT_LIMIT
+        return max(1, limit)
 
-    def mouseReleaseEvent(self, ev):
-        if ev.button() == QtCore.Qt.MouseButton.LeftButton:
-            # restore icon
-            anim = QtCore.QPropertyAnimation(self, b"iconSize", self)
-            anim.setStartValue(self.toolbtn.iconSize())
-            anim.setEndValue(QtCore.QSize(ICON_SIZE, ICON_SIZE))
-            anim.setDuration(160)
-            anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
-            anim.start(QtCore.QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
-            # ripple
-            max_r = max(self.width(), self.height()) * 0.9
-            self.ripple.start(max_radius=max_r, duration=420)
-            # emit clicked
-            self.clicked.emit(self)
-        return super().mouseReleaseEvent(ev)
+    def __init__(self, category: str, virtual: bool, icon_for, compute, parent=None):
+        super().__init__(parent)
+        self.category = category
+        self.virtual = virtual
+        self.cols = 1
+        self.tiles = []
+        self.tile_by_key = {}
+        self.selection = TileSelection()
+        v = QtWidgets.QVBoxLayout(self)
+        v.setContentsMargins(0, 0, 0, 0)
+        if virtual:
+            self.tile_model = TileListModel(icon_for, self)
+            self.grid_view = VirtualTileGrid(self.tile_model)
+            v.addWidget(self.grid_view)
+            self.layout_engine = GridLayoutEngine(lambda: compute(self), apply=self._apply_virtual_layout,
+                                                  parent=self)
+        else:
+            self.container = TileGridContainer()
+            self.grid_layout = QtWidgets.QGridLayout(self.container)
+            self.grid_layout.setSpacing(GRID_SPACING)
+            self.grid_layout.setContentsMargins(10,10,10,10)
+            scroll = QtWidgets.QScrollArea()
+            scroll.setWidgetResizable(True)
+            scroll.setWidget(self.container)
+            v.addWidget(scroll)
+            self.layout_engine = GridLayoutEngine(lambda: compute(self), layout=self.grid_layout, parent=self)
+            self.layout_engine.laidOut.connect(self.selection.set_layout)
 
-    # keyboard activation + arrow delegation (same approach as before)
-    def keyPressEvent(self, ev: QtGui.QKeyEvent):
-        if ev.key() in (QtCore.Qt.Key.Key_Return, QtCore.Qt.Key.Key_Enter, QtCore.Qt.Key.Key_Space):
-            # simulate click with small delay
-            self.mousePressEvent(QtGui.QMouseEvent(QtCore.QEvent.Type.MouseButtonPress, QtCore.QPointF(self.width()/2,self.height()/2), QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.KeyboardModifier.NoModifier))
-            QtCore.QTimer.singleShot(90, lambda: self.mouseReleaseEvent(QtGui.QMouseEvent(QtCore.QEvent.Type.MouseButtonRelease, QtCore.QPointF(self.width()/2,self.height()/2), QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.MouseButton.LeftButton, QtCore.Qt.KeyboardModifier.NoModifier)))
-            ev.accept()
+    def accepts(self, entry: ProgramEntry) -> bool:
+        return not self.category or self.category in entry.categories
+
+    def _apply_virtual_layout(self, cols, visible):
+        self.tile_model.set_visible(visible)
+
+# ----------------------------
+# Visor de la salida capturada (tail incremental con mmap)
+# ----------------------------
+class OutputViewer(QtWidgets.QDialog):
+    """Salida capturada de una entrada, siguiendo el log como `tail -f`.
+
+    Al abrir solo se leen los últimos TAIL_BYTES; después, cada POLL_MS, se mapea el fichero
+    (mmap) y se copian únicamente los bytes nuevos desde el último offset, como mucho READ_LIMIT
+    por pasada: un log grande o muy activo nunca se carga entero ni congela la GUI. Si el log rota
+    (otro inodo o menor tamaño) se sigue desde el principio del fichero nuevo. Entre lecturas no
+    queda abierto (en Windows impediría rotarlo).
+    """
+    TAIL_BYTES = 256 * 1024
+    READ_LIMIT = 1 << 20
+    POLL_MS = 500
+    MAX_LINES = 20000
+
+    def __init__(self, entry: ProgramEntry, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Salida — {entry.label}")
+        self.resize(860, 520)
+        self.path = output_log_path(entry.key)
+        self._ident = None
+        self._offset = 0
+        self._skip_partial = False  # la cola inicial empieza a mitad de línea
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        v = QtWidgets.QVBoxLayout(self)
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(self.MAX_LINES)
+        self.text.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont))
+        v.addWidget(self.text, 1)
+        self.status = QtWidgets.QLabel(self.path)
+        self.status.setStyleSheet("color: #9AA5B1;")
+        self.status.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextSelectableByMouse)
+        v.addWidget(self.status)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.POLL_MS)
+        self._timer.timeout.connect(self.poll)
+        self.poll()
+
+    def showEvent(self, ev):
+        super().showEvent(ev)
+        self._timer.start()
+
+    def hideEvent(self, ev):
+        super().hideEvent(ev)
+        self._timer.stop()
+
+    def poll(self):
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                ident = (st.st_dev, st.st_ino)
+                if ident != self._ident or st.st_size < self._offset:
+                    first = self._ident is None
+                    self._ident = ident
+                    self._decoder.reset()
+                    self._offset = max(0, st.st_size - self.TAIL_BYTES) if first else 0
+                    self._skip_partial = self._offset > 0
+                    if not first:
+                        self._append("\n--- log rotado ---\n")
+                end = min(st.st_size, self._offset + self.READ_LIMIT)
+                if end <= self._offset:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    data = m[self._offset:end]
+        except (OSError, ValueError):
+            # aún no hay salida (o el fichero se está rotando): se reintenta en la siguiente pasada
+            self.status.setText(f"{self.path} (sin salida todavía)")
             return
-        if ev.key() in (QtCore.Qt.Key.Key_Left, QtCore.Qt.Key.Key_Right, QtCore.Qt.Key.Key_Up, QtCore.Qt.Key.Key_Down):
-            w = self.window()
-            if hasattr(w, "move_focus_from_tile"):
-                w.move_focus_from_tile(self, ev.key())
-                ev.accept()
-                return
-        return super().keyPressEvent(ev)
+        if self._skip_partial:
+            data = data[data.find(b"\n") + 1:]
+            self._skip_partial = False
+        self._offset = end
+        self._append(self._decoder.decode(data))
+        self.status.setText(f"{self.path} ({st.st_size / 1024:.0f} KB)")
+
+    def _append(self, text: str):
+        if not text:
+            return
+        bar = self.text.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 2
+        cursor = QtGui.QTextCursor(self.text.document())
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        if at_bottom:  # se sigue el final salvo que el usuario haya subido a leer
+            bar.setValue(bar.maximum())
+
+# ----------------------------
+# Búsqueda indexada (acentos, prefijos, n-gramas y tolerancia a typos)
+# ----------------------------
+def fold_text(text: str) -> str:
+    """Minúsculas y sin acentos: 'Facturación' -> 'facturacion'."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+_WORD_SPLIT = re.compile(r"[^0-9a-zñ]+")
+
+def _bounded_distance(a: str, b: str, limit: int) -> int:
+    """Distancia de Damerau-Levenshtein (transposiciones adyacentes) cortada en `limit` + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = cur[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                v = min(v, prev2[j - 2] + 1)
+            cur[j] = v
+            row_min = min(row_min, v)
+        if row_min > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return min(prev[-1], limit + 1)
+
+class SearchIndex:
+    """Índice de búsqueda sobre label, nombre del exe, tags y alias.
+
+    - Claves pre-normalizadas (minúsculas + sin acentos) por entrada; build() reutiliza las de las
+      entradas que no cambiaron, así que rehacer el índice tras un lote de entradas nuevas solo
+      normaliza las nuevas.
+    - Vocabulario de palabras ordenado (prefijos por bisect) e índice de trigramas sobre el
+      vocabulario para los candidatos fuzzy (se construye en warm(), en idle tras el arranque).
+    - Incremental: si la consulta nueva contiene a la anterior solo se filtran los aciertos previos.
+    - Ranking por niveles: label exacto, prefijo de label, prefijo de palabra, subcadena, fuzzy.
+      Dentro de cada nivel (salvo fuzzy) manda la frecency de set_boost(); sin ella, el catálogo.
+    Los filtros usan map/compress para que el bucle por entrada corra en C (< 1 ms con 10k).
+    """
+    FUZZY_MIN_RESULTS = 8   # si hay menos aciertos exactos se completa con fuzzy
+    FUZZY_MAX_CANDIDATES = 48  # palabras (las de más trigramas en común) que se comparan con distancia
+    CACHE_SIZE = 32
+
+    def __init__(self, entries=(), previous: "SearchIndex" = None):
+        # key -> (campos de origen, label, hay, palabras) de la última build(); `previous` presta el
+        # suyo (solo se lee: build() lo sustituye, no lo modifica)
+        self._prepared = previous._prepared if previous is not None else {}
+        self.build(entries)
+
+    @staticmethod
+    def _prepare(e, source: tuple) -> tuple:
+        exe_stem = os.path.splitext(os.path.basename(e.exe or ""))[0]
+        label = fold_text(e.label)
+        fields = [label, fold_text(exe_stem)]
+        fields += [fold_text(t) for t in e.tags]
+        fields += [fold_text(a) for a in e.aliases]
+        words = tuple(dict.fromkeys(w for f in fields for w in _WORD_SPLIT.split(f) if w))
+        return source, label, " | ".join(fields), words
+
+    def build(self, entries):
+        self._entries = list(entries)
+        self._hays = []           # todos los campos normalizados
+        self._vocab = {}          # palabra -> [ids]
+        label_ids = {}            # label normalizado -> [ids]
+        previous, prepared = self._prepared, {}
+        for i, e in enumerate(self._entries):
+            source = (e.label, e.exe, e.tags, e.aliases)
+            p = previous.get(e.key)
+            if p is None or p[0] != source:
+                p = self._prepare(e, source)
+            prepared[e.key] = p
+            _, label, hay, words = p
+            self._hays.append(hay)
+            label_ids.setdefault(label, []).append(i)
+            for w in words:
+                self._vocab.setdefault(w, []).append(i)
+        self._prepared = prepared
+        self._label_ids = label_ids
+        # pares (clave, id) ordenados en listas paralelas: un prefijo es un slice contiguo
+        pairs = sorted((label, i) for label, ids in label_ids.items() for i in ids)
+        self._label_keys = [k for k, _ in pairs]
+        self._label_order = [i for _, i in pairs]
+        pairs = sorted((w, i) for w, ids in self._vocab.items() for i in ids)
+        self._word_keys = [k for k, _ in pairs]
+        self._word_order = [i for _, i in pairs]
+        self._word_grams = None
+        self._short = {}          # consultas de 1 carácter precalculadas en warm()
+        self._boost = None        # id -> -frecency (clave de orden dentro de cada nivel)
+        self._cache = {}
+        self._last = ("", None)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def warm(self):
+        """Precalcula lo caro (trigramas del vocabulario y consultas de una letra) fuera del teclado."""
+        # todo se construye en locales y se publica al final: se puede llamar desde un hilo de fondo.
+        # Si entretanto build() rehízo el índice (lotes del descubrimiento) no se publica nada viejo.
+        vocab, hays = self._vocab, self._hays
+        self._ensure_grams()
+        if not self._short:
+            everything = range(len(hays))
+            short = {ch: self._rank(ch, self._scan(ch, everything, hays)) for ch in sorted({w[0] for w in vocab})}
+            if self._vocab is vocab:
+                self._short = short
+
+    def _ensure_grams(self):
+        if self._word_grams is None:
+            vocab = self._vocab
+            grams = {}
+            for w in vocab:
+                padded = " " + w + " "
+                for k in range(len(padded) - 2):
+                    grams.setdefault(padded[k:k + 3], []).append(w)
+            if self._vocab is vocab:
+                self._word_grams = grams
+
+    # --- consultas ---
+    @staticmethod
+    def _scan(term: str, base, texts):
+        keep = list(map(operator.contains, texts, itertools.repeat(term)))
+        return list(itertools.compress(base, keep))
+
+    def _substring_hits(self, q: str):
+        """Ids (en orden de catálogo) que contienen todos los términos de q.
+
+        Si cada término de la consulta anterior está contenido en el término correspondiente
+        de la nueva (el usuario siguió escribiendo), solo se filtran los aciertos anteriores.
+        """
+        hits = self._cache.get(q)
+        if hits is not None:
+            return hits
+        terms = q.split()
+        last_q, last_hits = self._last
+        last_terms = last_q.split()
+        narrows = last_hits is not None and bool(last_terms) and len(last_terms) <= len(terms) and all(
+            t in terms[k] for k, t in enumerate(last_terms))
+        hits = last_hits if narrows else range(len(self._hays))
+        for t in terms:
+            hits = self._scan(t, hits, map(self._hays.__getitem__, hits))
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[q] = hits
+        return hits
+
+    @staticmethod
+    def _prefix_slice(keys, values, prefix: str):
+        lo = bisect.bisect_left(keys, prefix)
+        hi = bisect.bisect_left(keys, prefix + "\uffff", lo)
+        return values[lo:hi]
+
+    def prefix_ids(self, prefix: str) -> set:
+        """Ids con alguna palabra que empieza por `prefix` (búsqueda binaria en el vocabulario)."""
+        return set(self._prefix_slice(self._word_keys, self._word_order, prefix))
+
+    def set_boost(self, ranking: dict):
+        """Rango frecency por key (UsageStore.ranking()); vacío o None quita el refuerzo."""
+        if not ranking:
+            self._boost = None
+            return
+        keys = map(operator.attrgetter("key"), self._entries)
+        self._boost = list(map(operator.neg, map(ranking.get, keys, itertools.repeat(0.0))))
+
+    def _rank(self, q: str, hits) -> list:
+        # niveles: label exacto y prefijos salen de los índices ordenados; el resto conserva el
+        # orden de catálogo de `hits`
+        exact = list(self._label_ids.get(q, ()))
+        label_prefix = set(self._prefix_slice(self._label_keys, self._label_order, q))
+        top = label_prefix | self.prefix_ids(q) if " " not in q else label_prefix
+        word_only = top - label_prefix
+        return [
+            exact,
+            sorted(label_prefix.difference(exact)),
+            list(itertools.compress(hits, map(word_only.__contains__, hits))),
+            list(itertools.filterfalse(top.__contains__, hits)),
+        ]
+
+    def _flatten(self, tiers) -> list:
+        boost = self._boost
+        if boost is None:
+            return list(itertools.chain.from_iterable(tiers))
+        # sort estable: a igual frecency (p. ej. nunca lanzados) se mantiene el orden del nivel
+        return list(itertools.chain.from_iterable(sorted(t, key=boost.__getitem__) for t in tiers))
+
+    def _fuzzy(self, q: str, exclude) -> list:
+        self._ensure_grams()
+        limit = 1 if len(q) < 6 else 2
+        padded = " " + q + " "
+        grams = [padded[k:k + 3] for k in range(len(padded) - 2)]
+        counts = {}
+        for g in grams:
+            for w in self._word_grams.get(g, ()):
+                counts[w] = counts.get(w, 0) + 1
+        # cada error destruye como mucho 3 trigramas (el último puede faltar si q es un prefijo)
+        need = max(1, len(grams) - 1 - 3 * limit)
+        candidates = sorted(((n, w) for w, n in counts.items() if n >= need), reverse=True)
+        best = {}
+        for _, w in candidates[:self.FUZZY_MAX_CANDIDATES]:
+            # contra la palabra completa y contra su prefijo (el usuario sigue escribiendo)
+            d = min(_bounded_distance(q, w, limit),
+                    _bounded_distance(q, w[:len(q)], limit),
+                    _bounded_distance(q, w[:len(q) + 1], limit))
+            if d <= limit:
+                for i in self._vocab[w]:
+                    if i not in exclude and d < best.get(i, limit + 1):
+                        best[i] = d
+        return sorted(best, key=lambda i: (best[i], i))
+
+    def search(self, query: str):
+        """Entradas que coinciden con `query`, ordenadas por relevancia (estable dentro de cada nivel)."""
+        q = " ".join(fold_text(query).split())
+        if not q:
+            return list(self._entries)
+        short = self._short
+        if q in short:
+            # consulta de una letra precalculada: la siguiente tecla filtra sobre todos sus aciertos
+            tiers = short[q]
+            self._last = (q, sorted(itertools.chain.from_iterable(tiers)))
+        else:
+            hits = self._substring_hits(q)
+            self._last = (q, hits)
+            tiers = self._rank(q, hits)
+        ranked = self._flatten(tiers)
+        if len(ranked) < self.FUZZY_MIN_RESULTS and len(q) >= 3 and " " not in q:
+            ranked = ranked + self._fuzzy(q, set(ranked))
+        return list(map(self._entries.__getitem__, ranked))
+
+class SearchBuildTask(QtCore.QRunnable):
+    """Construye (y calienta) un SearchIndex nuevo en el pool global, sin parar el hilo GUI."""
+
+    class Signals(QtCore.QObject):
+        done = QtCore.pyqtSignal(object, object)  # lista de entradas de partida, SearchIndex
+
+    def __init__(self, entries: list, previous: SearchIndex = None):
+        super().__init__()
+        self.entries = entries
+        self.previous = previous
+        self.signals = SearchBuildTask.Signals()
+
+    def run(self):
+        index = SearchIndex(self.entries, self.previous)
+        index.warm()
+        self.signals.done.emit(self.entries, index)
+
+# ----------------------------
+# Espacios de trabajo: un grupo de programas abierto en orden de dependencias
+# ----------------------------
+class WorkspaceRun(QtCore.QObject):
+    """Una ejecución de un Workspace: lanza a la vez todo lo que no espera a nada y cada paso en
+    cuanto sus dependencias están listas (sonda "ready" vista por LaunchTelemetry).
+
+    Estados de un paso: pending -> launching -> ready | failed; si un paso falla, los que esperan
+    a él (directa o indirectamente) quedan en "skipped" sin lanzarse. Un programa que ya está
+    abierto cuenta como listo y no se lanza otra instancia. Cada paso tiene un plazo (timeout de
+    la sonda más SPAWN_GRACE_S de cola y spawn); al vencer se da por fallido aunque el proceso siga.
+    """
+    SPAWN_GRACE_S = 10.0
+    WATCHDOG_MS = 250
+    TERMINAL = ("ready", "failed", "skipped")
+
+    stepChanged = QtCore.pyqtSignal(str, str)  # key, estado
+    finished = QtCore.pyqtSignal(dict)         # summary()
+
+    def __init__(self, workspace: Workspace, window: "MainWindow", parent=None):
+        super().__init__(parent)
+        self.workspace = workspace
+        self.window = window
+        self.state = {s.key: "pending" for s in workspace.steps}
+        self.reason = {}
+        self._steps = {s.key: s for s in workspace.steps}
+        self._dependents = workspace.dependents()
+        self._started = {}   # key -> time.monotonic() del lanzamiento
+        self._elapsed = {}   # key -> ms desde el inicio del espacio hasta lista/fallo
+        self._deadline = {}  # key -> time.monotonic() límite para estar lista
+        self._t0 = None
+        self._done = False
+        self._watchdog = QtCore.QTimer(self)
+        self._watchdog.setInterval(self.WATCHDOG_MS)
+        self._watchdog.timeout.connect(self._check_deadlines)
+        window.telemetry.launchFinished.connect(self._on_launch_finished)
+
+    def count(self, state: str) -> int:
+        return sum(1 for s in self.state.values() if s == state)
+
+    def start(self):
+        self._t0 = time.monotonic()
+        log.info("espacio de trabajo %r: %d programas", self.workspace.name, len(self.state))
+        for step in self.workspace.steps:
+            if not step.after and self.state[step.key] == "pending":
+                self._launch(step)
+        self._maybe_finish()
+
+    def summary(self) -> dict:
+        ms = round((time.monotonic() - self._t0) * 1000.0, 1)
+        return {"workspace": self.workspace.name, "total_ms": ms,
+                "steps": [{"key": k, "state": st, "ms": self._elapsed.get(k), "reason": self.reason.get(k)}
+                          for k, st in self.state.items()]}
+
+    def _set(self, key: str, state: str, reason: str = None):
+        self.state[key] = state
+        if reason:
+            self.reason[key] = reason
+        if state in self.TERMINAL:
+            self._elapsed[key] = round((time.monotonic() - self._t0) * 1000.0, 1)
+        self.stepChanged.emit(key, state)
+
+    def _launch(self, step: WorkspaceStep):
+        w = self.window
+        key = step.key
+        entry = w.entry_by_key(key)
+        if entry is None:
+            self._fail(key, "ya no está en el catálogo")
+            return
+        if w.supervisor.running(key):
+            self._ready(key, "ya abierto")
+            return
+        if not w.resolver.available(key):
+            w.resolver.refresh(key)
+            self._fail(key, f"no se encontró {entry.exe}")
+            return
+        ready = entry.ready if step.ready is None else step.ready
+        if step.timeout is not None:
+            # sin "ready" la sonda es la de por defecto (ventana en Windows); {} = ninguna
+            base = {"window": True} if ready is None else ready
+            ready = dict(base, timeout=step.timeout) if base else base
+        trace = w.telemetry.begin(key, entry.exe, entry.label, ready, entry.cwd)
+        timeout = trace.probe.timeout if trace.probe is not None else 0.0
+        self._started[key] = time.monotonic()
+        self._deadline[key] = self._started[key] + timeout + self.SPAWN_GRACE_S
+        self._set(key, "launching")
+        if not self._watchdog.isActive():
+            self._watchdog.start()
+        submitted = w.launch_program(entry.exe, entry.args, entry.cwd, entry.env, key=key,
+                                     priority=LaunchScheduler.NORMAL, trace=trace, path=w.resolver.path(key),
+                                     capture=entry.capture)
+        if not submitted:
+            # fusionado por LaunchScheduler con una petición idéntica reciente
+            if w.supervisor.running(key):
+                self._ready(key, "ya abierto")
+            elif not w.supervisor.is_running(key):
+                # la otra petición es de otra entrada: su resultado no llegará con esta key
+                self._fail(key, "fusionado con un lanzamiento idéntico de otra entrada")
+
+    @QtCore.pyqtSlot(dict)
+    def _on_launch_finished(self, record: dict):
+        key = record.get("key")
+        if self.state.get(key) != "launching":
+            return
+        outcome = record.get("outcome")
+        if outcome in ("ready", "spawned"):
+            self._ready(key)
+        elif outcome == "timeout":
+            self._fail(key, "no estuvo listo a tiempo")
+        elif outcome == "exited":
+            self._fail(key, "terminó antes de estar listo")
+        else:
+            self._fail(key, "no se pudo lanzar")
+
+    def _check_deadlines(self):
+        now = time.monotonic()
+        for key, deadline in list(self._deadline.items()):
+            if self.state[key] == "launching" and now >= deadline:
+                self._fail(key, f"no estuvo listo en {deadline - self._started[key]:.0f} s")
+
+    def _ready(self, key: str, reason: str = None):
+        self._set(key, "ready", reason)
+        for dep in self._dependents[key]:
+            step = self._steps[dep]
+            if self.state[dep] == "pending" and all(self.state[a] == "ready" for a in step.after):
+                self._launch(step)
+        self._maybe_finish()
+
+    def _fail(self, key: str, reason: str):
+        log.warning("espacio %r: %s %s", self.workspace.name, key, reason)
+        self._set(key, "failed", reason)
+        stack = [key]
+        while stack:
+            k = stack.pop()
+            entry = self.window.entry_by_key(k)
+            for dep in self._dependents[k]:
+                if self.state[dep] == "pending":
+                    self._set(dep, "skipped", f"espera a {entry.label if entry else k}")
+                    stack.append(dep)
+        self._maybe_finish()
+
+    def _maybe_finish(self):
+        if self._done or any(s not in self.TERMINAL for s in self.state.values()):
+            return
+        self._done = True
+        self._watchdog.stop()
+        self.window.telemetry.launchFinished.disconnect(self._on_launch_finished)
+        summary = self.summary()
+        log.info("espacio de trabajo: %s", json.dumps(summary, ensure_ascii=False))
+        self.finished.emit(summary)
 
 # ----------------------------
 # Main Window with keyboard nav & responsive grid
 # ----------------------------
 class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self):
+    startupFinished = QtCore.pyqtSignal(dict)  # traza de StartupTrace tras el primer frame
+
+    def __init__(self, entries=None, workspaces=None):
         super().__init__()
         self.setWindowTitle("PROGAIN Launcher — Hover Animations")
         self.resize(1280, 720)
         self.setStyleSheet(STYLE)
-        self.icons = self.load_icons()
-        self.tiles = []
-        self.cols = 1
+        STARTUP.mark("stylesheet")
+        # el hilo del UsageStore lee el fichero mientras se construye el resto de la ventana
+        self.usage = UsageStore()
+        self._usage_dirty = True     # recalcular el orden en el próximo layout
+        self._usage_pending = False  # hay lanzamientos nuevos: recalcular al volver a mostrarse
+        self._frecency_order = None
+        self._pending_boost = None
+        self.catalog_watcher = None
+        if entries is None:
+            self.icon_map, entries, workspaces = self.load_catalog()
+        else:
+            self.icon_map = dict(DEFAULT_ICONS)
+        self.workspaces = list(workspaces or ())
+        self._workspace_runs = {}  # nombre -> WorkspaceRun en curso
+        STARTUP.mark("catalog")
+        self.icon_service = IconService(self)
+        self.icon_service.iconReady.connect(self._on_icon_ready)
+        self.load_icons(self.icon_map)
+        STARTUP.mark("load_icons")
+        self.entries = list(entries)
+        self.catalog_entries = list(entries)
+        # ejecutables de las carpetas compartidas; se suman al catálogo según van apareciendo
+        self.discovered = {}  # key -> ProgramEntry
+        self.discovery = None
+        if DiscoveryEngine.enabled():
+            self.discovery = DiscoveryEngine(parent=self)
+            self.discovery.entriesChanged.connect(self._on_discovered)
+            self.discovery.scanFinished.connect(self._on_discovery_finished)
+        self.virtual_grid = self.use_virtual_grid(len(self.entries), growing=self.discovery is not None)
+        self.tile_class = CompactTile if CompactTile.enabled() else LauncherTile
+        self.search_index = SearchIndex(self.entries)
+        self._search_stale = False  # hay entradas que el índice aún no tiene (ver _on_discovered)
+        self._search_task = None
+        STARTUP.mark("search_index")
+        self.supervisor = ProcessSupervisor(self)
+        self.supervisor.runningChanged.connect(self._on_running_changed)
+        self.launcher = LaunchScheduler(parent=self)
+        self.launcher.queueChanged.connect(self._on_launch_queue)
+        self.telemetry = LaunchTelemetry(self.supervisor, self)
+        self.telemetry.waitingChanged.connect(self._update_loading_overlay)
+        self.telemetry.launchFinished.connect(self._on_launch_finished)
+        self.badges = BadgeService(self)
+        self.badges.badgesChanged.connect(self._on_badges)
+        self.badges.set_entries(self.entries)
+        # rutas de los ejecutables resueltas y revalidadas fuera del hilo GUI (y del click)
+        self.resolver = ExeResolver(self)
+        self.resolver.availabilityChanged.connect(self._on_availability)
+        self.resolver.set_entries(self.entries)
+        # CPU/RSS de los programas en ejecución en los tiles (un hilo de muestreo para todos)
+        self.monitor = None
+        self._usage_shown = {}  # key -> texto mostrado
+        if ResourceMonitor.enabled():
+            self.monitor = ResourceMonitor(self.supervisor, self)
+            self.monitor.usageChanged.connect(self._on_usage)
+        self.prewarm = None
+        if PrewarmEngine.enabled():
+            self.prewarm = PrewarmEngine(self.usage, self)
+            self.prewarm.set_entries(self.entries)
+        self._launch_queue = (0, 0)
+        self.pages = collections.OrderedDict()  # categoría -> CategoryPage, de la menos a la más reciente
+        self.page_limit = CategoryPage.cache_limit()
+        self.page = None
+        self.sidebar_buttons = {}
+        self._viewers = {}  # key -> OutputViewer abierto
+        self.resident = False  # en modo bandeja, cerrar la ventana solo la oculta
         self._build_ui()
         
         # Añade la capa de carga después de construir la UI
         self.loading_overlay = LoadingOverlay(self) # <-- AÑADIDO
+        STARTUP.mark("main_window")
 
-    def load_icons(self):
-        names = {
-            "prog_progain": "icons/icon_programa-01.png",
-            "prog_equipos": "icons/icon_programa-02.png",
-            "prog_facturas": "icons/icon_programa-03.png",
-            "prog_facturacion_inter": "icons/icon_programa-04.png",
-            "prog_licitaciones": "icons/icon_programa-05.png",
-        }
-        icons = {}
-        for k, rel in names.items():
-            p = resource_path(rel)
-            if os.path.exists(p):
-                icons[k] = QtGui.QIcon(p)
-            else:
-                pix = QtGui.QPixmap(ICON_SIZE, ICON_SIZE)
-                pix.fill(QtGui.QColor(0,0,0,0))
-                icons[k] = QtGui.QIcon(pix)
-        return icons
+    def load_catalog(self):
+        """Catálogo externo si existe (vigilado para recarga en caliente); si no, el integrado."""
+        path = find_catalog_path()
+        if path:
+            loader = CatalogLoader(path)
+            self.catalog_watcher = CatalogWatcher(loader, self)
+            self.catalog_watcher.changed.connect(self.apply_catalog)
+            try:
+                icon_map, entries, workspaces, _ = loader.load()
+                log.info("Catálogo cargado: %s (%d programas, %d espacios de trabajo)", path, len(entries),
+                         len(workspaces))
+                return icon_map, entries, workspaces
+            except CatalogError as e:
+                # se sigue vigilando: cuando IT corrija el fichero se aplicará solo
+                log.error("%s", e)
+        return dict(DEFAULT_ICONS), self.default_entries(), []
+
+    def load_icons(self, names: dict = None):
+        """Registra las rutas de iconos; se decodifican en segundo plano (ver IconService)."""
+        self.icon_service.set_sources(DEFAULT_ICONS if names is None else names)
+
+    def placeholder_icon(self) -> QtGui.QIcon:
+        return self.icon_service.placeholder
+
+    def icon_for(self, entry: ProgramEntry) -> QtGui.QIcon:
+        return self.icon_service.icon(entry.icon_key)
+
+    @QtCore.pyqtSlot(str)
+    def _on_icon_ready(self, key: str):
+        if self.virtual_grid:
+            for page in self.pages.values():
+                page.grid_view.viewport().update()
+            return
+        for e in self.entries:
+            if e.icon_key == key:
+                for page in self.pages.values():
+                    tile = page.tile_by_key.get(e.key)
+                    if tile is not None:
+                        tile.set_icon(self.icon_service.icon(key))
+
+    @staticmethod
+    def default_entries():
+        return [entry_from_dict(d) for d in DEFAULT_PROGRAMS]
+
+    @staticmethod
+    def use_virtual_grid(count: int, growing: bool = False) -> bool:
+        """PROGAIN_VIRTUAL_GRID=1/0 fuerza el modo; si no, se decide por el tamaño del catálogo
+        (`growing`: el descubrimiento puede añadir miles de entradas después de construir la ventana)."""
+        forced = os.environ.get("PROGAIN_VIRTUAL_GRID", "").strip()
+        if forced in ("0", "1"):
+            return forced == "1"
+        return growing or count >= VIRTUAL_GRID_THRESHOLD
 
     def _build_ui(self):
         central = QtWidgets.QWidget()
@@ -503,7 +5607,7 @@ class MainWindow(QtWidgets.QMainWindow):
         h = QtWidgets.QHBoxLayout(central)
         h.setContentsMargins(0,0,0,0)
 
-        # sidebar minimal
+        # sidebar: una entrada por categoría del catálogo (las páginas se construyen al abrirlas)
         sidebar = QtWidgets.QFrame(objectName="sidebar")
         sidebar.setFixedWidth(SIDEBAR_WIDTH)
         side_layout = QtWidgets.QVBoxLayout(sidebar)
@@ -511,8 +5615,23 @@ class MainWindow(QtWidgets.QMainWindow):
         title = QtWidgets.QLabel("PROGAIN")
         title.setStyleSheet("font-weight:800; font-size:18px; color: #2EA8FF")
         side_layout.addWidget(title)
+        side_layout.addSpacing(12)
+        self.sidebar_list = QtWidgets.QVBoxLayout()
+        self.sidebar_list.setSpacing(2)
+        side_layout.addLayout(self.sidebar_list)
+        side_layout.addSpacing(12)
+        # espacios de trabajo del catálogo: un click abre el grupo entero
+        self.workspace_title = QtWidgets.QLabel("ESPACIOS DE TRABAJO")
+        self.workspace_title.setStyleSheet("font-weight:700; font-size:10px; color: #5C6670")
+        side_layout.addWidget(self.workspace_title)
+        self.workspace_list = QtWidgets.QVBoxLayout()
+        self.workspace_list.setSpacing(2)
+        side_layout.addLayout(self.workspace_list)
+        self.workspace_buttons = {}
         side_layout.addStretch()
         h.addWidget(sidebar)
+        self._build_sidebar_buttons()
+        self._build_workspace_buttons()
 
         # main area with scrollable responsive grid
         self.container = QtWidgets.QWidget()
@@ -526,121 +5645,580 @@ class MainWindow(QtWidgets.QMainWindow):
         header.addStretch()
         self.search = QtWidgets.QLineEdit()
         self.search.setPlaceholderText("Buscar...")
-        self.search.textChanged.connect(self.relayout_tiles)
+        self.search.textChanged.connect(self.schedule_relayout)
         # CORRECCIÓN: pasar entero como stretch (no float)
         header.addWidget(self.search, 1)
         main_v.addLayout(header)
         main_v.addSpacing(12)
+        STARTUP.mark("build_ui")
+
+        # una página por categoría visitada; solo se construye (con sus tiles) la que se abre
+        self.page_stack = QtWidgets.QStackedWidget()
+        main_v.addWidget(self.page_stack, 1)
+        h.addWidget(self.container, 1)
+        self.show_category(self._initial_category())
+        STARTUP.mark("tiles")
+        # el índice de búsqueda precalcula trigramas y consultas de una letra fuera del hilo GUI
+        QtCore.QTimer.singleShot(0, lambda: QtCore.QThreadPool.globalInstance().start(self.search_index.warm))
 
-        self.grid_container = QtWidgets.QWidget()
-        self.grid_layout = QtWidgets.QGridLayout(self.grid_container)
-        self.grid_layout.setSpacing(22)
-        self.grid_layout.setContentsMargins(10,10,10,10)
+    # la página visible: navegación, benchmarks y relayouts trabajan siempre sobre ella
+    @property
+    def layout_engine(self) -> GridLayoutEngine:
+        return self.page.layout_engine
 
-        # scroll area
-        scroll = QtWidgets.QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(self.grid_container)
-        main_v.addWidget(scroll, 1)
+    @property
+    def selection(self) -> TileSelection:
+        return self.page.selection
 
-        h.addWidget(self.container, 1)
+    @property
+    def cols(self) -> int:
+        return self.page.cols
 
-        # create tiles
-        botones_info = [
-            ("PROGAIN", 'prog_progain', "progain_app.exe"),
-            ("EQUIPOS", 'prog_equipos', "alquiler_equipos.exe"),
-            ("FACTURAS", 'prog_facturas', "gestion_facturas.exe"),
-            ("FACTURAS EMP", 'prog_facturacion_inter', "facturacion_gui.exe"),
-            ("LICITACIONES", 'prog_licitaciones', "gestor_licitaciones_db.exe"),
-        ]
-        for label, icon_key, exe in botones_info:
-            t = LauncherTile(self.icons.get(icon_key), label, exe, parent=self.grid_container)
-            t.clicked.connect(self.on_tile_clicked)
-            self.tiles.append(t)
-
-        # sample badges (demo)
-        if len(self.tiles) > 2:
-            self.tiles[2].set_badge(3)   # FACTURAS
-        if len(self.tiles) > 3:
-            self.tiles[3].set_badge(12)  # FACTURAS EMP
-
-        # initial layout
+    def categories(self) -> list:
+        """Categorías del catálogo en orden de primera aparición (más la de lo descubierto, si está activo)."""
+        categories = dict.fromkeys(c for e in self.entries for c in e.categories)
+        if self.discovery is not None:
+            categories.setdefault(DISCOVERY_CATEGORY)
+        return list(categories)
+
+    def _build_sidebar_buttons(self):
+        for button in self.sidebar_buttons.values():
+            button.deleteLater()
+        self.sidebar_buttons = {}
+        for category in [ALL_CATEGORY] + self.categories():
+            button = QtWidgets.QPushButton(category or "Todos", objectName="sidebarButton")
+            button.setProperty("selected", bool(self.page is not None and self.page.category == category))
+            button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+            button.clicked.connect(lambda _=False, c=category: self.on_category_clicked(c))
+            self.sidebar_list.addWidget(button)
+            self.sidebar_buttons[category] = button
+
+    def _build_workspace_buttons(self):
+        for button in self.workspace_buttons.values():
+            button.deleteLater()
+        self.workspace_buttons = {}
+        labels = {e.key: e.label for e in self.entries}
+        for ws in self.workspaces:
+            button = QtWidgets.QPushButton(ws.name, objectName="sidebarButton")
+            button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+            button.setToolTip(" + ".join(labels.get(k, k) for k in ws.keys()))
+            button.clicked.connect(lambda _=False, n=ws.name: self.run_workspace(n))
+            self.workspace_list.addWidget(button)
+            self.workspace_buttons[ws.name] = button
+        self.workspace_title.setVisible(bool(self.workspaces))
+
+    def _set_button_selected(self, category: str, selected: bool):
+        button = self.sidebar_buttons.get(category)
+        if button is not None:
+            button.setProperty("selected", selected)
+            # la propiedad dinámica solo se nota tras re-polish (de este botón, no de toda la ventana)
+            button.style().unpolish(button)
+            button.style().polish(button)
+
+    def _initial_category(self) -> str:
+        """La última categoría abierta (QSettings "sidebar/category"), si sigue existiendo."""
+        category = str(QtCore.QSettings().value("sidebar/category", "") or "")
+        return category if category in self.categories() else ALL_CATEGORY
+
+    def on_category_clicked(self, category: str):
+        self.show_category(category)
+        QtCore.QSettings().setValue("sidebar/category", category)
+
+    def show_category(self, category: str):
+        """Muestra la página de `category`; se construye solo si no está en la caché."""
+        page = self.pages.get(category)
+        if page is None:
+            page = self._build_page(category)
+            self.pages[category] = page
+            self.page_stack.addWidget(page)
+        self.pages.move_to_end(category)
+        previous, self.page = self.page, page
+        if previous is not page:
+            if previous is not None:
+                self._set_button_selected(previous.category, False)
+            self._set_button_selected(category, True)
+            self.page_stack.setCurrentWidget(page)
+            self.search.setPlaceholderText(f"Buscar en {category}..." if category else "Buscar...")
+        # mientras estuvo oculta pudo cambiar la búsqueda, el orden o el catálogo (sin cambios no hace nada)
         self.relayout_tiles()
-        # put focus on first tile for keyboard nav
-        if self.tiles:
-            self.tiles[0].setFocus()
+        self._evict_pages()
+        self._focus_page(page)
 
-    def relayout_tiles(self):
-        q = self.search.text().strip().lower()
-        visible = []
-        for t in self.tiles:
-            if not q or q in t.label_text.lower():
-                t.setVisible(True)
-                visible.append(t)
+    def _build_page(self, category: str) -> CategoryPage:
+        page = CategoryPage(category, self.virtual_grid, self.icon_for, self._compute_layout)
+        if self.virtual_grid:
+            page.grid_view.entryClicked.connect(self.on_entry_clicked)
+            page.grid_view.entryHovered.connect(self.on_entry_hovered)
+            page.grid_view.entryMenuRequested.connect(self.on_entry_menu)
+            for p in self.supervisor.running():
+                page.tile_model.set_running(p.key, len(self.supervisor.running(p.key)))
+            for key in self.resolver.unavailable():
+                page.tile_model.set_available(key, False)
+            for key, text in self._usage_shown.items():
+                page.tile_model.set_usage(key, text)
+        else:
+            for e in self.entries:
+                if page.accepts(e):
+                    page.tiles.append(self._create_tile(page, e))
+            page.container.tiles = page.tiles
+        return page
+
+    def _evict_pages(self):
+        while len(self.pages) > self.page_limit:
+            category, page = next(iter(self.pages.items()))
+            if page is self.page:
+                break
+            del self.pages[category]
+            self._drop_page(page)
+
+    def _drop_page(self, page: CategoryPage):
+        self.page_stack.removeWidget(page)
+        page.deleteLater()
+
+    def _focus_page(self, page: CategoryPage):
+        # foco en la rejilla para navegar con el teclado
+        if page.virtual:
+            page.grid_view.setFocus()
+            if not page.grid_view.currentIndex().isValid() and page.tile_model.rowCount():
+                page.grid_view.setCurrentIndex(page.tile_model.index(0))
+        elif page.selection.current is not None:
+            page.selection.current.setFocus()
+        elif page.layout_engine.visible:
+            page.layout_engine.visible[0].setFocus()
+
+    def _create_tile(self, page: CategoryPage, e: ProgramEntry):
+        # oculto hasta que el motor de layout le asigna celda
+        t = self.tile_class(self.icon_for(e), e.label, e.exe, parent=page.container, entry=e)
+        t.hide()
+        t.clicked.connect(self.on_tile_clicked)
+        t.hovered.connect(self.on_tile_hovered)
+        t.menuRequested.connect(lambda tile, pos: self.on_entry_menu(tile.entry, pos))
+        if e.badge:
+            t.set_badge(e.badge)
+        if self.supervisor.running(e.key):
+            t.set_running(len(self.supervisor.running(e.key)))
+            t.set_usage(self._usage_shown.get(e.key))
+        if not self.resolver.available(e.key):
+            t.set_available(False)
+        page.tile_by_key[e.key] = t
+        return t
+
+    @QtCore.pyqtSlot(dict, list, list)
+    def apply_catalog(self, icon_map: dict, new_entries: list, workspaces: list = None):
+        """Aplica un catálogo recargado como diff: solo se crean, destruyen o refrescan los tiles afectados."""
+        icons_changed = icon_map != self.icon_map
+        if icons_changed:
+            self.icon_map = icon_map
+            self.load_icons(icon_map)
+        if workspaces is not None:
+            # las ejecuciones en curso siguen con el Workspace con el que empezaron
+            self.workspaces = list(workspaces)
+            self._build_workspace_buttons()
+        self.catalog_entries = list(new_entries)
+        added, removed, updated = self._apply_entries(self.catalog_entries + self._discovered_entries(), icons_changed)
+        log.info("Catálogo recargado: %d nuevos, %d eliminados, %d modificados", len(added), len(removed), len(updated))
+
+    @QtCore.pyqtSlot(list, list)
+    def _on_discovered(self, added: list, removed: list):
+        """Lote de DiscoveryEngine: se funde con el catálogo por el mismo diff que una recarga."""
+        gone = [self.discovered.pop(key) for key in removed if key in self.discovered]
+        for e in added:
+            self.discovered[e.key] = e
+        # lo descubierto solo aparece o desaparece (la ruta es la key): el diff ya viene hecho y se
+        # ahorra comparar la firma de miles de entradas en cada lote
+        self._apply_entries(self.catalog_entries + self._discovered_entries(), diff=(added, gone, []), search=False)
+
+    @QtCore.pyqtSlot(dict)
+    def _on_discovery_finished(self, stats: dict):
+        """Fin de una pasada: el índice de búsqueda se rehace una vez, fuera del hilo GUI."""
+        if not self._search_stale:
+            return
+        task = SearchBuildTask(self.entries, self.search_index)
+        task.signals.done.connect(self._on_search_built)
+        self._search_task = task  # las señales viven con la tarea hasta que llegue done
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    @QtCore.pyqtSlot(object, object)
+    def _on_search_built(self, entries: list, index: SearchIndex):
+        self._search_task = None
+        # si entretanto cambiaron las entradas (otro lote) o ya se rehízo (búsqueda), se descarta
+        if entries is not self.entries or not self._search_stale:
+            return
+        self.search_index = index
+        self._search_stale = False
+        self._pending_boost = self.usage.ranking()
+        if self.search.text().strip():
+            self.schedule_relayout()
+
+    def _discovered_entries(self) -> list:
+        """Entradas descubiertas, sin las que ya están en el catálogo (mismo ejecutable, si ya se conoce)."""
+        known = set()
+        for e in self.catalog_entries:
+            for p in (self.resolver.path(e.key), os.path.expandvars(e.exe)):
+                if p and os.path.isabs(p):
+                    known.add(os.path.normcase(os.path.normpath(p)))
+        return [e for e in self.discovered.values() if os.path.normcase(e.exe) not in known]
+
+    def start_discovery(self):
+        """Arranca el descubrimiento (tras el primer frame, o ya si la ventana arranca oculta)."""
+        if self.discovery is not None:
+            self.discovery.start()
+
+    def _apply_entries(self, new_entries: list, icons_changed: bool = False, diff=None, search: bool = True):
+        """Ajusta tiles, páginas, índices y servicios a la lista de entradas nueva; devuelve el diff
+        (se calcula con diff_catalog si no se da ya hecho). Con search=False el índice de búsqueda
+        solo se marca como desfasado (lotes del descubrimiento, ver _on_discovery_finished)."""
+        added, removed, updated = diff_catalog(self.entries, new_entries) if diff is None else diff
+        current = {e.key: e for e in self.entries}
+        for e in updated:
+            current[e.key].update_from(e)
+        # las entradas existentes conservan su identidad; el orden es el del fichero nuevo
+        self.entries = [current.get(e.key, e) for e in new_entries]
+        refresh = self.entries if icons_changed else [current[e.key] for e in updated]
+
+        # páginas de categorías que ya no existen: fuera de la caché (la visible pasa a "Todos")
+        categories = self.categories()
+        for category in [c for c in self.pages if c and c not in categories]:
+            page = self.pages.pop(category)
+            if page is not self.page:
+                self._drop_page(page)
+        for page in self.pages.values():
+            self._sync_page(page, refresh)
+
+        if search:
+            self.search_index.build(self.entries)
+            QtCore.QThreadPool.globalInstance().start(self.search_index.warm)
+        self._search_stale = not search
+        if self.prewarm is not None:
+            self.prewarm.set_entries(self.entries)
+        self.badges.set_entries(self.entries)
+        self._on_badges(self.badges.values())  # el catálogo trae el badge estático; manda el proveedor
+        # lo descubierto ya tiene ruta absoluta y DiscoveryEngine sigue su existencia: solo el catálogo
+        self.resolver.set_entries(self.catalog_entries)
+        self._usage_dirty = True
+        if list(self.sidebar_buttons) != [ALL_CATEGORY] + categories:
+            self._build_sidebar_buttons()
+        if self.page.category and self.page.category not in categories:
+            stale, self.page = self.page, None
+            self.show_category(ALL_CATEGORY)
+            self._drop_page(stale)
+        else:
+            self.relayout_tiles()
+        return added, removed, updated
+
+    def _sync_page(self, page: CategoryPage, refresh):
+        """Ajusta una página cacheada al catálogo nuevo (las categorías de una entrada pueden cambiar)."""
+        if page.virtual:
+            for e in refresh:
+                page.tile_model.refresh_entry(e)
+            return
+        wanted = [e for e in self.entries if page.accepts(e)]
+        keys = {e.key for e in wanted}
+        for key in [k for k in page.tile_by_key if k not in keys]:
+            tile = page.tile_by_key.pop(key)
+            page.layout_engine.forget(tile)
+            tile.deleteLater()
+        for e in refresh:
+            tile = page.tile_by_key.get(e.key)
+            if tile is not None:
+                tile.set_entry(e, self.icon_for(e))
+        for e in wanted:
+            if e.key not in page.tile_by_key:
+                self._create_tile(page, e)
+        page.tiles = [page.tile_by_key[e.key] for e in wanted]
+        page.container.tiles = page.tiles
+
+    def set_entry_badge(self, entry: ProgramEntry, value: int):
+        entry.badge = value
+        for page in self.pages.values():
+            if page.virtual:
+                page.tile_model.refresh_entry(entry)
+            else:
+                tile = page.tile_by_key.get(entry.key)
+                if tile is not None:
+                    tile.set_badge(value)
+
+    @QtCore.pyqtSlot(dict)
+    def _on_badges(self, values: dict):
+        """Contadores de BadgeService (ya agrupados: como mucho una llamada por frame)."""
+        if not values:
+            return
+        for e in self.entries:
+            value = values.get(e.key)
+            if value is not None and value != e.badge:
+                self.set_entry_badge(e, value)
+
+    @QtCore.pyqtSlot(dict)
+    def _on_availability(self, changes: dict):
+        """Ejecutables que aparecieron o desaparecieron (ExeResolver, agrupados por frame)."""
+        for page in self.pages.values():
+            for key, available in changes.items():
+                if page.virtual:
+                    page.tile_model.set_available(key, available)
+                else:
+                    tile = page.tile_by_key.get(key)
+                    if tile is not None:
+                        tile.set_available(available)
+
+    @QtCore.pyqtSlot(dict)
+    def _on_usage(self, usage: dict):
+        shown = {key: format_usage(cpu, rss) for key, (cpu, rss) in usage.items()}
+        for key in set(shown) | set(self._usage_shown):
+            text = shown.get(key)
+            if text == self._usage_shown.get(key):
+                continue
+            for page in self.pages.values():
+                if page.virtual:
+                    page.tile_model.set_usage(key, text)
+                else:
+                    tile = page.tile_by_key.get(key)
+                    if tile is not None:
+                        tile.set_usage(text)
+        self._usage_shown = shown
+
+    @QtCore.pyqtSlot(str, int)
+    def _on_running_changed(self, key: str, count: int):
+        for page in self.pages.values():
+            if page.virtual:
+                page.tile_model.set_running(key, count)
             else:
-                t.setVisible(False)
+                tile = page.tile_by_key.get(key)
+                if tile is not None:
+                    tile.set_running(count)
+
+    def _refresh_frecency(self):
+        """Recalcula el orden por frecency y el refuerzo de la búsqueda (ver UsageStore)."""
+        ranking = self.usage.ranking()
+        self._frecency_order = self.usage.order(self.entries, ranking)
+        self._pending_boost = ranking  # el índice se actualiza con la primera búsqueda
+        self._usage_dirty = False
+
+    def filter_entries(self, q: str):
+        if self._usage_dirty:
+            self._refresh_frecency()
+        if not q:
+            return self._frecency_order
+        if self._search_stale:
+            # se busca antes de que llegue el índice de fondo: se rehace aquí (solo normaliza lo nuevo)
+            self.search_index.build(self.entries)
+            self._search_stale = False
+            self._pending_boost = self.usage.ranking()
+        if self._pending_boost is not None:
+            self.search_index.set_boost(self._pending_boost)
+            self._pending_boost = None
+        return self.search_index.search(q)
+
+    @QtCore.pyqtSlot(dict)
+    def _on_launch_finished(self, record: dict):
+        if record.get("outcome") == "error":
+            return
+        self.usage.record(record["key"])
+        # el orden nuevo se aplica en la siguiente apertura, no bajo el puntero del usuario
+        self._usage_pending = True
+
+    def _compute_layout(self, page: CategoryPage):
+        q = self.search.text().strip()
+        visible = self.filter_entries(q)
+        if page.category:
+            visible = [e for e in visible if page.category in e.categories]
+        if page.virtual:
+            # el reparto en columnas lo hace QListView; cols solo se usa para la navegación
+            avail = page.grid_view.viewport().width()
+            col_w = TILE_W + GRID_SPACING
+            page.cols = max(1, avail // col_w)
+            return page.cols, visible
         # compute columns based on available width
         avail = max(400, self.width() - SIDEBAR_WIDTH - 200)
         col_w = TILE_W + 24
-        cols = max(1, avail // col_w)
-        self.cols = cols
-        # clear layout
-        while self.grid_layout.count():
-            it = self.grid_layout.takeAt(0)
-            w = it.widget()
-            if w:
-                w.setParent(None)
-        # add visible tiles in grid
-        r = c = 0
-        for t in visible:
-            self.grid_layout.addWidget(t, r, c, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
-            c += 1
-            if c >= cols:
-                c = 0
-                r += 1
-        self.grid_container.update()
+        page.cols = max(1, avail // col_w)
+        return page.cols, [page.tile_by_key[e.key] for e in visible]
+
+    def schedule_relayout(self, *_):
+        """Relayout diferido: resize y teclas de búsqueda del mismo frame se agrupan.
+        Solo la página visible; las cacheadas se ponen al día al volver a mostrarse."""
+        self.layout_engine.schedule()
+
+    def relayout_tiles(self):
+        """Relayout inmediato (incremental; no hace nada si columnas y filtro no cambiaron)."""
+        self.layout_engine.flush()
 
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
-        self.relayout_tiles()
+        self.schedule_relayout()
 
-    def move_focus_from_tile(self, tile, key):
-        if tile not in self.tiles:
-            return
-        visible_tiles = [t for t in self.tiles if t.isVisible()]
-        try:
-            idx = visible_tiles.index(tile)
-        except ValueError:
+    def showEvent(self, ev):
+        super().showEvent(ev)
+        if self._usage_pending:
+            self._usage_pending = False
+            self._usage_dirty = True
+            self.relayout_tiles()
+
+    def paintEvent(self, ev):
+        super().paintEvent(ev)
+        if not STARTUP.done and self.isVisible():
+            # el frame se presenta al volver al bucle de eventos
+            QtCore.QTimer.singleShot(0, self._startup_frame_done)
+
+    def _startup_frame_done(self):
+        record = STARTUP.finish(tiles=len(self.entries), virtual_grid=self.virtual_grid)
+        if record is not None:
+            self.startupFinished.emit(record)
+        self.start_discovery()
+
+    def closeEvent(self, ev):
+        if self.resident:
+            # sigue en la bandeja con todo construido: la siguiente apertura es instantánea
+            ev.ignore()
+            self.hide()
             return
-        cols = max(1, self.cols)
-        rows = (len(visible_tiles) + cols - 1) // cols
-        r = idx // cols
-        c = idx % cols
-        if key == QtCore.Qt.Key.Key_Left:
-            new_idx = idx - 1 if c > 0 else idx
-        elif key == QtCore.Qt.Key.Key_Right:
-            new_idx = idx + 1 if (c < cols - 1 and idx + 1 < len(visible_tiles)) else idx
-        elif key == QtCore.Qt.Key.Key_Up:
-            new_idx = idx - cols if r > 0 else idx
-        elif key == QtCore.Qt.Key.Key_Down:
-            new_idx = idx + cols if (r < rows - 1 and idx + cols < len(visible_tiles)) else idx
+        super().closeEvent(ev)
+
+    def bring_to_front(self):
+        if self.isMinimized():
+            self.showNormal()
         else:
-            new_idx = idx
-        target = visible_tiles[new_idx]
-        target.setFocus()
-        for t in self.tiles:
-            t.set_selected(t is target)
+            self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def entry_by_key(self, key: str):
+        for e in self.entries:
+            if e.key == key:
+                return e
+        return None
+
+    def find_workspace(self, name: str):
+        """Espacio de trabajo por nombre (sin acentos ni mayúsculas); None si no existe."""
+        folded = fold_text(name).strip()
+        for ws in self.workspaces:
+            if fold_text(ws.name) == folded:
+                return ws
+        return None
+
+    def run_workspace(self, name: str) -> bool:
+        """Abre todos los programas del espacio `name` (ver WorkspaceRun). False si no existe."""
+        ws = self.find_workspace(name)
+        if ws is None:
+            return False
+        if ws.name in self._workspace_runs:
+            log.info("el espacio de trabajo %r ya se está abriendo", ws.name)
+            return True
+        run = WorkspaceRun(ws, self, self)
+        run.stepChanged.connect(self._update_loading_overlay)
+        run.finished.connect(lambda summary, r=run: self._on_workspace_finished(r, summary))
+        self._workspace_runs[ws.name] = run
+        run.start()
+        return True
+
+    def _on_workspace_finished(self, run: WorkspaceRun, summary: dict):
+        self._workspace_runs.pop(run.workspace.name, None)
+        run.deleteLater()
+        self._update_loading_overlay()
+        failed = [s for s in summary["steps"] if s["state"] != "ready"]
+        if failed:
+            labels = {e.key: e.label for e in self.entries}
+            lines = "\n".join(f"- {labels.get(s['key'], s['key'])}: {s['reason']}" for s in failed)
+            self.show_warning("Espacio de trabajo",
+                              f"{summary['workspace']}: {len(failed)} de {len(summary['steps'])} programas "
+                              f"no se abrieron.\n\n{lines}")
+
+    def find_entry(self, name: str):
+        """Entrada por key o por label (sin acentos ni mayúsculas); None si no existe."""
+        folded = fold_text(name).strip()
+        for e in self.entries:
+            if e.key == name or fold_text(e.label) == folded or fold_text(e.key) == folded:
+                return e
+        return None
+
+    def move_focus_from_tile(self, tile, key):
+        target = self.selection.neighbor(tile, key)
+        if target is not None:
+            self.selection.select(target)
 
     def on_tile_clicked(self, tile):
-        for t in self.tiles:
-            t.set_selected(t is tile)
-        self.launch_program(tile.exe)
+        self.selection.select(tile)
+        self.launch_entry(tile.entry)
+
+    def on_entry_clicked(self, entry: ProgramEntry):
+        self.launch_entry(entry)
+
+    def on_tile_hovered(self, tile):
+        self.on_entry_hovered(tile.entry)
+
+    def on_entry_menu(self, entry: ProgramEntry, pos: QtCore.QPoint):
+        menu = QtWidgets.QMenu(self)
+        menu.addAction("Abrir", lambda: self.launch_entry(entry))
+        act = menu.addAction("Ver salida", lambda: self.show_output(entry))
+        act.setEnabled(entry.capture)
+        menu.exec(pos)
+        menu.deleteLater()
+
+    def show_output(self, entry: ProgramEntry):
+        """Visor de la salida capturada de `entry` (uno por entrada; se reutiliza si ya está abierto)."""
+        viewer = self._viewers.get(entry.key)
+        if viewer is None:
+            viewer = self._viewers[entry.key] = OutputViewer(entry, self)
+            viewer.finished.connect(lambda _=0, k=entry.key: self._viewers.pop(k, None))
+            viewer.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        viewer.show()
+        viewer.raise_()
+        viewer.activateWindow()
+
+    def on_entry_hovered(self, entry: ProgramEntry):
+        # el click suele llegar unos cientos de ms después: se adelanta la lectura del exe y sus datos
+        if self.prewarm is not None and entry is not None:
+            self.prewarm.warm_now(entry)
+
+    def launch_entry(self, entry: ProgramEntry):
+        if entry.single_instance and self.supervisor.is_running(entry.key):
+            procs = self.supervisor.running(entry.key)
+            if entry.single_instance == "focus" and procs and focus_process_window(procs[0].pid):
+                return
+            log.info("%s ya está en ejecución; no se lanza otra instancia", entry.exe)
+            self.show_warning("Ya en ejecución", f"{entry.label} ya está abierto.")
+            return
+        if not self.resolver.available(entry.key):
+            # ya se sabe que no está: aviso inmediato, sin encolar ni tocar el disco
+            self.resolver.refresh(entry.key)  # por si acaba de volver (recurso de red)
+            self.show_warning("No encontrado", f"No se encontró: {entry.exe}")
+            return
+        trace = self.telemetry.begin(entry.key, entry.exe, entry.label, entry.ready, entry.cwd)
+        self.launch_program(entry.exe, entry.args, entry.cwd, entry.env, key=entry.key,
+                            priority=LaunchScheduler.INTERACTIVE, trace=trace, path=self.resolver.path(entry.key),
+                            capture=entry.capture)
         
     @QtCore.pyqtSlot() # <-- NUEVO MÉTODO
     def hide_loading_overlay(self):
         """Oculta la capa de carga cuando el programa ha sido lanzado."""
         self.loading_overlay.hide()
 
+    @QtCore.pyqtSlot(int, int)
+    def _on_launch_queue(self, queued: int, running: int):
+        self._launch_queue = (queued, running)
+        self._update_loading_overlay()
+
+    def _update_loading_overlay(self, *_):
+        # la capa sigue hasta que la app lanzada está lista de verdad (LaunchTelemetry), no solo
+        # hasta que Popen vuelve
+        queued, running = self._launch_queue
+        waiting = self.telemetry.waiting()
+        if self.prewarm is not None:
+            # el pre-calentado no compite por el disco con un lanzamiento en curso
+            self.prewarm.set_idle(not (queued or running or waiting))
+        if not queued and not running and not waiting:
+            self.hide_loading_overlay()
+            return
+        if queued or running:
+            text = "Lanzando programa..."
+            if queued:
+                text += f" ({queued} en cola)"
+        else:
+            text = f"Abriendo {waiting[0].label}..."
+        for run in self._workspace_runs.values():
+            text = f"{run.workspace.name}: {run.count('ready')}/{len(run.state)} listos\n{text}"
+            break
+        self.loading_overlay.label.setText(text)
+
     # SLOTS DE CORRECCIÓN: Para recibir mensajes de error del hilo secundario
     @QtCore.pyqtSlot(str, str)
     def show_warning(self, title: str, msg: str):
@@ -653,29 +6231,195 @@ class MainWindow(QtWidgets.QMainWindow):
         QtWidgets.QMessageBox.critical(self, title, msg)
 
     # FUNCIÓN CORREGIDA: Muestra LoadingOverlay y conecta la señal de finalización
-    def launch_program(self, exe_name: str):
-        # 1. Muestra la capa de carga y la pone al frente
+    def launch_program(self, exe_name: str, args=(), cwd: str = None, env: dict = None, key: str = None,
+                       priority: int = LaunchScheduler.NORMAL, trace: LaunchTrace = None, path: str = None,
+                       capture: bool = True) -> bool:
+        # 1. Creamos una instancia de nuestra subclase QRunnable (el supervisor recibe el proceso)
+        key = key or exe_name
+        if trace is None:
+            trace = self.telemetry.begin(key, exe_name, cwd=cwd)
+        r = LauncherTask(exe_name, parent=self, args=args, cwd=cwd, env=env, supervisor=self.supervisor, key=key,
+                         trace=trace, path=path, resolver=self.resolver, capture=capture)
+        r.signals.finished.connect(lambda tr=trace: self.telemetry.task_finished(tr))
+        trace.queued = time.monotonic()
+
+        # 2. La cola de lanzamientos limita la concurrencia y descarta clicks repetidos
+        #    (la capa de carga se oculta cuando la cola queda vacía: ver _on_launch_queue)
+        if not self.launcher.submit(r, priority, coalesce_key=(exe_name, tuple(args), cwd)):
+            return False
+        self.supervisor.reserve(key)
+
+        # 3. Muestra la capa de carga y la pone al frente
         self.loading_overlay.show()
         self.loading_overlay.raise_()
-        
-        # 2. Creamos una instancia de nuestra subclase QRunnable
-        r = LauncherTask(exe_name, parent=self)
-        
-        # 3. Conecta la señal de finalización al método para ocultar el loading
-        r.signals.finished.connect(self.hide_loading_overlay) # <-- CONEXIÓN CLAVE
-        
-        # 4. Iniciamos la tarea en el pool de hilos global
-        QtCore.QThreadPool.globalInstance().start(r)
+        return True
+
+# ----------------------------
+# Instancia residente: bandeja del sistema + IPC para invocaciones posteriores
+# ----------------------------
+class InstanceServer(QtCore.QObject):
+    """Atiende las invocaciones posteriores del launcher (una línea JSON por conexión).
+
+    {"cmd": "show"} trae la ventana al frente; {"cmd": "launch", "name": "EQUIPOS"} lanza la
+    entrada sin mostrarla y {"cmd": "workspace", "name": ...} abre un espacio de trabajo. Responde {"ok": true} o {"ok": false, "error": "..."}.
+    """
+
+    def __init__(self, window: "MainWindow", parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.server = QtNetwork.QLocalServer(self)
+        self.server.setSocketOptions(QtNetwork.QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self._on_connection)
+
+    def listen(self) -> bool:
+        name = instance_server_name()
+        if not self.server.listen(name):
+            # socket huérfano de una instancia que murió sin cerrar (Linux): se limpia y se reintenta
+            QtNetwork.QLocalServer.removeServer(name)
+            if not self.server.listen(name):
+                log.error("no se pudo abrir el servidor de instancia %s: %s", name, self.server.errorString())
+                return False
+        log.info("instancia residente escuchando en %s", self.server.fullServerName())
+        return True
+
+    def _on_connection(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            sock.readyRead.connect(lambda s=sock: self._on_ready(s))
+            sock.disconnected.connect(sock.deleteLater)
+
+    def _on_ready(self, sock: QtNetwork.QLocalSocket):
+        if not sock.canReadLine():
+            return
+        try:
+            msg = json.loads(bytes(sock.readLine()).decode("utf-8"))
+            reply = self.handle(msg)
+        except ValueError:
+            reply = {"ok": False, "error": "mensaje inválido"}
+        sock.write((json.dumps(reply) + "\n").encode("utf-8"))
+        sock.flush()
+
+    def handle(self, msg: dict) -> dict:
+        cmd = msg.get("cmd")
+        if cmd == "show":
+            self.window.bring_to_front()
+            return {"ok": True}
+        if cmd == "launch":
+            entry = self.window.find_entry(str(msg.get("name", "")))
+            if entry is None:
+                return {"ok": False, "error": f"no existe el programa {msg.get('name')!r}"}
+            self.window.launch_entry(entry)
+            return {"ok": True}
+        if cmd == "workspace":
+            if not self.window.run_workspace(str(msg.get("name", ""))):
+                return {"ok": False, "error": f"no existe el espacio de trabajo {msg.get('name')!r}"}
+            return {"ok": True}
+        return {"ok": False, "error": f"comando desconocido {cmd!r}"}
+
+class TrayController(QtCore.QObject):
+    """Icono de bandeja de la instancia residente: click muestra/oculta, menú con Salir."""
+
+    def __init__(self, window: "MainWindow", app: QtWidgets.QApplication, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.app = app
+        icon = QtGui.QIcon(resource_path(DEFAULT_ICONS["prog_progain"]))
+        if icon.isNull():
+            icon = app.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon)
+        self.tray = QtWidgets.QSystemTrayIcon(icon, self)
+        self.tray.setToolTip("PROGAIN Launcher")
+        menu = QtWidgets.QMenu()
+        menu.addAction("Mostrar", window.bring_to_front)
+        menu.addSeparator()
+        menu.addAction("Salir", self.quit)
+        self._menu = menu
+        self.tray.setContextMenu(menu)
+        self.tray.activated.connect(self._on_activated)
+        self.tray.show()
+
+    def _on_activated(self, reason):
+        if reason == QtWidgets.QSystemTrayIcon.ActivationReason.Trigger:
+            if self.window.isVisible() and not self.window.isMinimized():
+                self.window.hide()
+            else:
+                self.window.bring_to_front()
+
+    def quit(self):
+        self.window.resident = False
+        self.tray.hide()
+        self.app.quit()
 
 # ----------------------------
 # Run
 # ----------------------------
+def setup_logging():
+    logging.basicConfig(filename=LOG_FILE, level=logging.INFO, encoding="utf-8",
+                        format="%(asctime)s %(levelname)s %(message)s")
+
 def main():
+    args = parse_args(sys.argv[1:])
+    setup_logging()
+    STARTUP.enabled = STARTUP.enabled or args.trace_startup
+    STARTUP.mark("module")
+    if args.launch_stats:
+        print_launch_stats()
+        return
+    bench = args.quit_after_first_frame
+    # si ya hay una instancia residente se le pasa la petición y se termina en milisegundos
+    # (ejecutado como script ya se intentó antes de importar Qt)
+    if not bench:
+        code = forward_to_running_instance(args)
+        if code is not None:
+            sys.exit(code)
+
+    # el spawner se arranca antes que la GUI crezca: es el único fork del proceso grande
+    spawner = SpawnerClient.start_if_enabled()
     app = QtWidgets.QApplication(sys.argv)
+    app.setOrganizationName("PROGAIN")
+    app.setApplicationName("PROGAIN Launcher")
     app.setStyle("Fusion")
+    STARTUP.mark("qapplication")
     win = MainWindow()
-    win.show()
-    sys.exit(app.exec())
+    if bench:
+        def _report(record):
+            print(json.dumps(record), flush=True)
+            app.quit()
+        win.startupFinished.connect(_report)
+    resident = not (args.no_tray or bench) and os.environ.get("PROGAIN_RESIDENT", "1") != "0"
+    tray = None
+    if resident and QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
+        win.resident = True
+        app.setQuitOnLastWindowClosed(False)
+        tray = TrayController(win, app)
+    server = InstanceServer(win)
+    if not bench:
+        server.listen()
+    if args.launch:
+        entry = win.find_entry(args.launch)
+        if entry is not None:
+            win.launch_entry(entry)
+        else:
+            log.warning("--launch: no existe el programa %r", args.launch)
+    if args.workspace and not win.run_workspace(args.workspace):
+        log.warning("--workspace: no existe el espacio de trabajo %r", args.workspace)
+    if not ((args.launch or args.workspace) and win.resident):
+        win.show()
+        STARTUP.mark("show")
+    elif not bench:
+        win.start_discovery()  # sin ventana no hay primer frame que esperar
+    code = app.exec()
+    win.badges.stop()
+    win.resolver.stop()
+    if win.discovery is not None:
+        win.discovery.stop()
+    if win.monitor is not None:
+        win.monitor.stop()
+    if win.prewarm is not None:
+        win.prewarm.stop()
+    win.usage.close()
+    if spawner is not None:
+        spawner.close()
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Proceso auxiliar de lanzamiento para el launcher PROGAIN (solo POSIX).
+
+El launcher lo arranca al inicio (PROGAIN_SPAWNER=1) y le pide los lanzamientos por stdin en
+vez de hacer fork desde el proceso PyQt6, que tiene mapeadas todas las librerías de Qt. Este
+proceso solo importa la librería estándar, así que su posix_spawn es barato.
+
+Protocolo: una línea JSON por mensaje.
+    -> {"id": 1, "argv": ["/ruta/prog", "arg"], "cwd": null, "env": null}
+       (+ "output": ruta opcional, FIFO del launcher donde van stdout y stderr del hijo; sin
+        ella van al stderr de este proceso. stdin del hijo es siempre /dev/null)
+    <- {"id": 1, "pid": 1234}                       | {"id": 1, "errno": 2, "error": "..."}
+    <- {"event": "exit", "pid": 1234, "code": 0}    (cuando el hijo termina; lo recoge este proceso)
+"""
+
+import json
+import os
+import sys
+import threading
+
+
+def main():
+    out = sys.stdout
+    out_lock = threading.Lock()
+    alive = threading.Condition()
+    children = [0]  # hijos lanzados aún sin recoger
+
+    def send(msg: dict):
+        with out_lock:
+            out.write(json.dumps(msg) + "\n")
+            out.flush()
+
+    def reap():
+        # los hijos son nuestros: se recogen aquí y se notifica la salida al launcher
+        while True:
+            with alive:
+                while not children[0]:
+                    alive.wait()
+            try:
+                pid, status = os.waitpid(-1, 0)
+            except ChildProcessError:
+                with alive:
+                    children[0] = 0
+                continue
+            with alive:
+                children[0] -= 1
+            send({"event": "exit", "pid": pid, "code": os.waitstatus_to_exitcode(status)})
+
+    threading.Thread(target=reap, name="reaper", daemon=True).start()
+
+    home = os.getcwd()
+    for line in sys.stdin:
+        try:
+            req = json.loads(line)
+        except ValueError:
+            continue
+        argv = req.get("argv") or []
+        env = req.get("env")
+        # el hijo nunca hereda nuestro stdin/stdout (son el protocolo): lo que escribiera rompería
+        # la siguiente respuesta y lo que leyera se comería peticiones. Su salida va al FIFO del
+        # launcher si se captura; si no, a nuestro stderr, que es el del launcher.
+        file_actions = [(os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0)]
+        if req.get("output"):
+            file_actions += [
+                (os.POSIX_SPAWN_OPEN, 1, req["output"], os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_DUP2, 1, 2),
+            ]
+        else:
+            file_actions.append((os.POSIX_SPAWN_DUP2, 2, 1))
+        try:
+            # posix_spawn no acepta cwd: el proceso es de un solo hilo lanzando, así que se
+            # cambia el cwd propio alrededor de la llamada
+            cwd = req.get("cwd")
+            if cwd:
+                os.chdir(cwd)
+            try:
+                pid = os.posix_spawn(argv[0], argv, env if env is not None else os.environ,
+                                     file_actions=file_actions)
+            finally:
+                if cwd:
+                    os.chdir(home)
+        except (OSError, IndexError) as e:
+            send({"id": req.get("id"), "errno": getattr(e, "errno", None) or 0, "error": str(e)})
+            continue
+        send({"id": req.get("id"), "pid": pid})
+        with alive:
+            children[0] += 1
+            alive.notify()
+
+
+if __name__ == "__main__":
+    main()
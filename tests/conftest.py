@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication (plataforma offscreen) para los tests que usan timers, señales o widgets de Qt."""
+    from PyQt6 import QtWidgets
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path, monkeypatch):
+    """progain.log y los logs que se escriben a su lado (uso, lanzamientos, salida) van a tmp_path."""
+    import lanzador_programas_PyQT6 as launcher
+    monkeypatch.setattr(launcher, "LOG_FILE", str(tmp_path / launcher.LOG_FILE))
+    return tmp_path
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""BadgeService: un proveedor quitado con su pasada en curso se cierra cuando esta termina."""
+import threading
+import time
+
+import lanzador_programas_PyQT6 as launcher
+
+
+class BlockingProvider(launcher.BadgeProvider):
+    """count() espera a que el test lo suelte; anota si se cerró."""
+
+    def __init__(self):
+        super().__init__({})
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.closed = False
+
+    def version(self):
+        return None
+
+    def count(self, deadline: float) -> int:
+        self.started.set()
+        self.release.wait(5)
+        return 1
+
+    def close(self):
+        self.closed = True
+
+
+def process_until(app, cond, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return cond()
+
+
+def test_removed_inflight_provider_is_closed(qapp):
+    service = launcher.BadgeService()
+    provider = BlockingProvider()
+    service.add("k", provider)
+    assert process_until(qapp, provider.started.is_set)
+    service.remove("k")
+    assert not provider.closed  # su hilo aún lo está usando
+    provider.release.set()
+    assert process_until(qapp, lambda: provider.closed)
+    assert service.values() == {}
+    service.pool.waitForDone()
+
+
+class SlowFirstCount(launcher.BadgeProvider):
+    """Fuente que no cambia nunca; el primer count() se pasa del timeout."""
+
+    def __init__(self):
+        super().__init__({"timeout": 0.1})
+        self.counts = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def version(self):
+        return "v1"
+
+    def count(self, deadline: float) -> int:
+        self.counts += 1
+        if self.counts == 1:
+            self.started.set()
+            self.release.wait(5)
+        return 7
+
+
+def test_timed_out_pass_is_counted_again(qapp):
+    service = launcher.BadgeService()
+    provider = SlowFirstCount()
+    service.add("k", provider)
+    assert process_until(qapp, provider.started.is_set)
+    time.sleep(provider.timeout * 2)
+    service._on_tick()  # da la pasada por perdida
+    assert service.stats["timeouts"] == 1
+    provider.release.set()
+    assert process_until(qapp, lambda: "k" not in service._inflight)
+    assert service.values() == {}  # el resultado tardío se descarta...
+    service._due["k"] = 0.0
+    service._on_tick()
+    # ...y como su versión no se guardó, la siguiente pasada vuelve a contar
+    assert process_until(qapp, lambda: service.values() == {"k": 7})
+    assert provider.counts == 2
+    service.remove("k")
+    service.pool.waitForDone()
+
+
+def test_removed_idle_provider_is_closed_now(qapp):
+    service = launcher.BadgeService()
+    provider = BlockingProvider()
+    provider.release.set()
+    service.add("k", provider)
+    assert process_until(qapp, lambda: "k" not in service._inflight and service.stats["runs"])
+    service.remove("k")
+    assert provider.closed
+    service.pool.waitForDone()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Catálogo externo: un fichero mal escrito da CatalogError, nunca una excepción suelta."""
+import json
+
+import pytest
+
+import lanzador_programas_PyQT6 as launcher
+
+BASE = {"label": "PROGAIN", "exe": "progain_app.exe"}
+
+BAD_FIELDS = [
+    ("badge", "n/a"),
+    ("badge", 1.5),
+    ("args", 5),
+    ("args", [["-x"]]),
+    ("tags", 3),
+    ("aliases", {"a": 1}),
+    ("categories", [None]),
+    ("env", ["A=1"]),
+    ("env", {"A": 1}),
+    ("cwd", 7),
+    ("key", 7),
+    ("icon", ["x.png"]),
+    ("label", 42),
+    ("exe", ["a.exe"]),
+    ("ready", "window"),
+    ("prewarm", 1),
+    ("badge_source", "facturas.txt"),
+    ("capture", "no"),
+    ("single_instance", "always"),
+]
+
+
+@pytest.mark.parametrize("field,value", BAD_FIELDS)
+def test_entry_from_dict_rejects_bad_types(field, value):
+    with pytest.raises(launcher.CatalogError):
+        launcher.entry_from_dict(dict(BASE, **{field: value}))
+
+
+def test_entry_from_dict_accepts_valid_fields():
+    e = launcher.entry_from_dict(dict(BASE, badge=3, args=["-v", 2], tags="obra", env={"A": "1"}, cwd="C:\\apps"))
+    assert (e.badge, e.args, e.tags, e.env, e.cwd) == (3, ("-v", "2"), ("obra",), {"A": "1"}, "C:\\apps")
+
+
+def write_catalog(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("data", [
+    {"programs": [dict(BASE, badge="n/a")]},
+    {"programs": [dict(BASE, args=5)]},
+    {"programs": {"PROGAIN": BASE}},
+    {"programs": [BASE], "icons": ["a.png"]},
+    {"programs": [BASE], "icons": {"a": 1}},
+    {"programs": [BASE], "workspaces": {"Inicio": [{"key": "PROGAIN", "timeout": "60"}]}},
+    {"programs": [BASE], "workspaces": {"Inicio": [{"key": "PROGAIN", "after": 3}]}},
+])
+def test_loader_raises_catalog_error(tmp_path, data):
+    loader = launcher.CatalogLoader(write_catalog(tmp_path / "catalog.json", data))
+    with pytest.raises(launcher.CatalogError):
+        loader.load()
+
+
+def test_watcher_reports_bad_reload_instead_of_raising(tmp_path, qapp):
+    path = write_catalog(tmp_path / "catalog.json", {"programs": [BASE]})
+    watcher = launcher.CatalogWatcher(launcher.CatalogLoader(path))
+    assert watcher.loader.load()[-1]
+    failed, changed = [], []
+    watcher.failed.connect(failed.append)
+    watcher.changed.connect(lambda *a: changed.append(a))
+    write_catalog(tmp_path / "catalog.json", {"programs": [dict(BASE, badge="n/a")]})
+    watcher._reload()
+    assert failed and "badge" in failed[0]
+    assert not changed
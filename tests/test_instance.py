@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""forward_to_running_instance: devuelve el código de salida y deja que quien llama termine."""
+import lanzador_programas_PyQT6 as launcher
+
+
+def forward(monkeypatch, reply, argv=("--launch", "PROGRAMA")):
+    sent = []
+    monkeypatch.setattr(launcher, "send_to_running_instance", lambda msg: sent.append(msg) or reply)
+    code = launcher.forward_to_running_instance(launcher.parse_args(list(argv)))
+    return code, sent
+
+
+def test_no_running_instance(monkeypatch):
+    code, sent = forward(monkeypatch, None)
+    assert code is None
+    assert sent == [{"cmd": "launch", "name": "PROGRAMA"}]
+
+
+def test_accepted_request(monkeypatch):
+    assert forward(monkeypatch, {"ok": True})[0] == 0
+
+
+def test_rejected_request_reports_error(monkeypatch, capsys):
+    code, _ = forward(monkeypatch, {"ok": False, "error": "no existe"})
+    assert code == 1
+    assert "no existe" in capsys.readouterr().err
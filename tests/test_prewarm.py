@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""PrewarmEngine: la lectura anticipada va por bloques y cede a los lanzamientos y a stop()."""
+import time
+
+import pytest
+
+import lanzador_programas_PyQT6 as launcher
+
+SIZE = 8 << 20
+
+
+class SlowPrewarm(launcher.PrewarmEngine):
+    RATE_MB_S = 1  # 8 s para el fichero de prueba si nadie lo interrumpe
+
+
+@pytest.fixture
+def engine(qapp, tmp_path):
+    usage = launcher.UsageStore(str(tmp_path / "usage.log"))
+    eng = SlowPrewarm(usage, budget_mb=64, top_n=0)
+    eng._cpu.sample = lambda: 0.0  # la carga de la máquina de tests no cuenta
+    big = tmp_path / "programa.bin"
+    with open(big, "wb") as f:
+        f.truncate(SIZE)
+    eng.entry = launcher.ProgramEntry("PROGRAMA", "", str(big), key="p")
+    yield eng
+    eng.stop()
+    usage.close()
+
+
+def wait_for(cond, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return cond()
+
+
+def test_stop_interrupts_a_file_in_progress(engine):
+    engine._submit([engine._job(engine.entry, [engine.budget])])
+    time.sleep(0.3)
+    t = time.monotonic()
+    engine.stop(timeout=2.0)
+    assert not engine._thread.is_alive()
+    assert time.monotonic() - t < 1.0
+
+
+def test_launch_in_progress_pauses_prewarm(engine):
+    engine._submit([engine._job(engine.entry, [engine.budget])])
+    time.sleep(0.3)
+    engine.set_idle(False)  # empieza un lanzamiento
+    assert wait_for(lambda: engine.stats["files"] == 1)
+    assert 0 < engine.stats["bytes"] < SIZE
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""progain_spawner: los hijos no tocan las tuberías del protocolo y un timeout no relanza con Popen."""
+import os
+import sys
+
+import pytest
+
+import lanzador_programas_PyQT6 as launcher
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "posix_spawn"), reason="spawner solo en POSIX")
+
+SCRIPT = os.path.join(os.path.dirname(launcher.__file__), launcher.SPAWNER_SCRIPT)
+
+
+@pytest.fixture
+def spawner():
+    client = launcher.SpawnerClient(SCRIPT)
+    yield client
+    client.close()
+
+
+def wait_exit(proc, timeout=5.0):
+    import time
+    deadline = time.monotonic() + timeout
+    while proc.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return proc.returncode
+
+
+def test_child_output_and_stdin_stay_off_the_protocol(spawner):
+    # un hijo que escribe en stdout y lee stdin no debe romper ni comerse el protocolo
+    noisy = "import sys; print('{\"id\": 2, \"pid\": 1}'); sys.stdout.flush(); sys.exit(len(sys.stdin.read()))"
+    first = spawner.spawn([sys.executable, "-c", noisy])
+    assert wait_exit(first) == 0  # stdin es /dev/null: lee 0 bytes
+    second = spawner.spawn([sys.executable, "-c", "pass"])
+    assert second.pid != 1 and second.pid != first.pid
+    assert wait_exit(second) == 0
+
+
+def test_timeout_is_not_unavailable(tmp_path, monkeypatch):
+    # un "spawner" que recibe la petición y nunca responde
+    mute = tmp_path / "mute.py"
+    mute.write_text("import sys\nfor _ in sys.stdin:\n    pass\n")
+    client = launcher.SpawnerClient(str(mute))
+    monkeypatch.setattr(client, "TIMEOUT", 0.2)
+    try:
+        with pytest.raises(launcher.SpawnerTimeout):
+            client.spawn([sys.executable, "-c", "pass"])
+        assert not issubclass(launcher.SpawnerTimeout, launcher.SpawnerUnavailable)
+    finally:
+        client.close()
+
+
+def test_dead_spawner_is_unavailable(spawner):
+    spawner.close()
+    with pytest.raises(launcher.SpawnerUnavailable):
+        spawner.spawn([sys.executable, "-c", "pass"])
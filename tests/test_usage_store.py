@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""UsageStore: la compactación no cuenta dos veces los lanzamientos que aún estaban en cola."""
+import threading
+
+import lanzador_programas_PyQT6 as launcher
+
+
+def write_log(path, lines: int, ts: float = 1_700_000_000.0):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            f.write(f"+{ts + i:.3f}\tp{i % 50}\n")
+
+
+def reload_count(path, key: str) -> int:
+    store = launcher.UsageStore(str(path))
+    try:
+        return store.count(key)
+    finally:
+        store.close()
+
+
+class SlowLoad(launcher.UsageStore):
+    """El hilo de escritura no carga el fichero hasta que el test lo permite."""
+
+    def __init__(self, path, gate: threading.Event):
+        self.gate = gate
+        super().__init__(path)
+
+    def _load(self):
+        self.gate.wait(5)
+        super()._load()
+
+
+def test_record_while_loading_counts_once(tmp_path):
+    path = tmp_path / "usage.log"
+    write_log(path, 600)  # por encima de COMPACT_MIN_LINES: se compacta al cargar
+    gate = threading.Event()
+    store = SlowLoad(str(path), gate)
+    store.record("k")
+    gate.set()
+    assert store.count("k") == 1
+    store.close()
+    assert reload_count(path, "k") == 1
+    assert reload_count(path, "p0") == 12
+
+
+class QueuedDuringCompact(launcher.UsageStore):
+    """Llega un lanzamiento entre la escritura de un lote y la compactación que dispara."""
+    COMPACT_MIN_LINES = 8
+
+    def __init__(self, path):
+        self.compacted = threading.Event()
+        super().__init__(path)
+
+    def _compact(self):
+        if self._lines > 1:
+            self.record("late")
+        super()._compact()
+        self.compacted.set()
+
+
+def test_record_between_append_and_compact_counts_once(tmp_path):
+    path = tmp_path / "usage.log"
+    store = QueuedDuringCompact(str(path))
+    store.wait_loaded()
+    for i in range(10):
+        store.record("k", ts=1_700_000_000.0 + i)
+    assert store.compacted.wait(5)
+    store.close()
+    late = store.count("late")
+    assert late >= 1
+    assert reload_count(path, "late") == late
+    assert reload_count(path, "k") == 10
+
+
+def test_score_and_count_read_under_the_lock(tmp_path):
+    # con _lock tomado (p. ej. un _bump a medias) las lecturas esperan en vez de ver el estado partido
+    store = launcher.UsageStore(str(tmp_path / "usage.log"))
+    store.wait_loaded()
+    store.record("k", ts=1_700_000_000.0)
+    results = []
+    with store._lock:
+        reader = threading.Thread(target=lambda: results.append((store.count("k"), store.score("k"))))
+        reader.start()
+        reader.join(0.2)
+        assert reader.is_alive() and not results
+    reader.join(5)
+    assert results and results[0][0] == 1 and results[0][1] > 0
+    store.close()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""VirtualTileGrid: el repintado de un tile animado cubre su sombra y su lift."""
+import pytest
+from PyQt6 import QtCore
+
+import lanzador_programas_PyQT6 as launcher
+
+
+@pytest.fixture
+def grid(qapp):
+    entries = [launcher.ProgramEntry(f"P{i}", "prog_progain", f"p{i}.exe", key=f"p{i}") for i in range(30)]
+    model = launcher.TileListModel(lambda entry: None)
+    model.set_visible(entries)
+    view = launcher.VirtualTileGrid(model)
+    view.resize(800, 600)
+    view.show()
+    qapp.processEvents()
+    yield view
+    view.close()
+
+
+def test_update_covers_shadow_and_lift(grid, monkeypatch):
+    updates = []
+    monkeypatch.setattr(grid.viewport(), "update", lambda r: updates.append(r))
+    grid._update_key("p6")
+    tile = grid.visualRect(grid.model().index(6))
+    lifted = launcher.TileDelegate.tile_rect(QtCore.QRectF(tile), 1.0)
+    shadow = launcher.ShadowCache.instance().margin()
+    needed = lifted.adjusted(-shadow, -shadow, shadow, shadow).toAlignedRect()
+    assert updates and updates[0].contains(needed)
+
+
+def test_shadow_pass_reaches_neighbours(grid):
+    # una zona sucia entre dos tiles incluye a los dos: sus sombras se pintan antes que los tiles
+    a = grid.visualRect(grid.model().index(0))
+    b = grid.visualRect(grid.model().index(1))
+    gap = QtCore.QRect(a.right() + 1, a.top(), b.left() - a.right() - 1, a.height())
+    rows = {idx.row() for idx in grid._indexes_near(gap)}
+    assert {0, 1} <= rows